@@ -0,0 +1,339 @@
+"""
+Benchmarks for the SDK's own per-step overhead, with the network replaced by an
+in-process transport that returns canned GAME API responses.
+
+    python benchmarks/bench_sdk.py --output bench_results.json
+    python benchmarks/bench_sdk.py --compare bench_results.json   # flag regressions
+
+Each case reports p50/p99/mean latency, operations per second and the peak memory
+allocated per operation (tracemalloc), and the results are saved as JSON so runs of
+different releases can be compared.
+"""
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from importlib import metadata
+from typing import Any, Callable, Dict, List, Optional
+
+from game_sdk.game import tracing
+from game_sdk.game.agent import Agent, WorkerConfig
+from game_sdk.game.chat_agent import ChatAgent
+from game_sdk.game.custom_types import ActionResponse, Argument, Function, FunctionResultStatus
+from game_sdk.game.output import set_output
+from game_sdk.game.serialization import dumps
+from game_sdk.game.transport import set_default_transport
+from game_sdk.game.worker import Worker
+
+
+API_KEY = "apt-benchmark"
+
+
+def _agent_state() -> Dict[str, Any]:
+    """A realistic agent_state block (HLP, current task with LLP, recent reasoning)"""
+    return {
+        "hlp": {
+            "plan_id": "plan-1",
+            "observation_reflection": "The timeline has several new mentions that need replies. " * 4,
+            "plan": [f"Step {i}: engage with mention {i}" for i in range(8)],
+            "plan_reasoning": "Replying to mentions keeps engagement high. " * 6,
+            "current_state_of_execution": "Replied to 3 of 8 mentions",
+            "change_indicator": None,
+            "log": [{"step": i, "result": "done"} for i in range(5)],
+        },
+        "current_task": {
+            "task_id": "task-1",
+            "task": "Reply to the latest mention",
+            "task_reasoning": "It is the most recent unanswered mention. " * 3,
+            "task_result": None,
+            "location_id": "worker_0",
+            "llp": {
+                "plan_id": "llp-1",
+                "plan_reasoning": "Search the mention, then reply. " * 3,
+                "situation_analysis": "One unanswered mention remains. " * 3,
+                "plan": ["search_mentions", "reply_tweet"],
+                "change_indicator": None,
+                "reflection": "Previous reply succeeded",
+            },
+        },
+        "recent_reasoning": [
+            {
+                "id": f"reasoning-{i}",
+                "plan_reflection": "Progressing as planned",
+                "plan_reasoning": "Continue replying",
+                "next_task_reasoning": "Next mention",
+                "task": "Reply to mention",
+                "worker_id": "worker_0",
+                "actions": [
+                    {
+                        "id": f"action-{i}-{j}",
+                        "task_reflection": "Reply posted",
+                        "task_reasoning": "Mention needs a reply",
+                        "next_step_reasoning": "Move to next mention",
+                        "fn_name": "fn_0",
+                    }
+                    for j in range(3)
+                ],
+            }
+            for i in range(3)
+        ],
+    }
+
+
+def _call_function_action(fn_name: str, n_args: int = 3) -> Dict[str, Any]:
+    return {
+        "action_type": "call_function",
+        "action_args": {
+            "fn_id": "fn-call-1",
+            "fn_name": fn_name,
+            "args": {f"arg_{i}": {"value": f"value {i}"} for i in range(n_args)},
+        },
+        "agent_state": _agent_state(),
+    }
+
+
+class _Response:
+    def __init__(self, body: bytes):
+        self.status_code = 200
+        self.content = body
+        self.text = body.decode("utf-8")
+        self.headers: Dict[str, str] = {}
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class StubTransport:
+    """
+    In-process stand-in for HTTPTransport. Request bodies are still serialized (that is
+    SDK overhead) and responses are still parsed from bytes, but no socket is involved.
+    """
+    def __init__(self):
+        action = json.dumps({"data": _call_function_action("fn_0")}).encode("utf-8")
+        self._responses = {
+            "agents": json.dumps({"data": {"id": "agent-1"}}).encode("utf-8"),
+            "maps": json.dumps({"data": {"id": "map-1"}}).encode("utf-8"),
+            "tasks": json.dumps({"data": {"submission_id": "submission-1"}}).encode("utf-8"),
+            "actions": action,
+            "next": action,
+            "conversation": json.dumps({"data": {"conversation_id": "chat-1"}}).encode("utf-8"),
+            "chat_next": json.dumps({"data": {
+                "message": None,
+                "is_finished": False,
+                "function_call": {"id": "call-1", "fn_name": "fn_0", "args": {f"arg_{i}": f"value {i}" for i in range(3)}},
+            }}).encode("utf-8"),
+            "result": json.dumps({"data": {"message": "Done, anything else?"}}).encode("utf-8"),
+        }
+
+    def post(self, url: str, headers: Optional[Dict[str, str]] = None, json: Any = None) -> _Response:
+        if json is not None:
+            dumps(json)
+        route = url.rstrip("/").rsplit("/", 1)[-1]
+        if route == "next" and "/conversation/" in url:
+            route = "chat_next"
+        return _Response(self._responses[route])
+
+    async def apost(self, url: str, headers: Optional[Dict[str, str]] = None, json: Any = None) -> _Response:
+        return self.post(url, headers=headers, json=json)
+
+
+def _make_functions(n: int) -> List[Function]:
+    def executable(**kwargs):
+        return FunctionResultStatus.DONE, "ok", {"echo": kwargs}
+
+    return [
+        Function(
+            fn_name=f"fn_{i}",
+            fn_description=f"Benchmark function number {i} that does something useful with its arguments",
+            args=[
+                Argument(name=f"arg_{j}", description=f"Argument {j} of function {i}", type="string")
+                for j in range(3)
+            ],
+            hint="Use it when benchmarking",
+            executable=executable,
+        )
+        for i in range(n)
+    ]
+
+
+def _state_fn(function_result, current_state):
+    return {"mentions": [{"id": i, "text": f"mention {i}"} for i in range(10)]}
+
+
+def _make_agent(n_functions: int) -> Agent:
+    agent = Agent(
+        api_key=API_KEY,
+        name="Benchmark Agent",
+        agent_goal="Benchmark the SDK",
+        agent_description="An agent used for benchmarks",
+        get_agent_state_fn=_state_fn,
+        workers=[WorkerConfig(
+            id="worker_0",
+            worker_description="Benchmark worker",
+            get_state_fn=_state_fn,
+            action_space=_make_functions(n_functions),
+        )],
+    )
+    agent.compile()
+    return agent
+
+
+def _make_worker(n_functions: int) -> Worker:
+    worker = Worker(
+        api_key=API_KEY,
+        description="Benchmark worker",
+        get_state_fn=_state_fn,
+        action_space=_make_functions(n_functions),
+    )
+    worker.set_task("Benchmark task")
+    return worker
+
+
+def measure(fn: Callable[[], Any], iterations: int, warmup: int) -> Dict[str, float]:
+    """Times `fn` per call and measures the peak memory allocated per call"""
+    for _ in range(warmup):
+        fn()
+
+    gc.collect()
+    gc.disable()
+    try:
+        timings = []
+        for _ in range(iterations):
+            start = time.perf_counter_ns()
+            fn()
+            timings.append(time.perf_counter_ns() - start)
+    finally:
+        gc.enable()
+
+    alloc_iterations = max(1, min(iterations, 200))
+    tracemalloc.start()
+    try:
+        peaks = []
+        for _ in range(alloc_iterations):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+    finally:
+        tracemalloc.stop()
+
+    timings.sort()
+    total_s = sum(timings) / 1e9
+    return {
+        "iterations": iterations,
+        "p50_us": timings[len(timings) // 2] / 1e3,
+        "p99_us": timings[min(len(timings) - 1, int(len(timings) * 0.99))] / 1e3,
+        "mean_us": statistics.fmean(timings) / 1e3,
+        "ops_per_sec": iterations / total_s if total_s else float("inf"),
+        "peak_alloc_kib_per_op": statistics.fmean(peaks) / 1024,
+    }
+
+
+def build_cases() -> Dict[str, Callable[[], Any]]:
+    cases: Dict[str, Callable[[], Any]] = {}
+
+    for n in (1, 10, 100):
+        agent = _make_agent(n)
+        cases[f"agent_step[{n}_functions]"] = agent.step
+
+        worker = _make_worker(n)
+        cases[f"worker_step[{n}_functions]"] = worker.step
+
+    loop = asyncio.new_event_loop()
+    async_agent = _make_agent(10)
+    cases["agent_astep[10_functions]"] = lambda: loop.run_until_complete(async_agent.astep())
+
+    action_payload = _call_function_action("fn_0")
+    cases["action_response_validate"] = lambda: ActionResponse.model_validate(action_payload)
+
+    function = _make_functions(1)[0]
+    execute_kwargs = {
+        "fn_id": "fn-call-1",
+        "args": {f"arg_{i}": {"value": f"value {i}"} for i in range(3)},
+    }
+    cases["function_execute"] = lambda: function.execute(**execute_kwargs)
+
+    chat = ChatAgent(api_key=API_KEY, prompt="Benchmark chat").create_chat(
+        partner_id="bench",
+        partner_name="Bench",
+        action_space=_make_functions(10),
+        get_state_fn=lambda: {"mood": "focused"},
+    )
+    cases["chat_next_function_call"] = lambda: chat.next("Please run fn_0")
+
+    return cases
+
+
+def compare(results: Dict[str, Any], baseline_path: str, threshold: float) -> bool:
+    """Prints p50 changes against a saved run; returns False if any case regressed"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+
+    ok = True
+    print(f"\nComparison with {baseline_path} (regression threshold {threshold:.0%}):")
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        change = result["p50_us"] / baseline[name]["p50_us"] - 1
+        flag = "REGRESSION" if change > threshold else ""
+        ok = ok and not flag
+        print(f"  {name:<32} {change:+7.1%} {flag}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark GAME SDK per-step overhead")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--filter", help="only run cases containing this substring")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare", help="previous results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative p50 slowdown reported as a regression")
+    args = parser.parse_args()
+
+    set_output("none")
+    tracing.disable()
+    set_default_transport(StubTransport())
+
+    results = {}
+    for name, fn in build_cases().items():
+        if args.filter and args.filter not in name:
+            continue
+        results[name] = measure(fn, args.iterations, args.warmup)
+        r = results[name]
+        print(
+            f"{name:<32} p50 {r['p50_us']:9.1f}us  p99 {r['p99_us']:9.1f}us  "
+            f"{r['ops_per_sec']:10.0f} ops/s  {r['peak_alloc_kib_per_op']:8.1f} KiB/op"
+        )
+
+    try:
+        sdk_version = metadata.version("game_sdk")
+    except metadata.PackageNotFoundError:
+        sdk_version = "unknown"
+
+    report = {
+        "sdk_version": sdk_version,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "iterations": args.iterations,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSaved results to {args.output}")
+
+    if args.compare and not compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Startup-time budget for game_sdk: imports each module in a fresh interpreter with
+`python -X importtime`, compares the cumulative import time against a budget and checks
+that dependencies only needed at first use (HTTP stack, asyncio, rich) are not imported.
+
+    python benchmarks/import_budget.py                  # default modules and budget
+    python benchmarks/import_budget.py --budget-ms 150 --top 15
+
+Exits non-zero if a module is over budget or eagerly imports a deferred dependency.
+"""
+import argparse
+import re
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+
+DEFAULT_MODULES = [
+    "game_sdk.game.agent",
+    "game_sdk.game.worker",
+    "game_sdk.game.chat_agent",
+]
+
+# imported on first use (first request, first async call, rich output mode)
+DEFERRED_MODULES = ["requests", "urllib3", "httpx", "rich", "asyncio"]
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def import_profile(module: str) -> Tuple[Dict[str, Tuple[int, int]], List[str]]:
+    """
+    Imports `module` in a fresh interpreter. Returns {module: (self_us, cumulative_us)}
+    from `-X importtime`, and the deferred modules that ended up in `sys.modules`.
+    """
+    check = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", check],
+        capture_output=True, text=True, check=True,
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            profile[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    eager = [m for m in result.stdout.strip().split(",") if m]
+    return profile, eager
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check game_sdk import time against a budget")
+    parser.add_argument("--module", action="append", help="module to import (repeatable)")
+    parser.add_argument("--budget-ms", type=float, default=250.0,
+                        help="maximum cumulative import time per module")
+    parser.add_argument("--runs", type=int, default=5, help="imports per module (the fastest counts)")
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list (by self time)")
+    args = parser.parse_args()
+
+    ok = True
+    for module in args.module or DEFAULT_MODULES:
+        best_total, best_profile, eager = None, {}, []
+        for _ in range(args.runs):
+            profile, eager = import_profile(module)
+            total = profile[module][1]
+            if best_total is None or total < best_total:
+                best_total, best_profile = total, profile
+
+        total_ms = best_total / 1000
+        over = total_ms > args.budget_ms
+        ok = ok and not over and not eager
+        status = "OVER BUDGET" if over else "ok"
+        print(f"{module}: {total_ms:.1f}ms (budget {args.budget_ms:.0f}ms) {status}")
+        if eager:
+            print(f"  eagerly imports deferred dependencies: {', '.join(eager)}")
+        slowest = sorted(best_profile.items(), key=lambda item: item[1][0], reverse=True)[:args.top]
+        for name, (self_us, cumulative_us) in slowest:
+            print(f"  {self_us / 1000:7.1f}ms self {cumulative_us / 1000:8.1f}ms cumulative  {name}")
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
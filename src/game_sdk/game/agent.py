@@ -1,12 +1,22 @@
-from typing import List, Optional, Callable, Dict
+import logging
+from typing import Any, List, Optional, Callable, Dict, Tuple, Union
 import uuid
 from game_sdk.game.worker import Worker
-from game_sdk.game.custom_types import Function, FunctionResult, FunctionResultStatus, ActionResponse, ActionType
+from game_sdk.game.custom_types import Function, FunctionDefsCache, FunctionResult, FunctionResultStatus, ActionResponse, ActionType
+from game_sdk.game.serialization import RawJSON
+from game_sdk.game import tracing
 from game_sdk.game.api import GAMEClient
 from game_sdk.game.api_v2 import GAMEClientV2
-
-from rich import print, box
-from rich.panel import Panel
+from game_sdk.game.api_v2_async import AsyncGAMEClientV2
+from game_sdk.game.executor import run_in_executor
+from game_sdk.game.output import Output, resolve_output, get_output, use_output
+from game_sdk.game.checkpoint import CheckpointWriter, encode_checkpoint, read_checkpoint, write_checkpoint
+from game_sdk.game.inbox import EventInbox, InboxBatch
+from game_sdk.game.idle import IdlePolicy, WakeSignal
+from game_sdk.game.registry import AgentRegistry, registration_key, resolve_registry
+from game_sdk.game.state_budget import StateBudget, StateBudgetReport
+from game_sdk.game.incremental_state import StateWithInstructions
+from game_sdk.game.state_refresh import StateProvider, StateRefresh, arefresh_states, refresh_states
 
 class Session:
     """
@@ -46,6 +56,8 @@ class WorkerConfig:
         get_state_fn (Callable): Function to retrieve the worker's current state.
         action_space (List[Function]): List of functions the worker can execute.
         instruction (Optional[str]): Additional instructions for the worker.
+        state_budget (Optional[StateBudget]): Bounds the size of the worker state sent to
+            the GAME API on every step (the state kept locally is not trimmed).
 
     Attributes:
         id (str): Worker's unique identifier.
@@ -53,6 +65,7 @@ class WorkerConfig:
         instruction (str): Additional worker instructions.
         get_state_fn (Callable): State retrieval function with instruction context.
         action_space (Dict[str, Function]): Available functions mapped by name.
+        state_budget (Optional[StateBudget]): Size bound for the state sent to the GAME API.
     """
     def __init__(self,
                  id: str,
@@ -60,25 +73,30 @@ class WorkerConfig:
                  get_state_fn: Callable,
                  action_space: List[Function],
                  instruction: Optional[str] = None,
+                 state_budget: Optional[StateBudget] = None,
                  ):
 
         self.id = id  # id or name of the worker
         # worker description for the TASK GENERATOR (to give appropriate tasks) [NOT FOR THE WORKER ITSELF - WORKER WILL STILL USE AGENT DESCRIPTION]
         self.worker_description = worker_description
         self.instruction = instruction
+        self.state_budget = state_budget
         self.get_state_fn = get_state_fn
 
-        # setup get state function with the instructions
-        self.get_state_fn = lambda function_result, current_state: {
-            "instructions": self.instruction,  # instructions are set up in the state
-            # places the rest of the output of the get_state_fn in the state
-            **get_state_fn(function_result, current_state),
-        }
+        # setup get state function with the instructions (see StateWithInstructions)
+        self.get_state_fn = StateWithInstructions(get_state_fn, self)
 
         self.action_space: Dict[str, Function] = {
             f.get_function_def()["fn_name"]: f for f in action_space
         }
 
+        # pre-serialized function definitions sent with every step
+        self._function_defs = FunctionDefsCache()
+
+    def get_function_defs(self) -> RawJSON:
+        """Get the serialized definitions of the action space (cached until it changes)"""
+        return self._function_defs.get(self.action_space.values())
+
     def __str__(self) -> str:
         output = (
             f"- Worker ID: {self.id}\n"
@@ -103,6 +121,22 @@ class Agent:
         agent_goal (str): High-level goal or purpose of the agent.
         agent_description (str): Detailed description of the agent's capabilities.
         get_agent_state_fn (Callable): Function to retrieve agent's current state.
+        output (Optional[Union[str, Output]]): Output sink or mode ("none", "log", "rich")
+            for step reports. Defaults to the process-wide sink (see `game_sdk.game.output`).
+        registry (Optional[Union[str, AgentRegistry]]): Registry (or path to one) of agents
+            and maps already created with the same configuration, reused instead of
+            creating new ones on every start.
+        idle_policy (Optional[IdlePolicy]): Backoff used by `run`/`arun` (and Fleet) after the
+            GAME API answers WAIT. Defaults to `IdlePolicy()`; `notify()` ends an idle period.
+        inbox (Optional[EventInbox]): Inbox for platform events (see `push_event`); pending
+            events are coalesced into the `observations` of the next step.
+        state_budget (Optional[StateBudget]): Bounds the size of the agent state sent to the
+            GAME API on every step. Worker states have their own budget on `WorkerConfig`.
+        concurrent_state_refresh (bool): Whether to run the worker and agent state functions
+            concurrently after a function call instead of one after the other. Only enable
+            it if they do not depend on each other's side effects.
+        state_timeout (Optional[float]): Seconds to wait for each state function after a
+            step; on timeout the previous state is kept for that step.
 
     The Agent class serves as the primary interface for:
     - Managing worker configurations
@@ -118,6 +152,13 @@ class Agent:
                  get_agent_state_fn: Callable,
                  workers: Optional[List[WorkerConfig]] = None,
                  model_name: str = "Llama-3.3-70B-Instruct",
+                 output: Optional[Union[str, Output]] = None,
+                 registry: Optional[Union[str, AgentRegistry]] = None,
+                 idle_policy: Optional[IdlePolicy] = None,
+                 inbox: Optional[EventInbox] = None,
+                 state_budget: Optional[StateBudget] = None,
+                 concurrent_state_refresh: bool = False,
+                 state_timeout: Optional[float] = None,
                  ):
 
         if api_key.startswith("apt-"):
@@ -127,6 +168,9 @@ class Agent:
 
         self._api_key: str = api_key
 
+        # output sink for step reports (None follows the process-wide sink)
+        self._output: Optional[Output] = resolve_output(output) if output is not None else None
+
         self._model_name: str = model_name
 
         # checks
@@ -156,11 +200,56 @@ class Agent:
         # initialize observation
         self.observation = None
 
-        # create agent
-        self.agent_id = self.client.create_agent(
-            self.name, self.agent_description, self.agent_goal
+        # async client for astep/arun (created on first use)
+        self._async_client: Optional[AsyncGAMEClientV2] = None
+
+        # automatic checkpoints (see enable_auto_checkpoint)
+        self._checkpoint_path: Optional[str] = None
+        self._checkpoint_every: int = 0
+        self._steps_since_checkpoint: int = 0
+        self._checkpoint_writer: Optional[CheckpointWriter] = None
+        # set by restore() so that run() continues the restored session
+        self._resume_session: bool = False
+
+        # WAIT-aware idling in run()/arun(), interrupted by notify()
+        self.idle_policy: IdlePolicy = idle_policy or IdlePolicy()
+        self._consecutive_waits: int = 0
+        self._wake_signal = WakeSignal()
+
+        # events pushed by plugins, shown to the next step
+        self.inbox: EventInbox = inbox if inbox is not None else EventInbox()
+
+        # size bounds for the states sent with each step, and what they last trimmed
+        # (keyed by "agent_state" or worker ID)
+        self.state_budget: Optional[StateBudget] = state_budget
+        self.state_budget_reports: Dict[str, StateBudgetReport] = {}
+
+        # how state functions run after each step (see _state_providers)
+        self.concurrent_state_refresh: bool = concurrent_state_refresh
+        self.state_timeout: Optional[float] = state_timeout
+
+        # templates of the standalone workers built by get_worker: worker ID -> (config key, worker)
+        self._worker_cache: Dict[str, Tuple[Tuple, Worker]] = {}
+
+        # agents/maps created before with the same configuration (opt-in)
+        self._registry: Optional[AgentRegistry] = resolve_registry(registry)
+
+        # create agent (or reuse the registered one)
+        self.agent_id = self._register(
+            "agent",
+            (self.name, self.agent_description, self.agent_goal),
+            lambda: self.client.create_agent(
+                self.name, self.agent_description, self.agent_goal
+            ),
         )
 
+    def _register(self, kind: str, config: Tuple, create: Callable[[], str]) -> str:
+        """Creates a remote object, or reuses the one registered for the same configuration"""
+        if self._registry is None:
+            return create()
+        key = registration_key(kind, self._api_key, self.client.base_url, *config)
+        return self._registry.get_or_create(key, kind, create)
+
     def compile(self):
         """ Compile the workers for the agent - i.e. set up task generator"""
         if not self.workers:
@@ -168,7 +257,11 @@ class Agent:
 
         workers_list = list(self.workers.values())
 
-        self._map_id = self.client.create_workers(workers_list)
+        self._map_id = self._register(
+            "map",
+            tuple((w.id, w.worker_description) for w in workers_list),
+            lambda: self.client.create_workers(workers_list),
+        )
         self.current_worker_id = next(iter(self.workers.values())).id
 
         # initialize and set up worker states
@@ -191,18 +284,144 @@ class Agent:
         """ Reset the agent session"""
         self._session.reset()
 
+    def checkpoint(self, path: str):
+        """
+        Saves the agent's runtime state (session, agent and worker states, current worker,
+        observation, pending inbox events, agent and map IDs) to `path`, gzip-compressed if
+        it ends in `.gz`.
+        """
+        write_checkpoint(path, self._encode_checkpoint())
+
+    def restore(self, path: str):
+        """
+        Restores runtime state saved by `checkpoint`, so the agent resumes where it left off
+        instead of re-planning. Can be called instead of `compile`; the agent must have the
+        workers the checkpoint refers to.
+        """
+        state = read_checkpoint(path)
+
+        missing = set(state["worker_states"]) - set(self.workers)
+        if missing:
+            raise ValueError(f"Checkpoint refers to unknown workers: {sorted(missing)}")
+        current_worker_id = state["current_worker_id"]
+        if current_worker_id not in self.workers or current_worker_id not in state["worker_states"]:
+            raise ValueError(f"Checkpoint has no state for its current worker {current_worker_id!r}")
+
+        self.agent_id = state["agent_id"]
+        self._map_id = state["map_id"]
+        self.current_worker_id = current_worker_id
+        self.agent_state = state["agent_state"]
+        self.worker_states = state["worker_states"]
+        self.observation = state["observation"]
+        self.inbox.restore(state.get("inbox", []))
+
+        self._session = Session()
+        self._session.id = state["session"]["id"]
+        function_result = state["session"]["function_result"]
+        self._session.function_result = (
+            FunctionResult.model_validate(function_result) if function_result is not None else None
+        )
+        self._resume_session = True
+
+    def enable_auto_checkpoint(self, path: str, every: int = 10):
+        """
+        Checkpoints the agent to `path` every `every` steps. Snapshots are written on a
+        background thread (only the latest pending one is kept), so `step()` never waits
+        on disk I/O.
+        """
+        if every < 1:
+            raise ValueError("every must be at least 1")
+        self._checkpoint_path = path
+        self._checkpoint_every = every
+        self._steps_since_checkpoint = 0
+        if self._checkpoint_writer is None:
+            self._checkpoint_writer = CheckpointWriter()
+
+    def disable_auto_checkpoint(self):
+        """Stops automatic checkpoints (pending ones are still written)"""
+        self._checkpoint_path = None
+        self._checkpoint_every = 0
+
+    def flush_checkpoint(self, timeout: Optional[float] = None) -> bool:
+        """Waits for pending automatic checkpoints to be written; returns False on timeout"""
+        if self._checkpoint_writer is None:
+            return True
+        return self._checkpoint_writer.flush(timeout)
+
+    def _encode_checkpoint(self) -> str:
+        function_result = self._session.function_result
+        return encode_checkpoint({
+            "agent_id": self.agent_id,
+            "map_id": getattr(self, "_map_id", None),
+            "current_worker_id": self.current_worker_id,
+            "agent_state": self.agent_state,
+            "worker_states": getattr(self, "worker_states", {}),
+            "observation": self.observation,
+            "inbox": self.inbox.snapshot(),
+            "session": {
+                "id": self._session.id,
+                "function_result": function_result.model_dump(mode="json") if function_result else None,
+            },
+        })
+
+    def _after_step(self):
+        if not self._checkpoint_every:
+            return
+        self._steps_since_checkpoint += 1
+        if self._steps_since_checkpoint >= self._checkpoint_every:
+            self._steps_since_checkpoint = 0
+            # encoded here so the snapshot is consistent; the write happens in the background
+            self._checkpoint_writer.submit(self._checkpoint_path, self._encode_checkpoint())
+
     def add_worker(self, worker_config: WorkerConfig):
         """Add worker to worker dict for the agent"""
         self.workers[worker_config.id] = worker_config
+        self.invalidate_worker_cache(worker_config.id)
         return self.workers
 
     def get_worker_config(self, worker_id: str):
         """Get worker config from worker dict"""
         return self.workers[worker_id]
 
-    def get_worker(self, worker_id: str):
-        """Initialize a working interactable standalone worker"""
+    def get_worker(self, worker_id: str, cached: bool = True):
+        """
+        Initialize a working interactable standalone worker.
+
+        Every call returns a new worker (see `Worker.fork`) of a template cached per worker
+        ID, so callers never share task progress, state or inbox, while the remote agent is
+        only created once - on the first `set_task` of any of them - for as long as the
+        worker's configuration (config object, instruction, functions, state function,
+        state budget, agent description) is unchanged. Pass `cached=False` for a worker with
+        its own remote agent.
+        """
         worker_config = self.get_worker_config(worker_id)
+        if not cached:
+            return self._create_worker(worker_config)
+
+        get_state_fn = worker_config.get_state_fn
+        key = (
+            worker_config,
+            worker_config.instruction,
+            tuple(worker_config.action_space.items()),
+            get_state_fn,
+            getattr(get_state_fn, "get_state_fn", None),
+            worker_config.state_budget,
+            self.agent_description,
+        )
+        entry = self._worker_cache.get(worker_id)
+        if entry is None or entry[0] != key:
+            entry = (key, self._create_worker(worker_config))
+            self._worker_cache[worker_id] = entry
+        return entry[1].fork()
+
+    def invalidate_worker_cache(self, worker_id: Optional[str] = None):
+        """Drops the cached worker template of `get_worker` (all of them if no ID is given)"""
+        if worker_id is None:
+            self._worker_cache.clear()
+        else:
+            self._worker_cache.pop(worker_id, None)
+
+    def _create_worker(self, worker_config: WorkerConfig) -> Worker:
         return Worker(
             api_key=self._api_key,
             # THIS DESCRIPTION IS THE AGENT DESCRIPTION/CHARACTER CARD - WORKER DESCRIPTION IS ONLY USED FOR THE TASK GENERATOR
@@ -210,6 +429,10 @@ class Agent:
             instruction=worker_config.instruction,
             get_state_fn=worker_config.get_state_fn,
             action_space=worker_config.action_space,
+            output=self._output,
+            registry=self._registry,
+            state_budget=worker_config.state_budget,
+            defer_registration=True,
         )
 
     def _get_action(
@@ -217,6 +440,73 @@ class Agent:
         function_result: Optional[FunctionResult] = None
     ) -> ActionResponse:
 
+        # pending inbox events go into this step (and back to the inbox if it fails)
+        events = self.inbox.take()
+        try:
+            with tracing.span("agent.build_payload"):
+                data = self._get_action_payload(function_result, events)
+
+            # make API call
+            with tracing.span("agent.get_action"):
+                response = self.client.get_agent_action(
+                    agent_id=self.agent_id,
+                    data=data,
+                    model_name=self._model_name
+                )
+        except BaseException:
+            if events is not None:
+                self.inbox.put_back(events)
+            raise
+        
+        # print(f"123 Response: {response}")
+
+        with tracing.span("action_response.validate"):
+            return ActionResponse.model_validate(response)
+
+    async def _aget_action(
+        self,
+        function_result: Optional[FunctionResult] = None
+    ) -> ActionResponse:
+        """ Async counterpart of `_get_action`"""
+        # pending inbox events go into this step (and back to the inbox if it fails)
+        events = self.inbox.take()
+        try:
+            with tracing.span("agent.build_payload"):
+                data = self._get_action_payload(function_result, events)
+
+            with tracing.span("agent.get_action"):
+                if isinstance(self.client, GAMEClientV2):
+                    response = await self._get_async_client().get_agent_action(
+                        agent_id=self.agent_id,
+                        data=data,
+                        model_name=self._model_name
+                    )
+                else:
+                    response = await run_in_executor(
+                        self.client.get_agent_action,
+                        agent_id=self.agent_id,
+                        data=data,
+                        model_name=self._model_name
+                    )
+        except BaseException:
+            if events is not None:
+                self.inbox.put_back(events)
+            raise
+
+        with tracing.span("action_response.validate"):
+            return ActionResponse.model_validate(response)
+
+    def _get_async_client(self) -> AsyncGAMEClientV2:
+        if self._async_client is None:
+            self._async_client = AsyncGAMEClientV2.from_client(self.client)
+        return self._async_client
+
+    def _get_action_payload(
+        self,
+        function_result: Optional[FunctionResult] = None,
+        events: Optional[InboxBatch] = None,
+    ) -> Dict[str, Any]:
+
         # dummy function result if None is provided - for get_state_fn to take the same input all the time
         if function_result is None:
             function_result = FunctionResult(
@@ -226,17 +516,18 @@ class Agent:
                 info={},
             )
 
+        worker = self.workers[self.current_worker_id]
+
         # set up payload
         data = {
             "location": self.current_worker_id,
             "map_id": self._map_id,
-            "environment": self.worker_states[self.current_worker_id],
-            "functions": [
-                f.get_function_def()
-                for f in self.workers[self.current_worker_id].action_space.values()
-            ],
+            "environment": self._apply_state_budget(
+                worker.state_budget, self.worker_states[self.current_worker_id], worker.id
+            ),
+            "functions": worker.get_function_defs(),
             "events": {},
-            "agent_state": self.agent_state,
+            "agent_state": self._apply_state_budget(self.state_budget, self.agent_state, "agent_state"),
             "current_action": (
                 function_result.model_dump(
                     exclude={'info'}) if function_result else None
@@ -244,33 +535,74 @@ class Agent:
             #"observations": self.observation,
             "version": "v2",
         }
-
-        # make API call
-        response = self.client.get_agent_action(
+        if events is not None:
+            data["observations"] = events.observation
+
+        return data
+
+    def _apply_state_budget(self, budget: Optional[StateBudget], state: Any, name: str) -> Any:
+        """Returns the state to send for `name` ("agent_state" or a worker ID) within its budget"""
+        if budget is None:
+            return state
+        state, report = budget.apply(state)
+        if report is None:
+            self.state_budget_reports.pop(name, None)
+            return state
+        self.state_budget_reports[name] = report
+        self._get_output().message(
+            "state.trimmed",
+            lambda: f"✂️ Trimmed {name} from {report.original_chars} to {report.final_chars} chars: {report.trimmed}",
+            level=logging.WARNING if report.over_budget else logging.DEBUG,
             agent_id=self.agent_id,
-            data=data,
-            model_name=self._model_name
+            state=name,
+            original_chars=report.original_chars,
+            final_chars=report.final_chars,
+            trimmed=report.trimmed,
+            over_budget=report.over_budget,
         )
-        
-        # print(f"123 Response: {response}")
+        return state
 
-        return ActionResponse.model_validate(response)
+    def _get_output(self) -> Output:
+        return self._output or get_output()
 
-    def step(self):
-        # get next task/action from GAME API
-        action_response = self._get_action(self._session.function_result)
+    def _start_action(self, action_response: ActionResponse) -> Tuple[Optional[Function], str, str]:
+        """
+        Handles the GAME action up to (not including) function execution.
+
+        Returns:
+            Tuple of the function to execute (None if the action does not call one),
+            the step output so far (empty unless the output sink renders text) and which
+            state the observation is taken from.
+        """
         action_type = action_response.action_type
-        print(Panel(f"{action_response}", title="👟 Agent Step", box=box.ROUNDED, title_align="left"))
+        output = self._get_output()
+        renders = output.renders
+        output.panel(
+            "agent.step",
+            title="👟 Agent Step",
+            render=lambda: f"{action_response}",
+            agent_id=self.agent_id,
+            action_type=action_type.value,
+        )
 
         # if new task is updated/generated
         if (
             action_response.agent_state.hlp
             and action_response.agent_state.hlp.change_indicator
         ):
-            print(Panel(f"{action_response.agent_state.current_task}", title="New Task Generated", box=box.ROUNDED, title_align="left"))
+            current_task = action_response.agent_state.current_task
+            output.panel(
+                "agent.new_task",
+                title="New Task Generated",
+                render=lambda: f"{current_task}",
+                agent_id=self.agent_id,
+                task_id=current_task.task_id if current_task else None,
+                task=current_task.task if current_task else None,
+            )
 
         # execute action
         out = ""
+        function = None
         if action_type in [
             ActionType.CALL_FUNCTION,
             ActionType.CONTINUE_FUNCTION,
@@ -284,24 +616,18 @@ class Agent:
             worker = self.workers[self.current_worker_id]
             function_name = action_response.action_args["fn_name"]
             function = worker.action_space[function_name]
-            out += (f"👷 Worker: {worker.id}\n")
-            out += (f"🔧 Function Name: {function_name}\n")
-            out += (f"📋 Function Description: {function.fn_description}\n")
-            out += (f"🔠 Function Arguments: {action_response.action_args.get('args', {})}\n")
-
-            self._session.function_result = function.execute(**action_response.action_args)
-            out += (f"🏭 Function Results:\n{self._session.function_result}\n")
-
-            # update worker states
-            updated_worker_state = self.workers[self.current_worker_id].get_state_fn(
-                self._session.function_result, self.worker_states[self.current_worker_id])
-            self.worker_states[self.current_worker_id] = updated_worker_state
+            if renders:
+                out += (f"👷 Worker: {worker.id}\n")
+                out += (f"🔧 Function Name: {function_name}\n")
+                out += (f"📋 Function Description: {function.fn_description}\n")
+                out += (f"🔠 Function Arguments: {action_response.action_args.get('args', {})}\n")
 
             update_observation = "worker"
 
         elif action_response.action_type == ActionType.WAIT:
-            out += ("🔄 Waiting...")
-            out += ("Task ended completed or ended (not possible with current actions)")
+            if renders:
+                out += ("🔄 Waiting...")
+                out += ("Task ended completed or ended (not possible with current actions)")
             update_observation = "task"
 
         elif action_response.action_type == ActionType.GO_TO:
@@ -309,22 +635,32 @@ class Agent:
                 raise ValueError("No location information provided by GAME")
 
             next_worker = action_response.action_args["location_id"]
-            out += (f"🚶 Going to... {next_worker}")
+            if renders:
+                out += (f"🚶 Going to... {next_worker}")
             # print_output += (f"Next worker selected: {next_worker}")
             self.current_worker_id = next_worker
             
             update_observation = "worker"
         else:
-            out += (f"🚫 Unknown action type: {action_response.action_type}")
             raise ValueError(
                 f"Unknown action type: {action_response.action_type}")
-        
-        print(Panel(f"{out}", title=f"Action Type: {action_type.value}", box=box.ROUNDED, title_align="left"))
-        
 
-        # update agent state
-        self.agent_state = self.get_agent_state_fn(self._session.function_result, self.agent_state)
-        
+        return function, out, update_observation
+
+    def _report_action(self, action_response: ActionResponse, out: str):
+        function_result = self._session.function_result
+        self._get_output().panel(
+            "agent.action",
+            title=f"Action Type: {action_response.action_type.value}",
+            render=lambda: out,
+            agent_id=self.agent_id,
+            worker_id=self.current_worker_id,
+            action_type=action_response.action_type.value,
+            fn_name=(action_response.action_args or {}).get("fn_name"),
+            action_status=function_result.action_status.value if function_result else None,
+        )
+
+    def _update_observation(self, update_observation: str):
         # update observation (saved state) - no interruptions (is_global should always be False)
         if update_observation == "task":
             if "observations" in self.agent_state:
@@ -348,9 +684,198 @@ class Agent:
         else:
             self.observation = None
 
+    def step(self):
+        # notifications received so far are handled by this step
+        self._wake_signal.clear()
+        with tracing.span("agent.step", agent_name=self.name, agent_id=self.agent_id) as span:
+            # get next task/action from GAME API
+            action_response = self._get_action(self._session.function_result)
+            span.set_attribute("action_type", action_response.action_type.value)
+            function, out, update_observation = self._start_action(action_response)
+
+            if function is not None:
+                with tracing.span("function.execute", fn_name=function.fn_name), use_output(self._output):
+                    self._session.function_result = function.execute(**action_response.action_args)
+                if self._get_output().renders:
+                    out += (f"🏭 Function Results:\n{self._session.function_result}\n")
+
+            providers = self._state_providers(function is not None)
+            if providers is not None:
+                # worker and agent states refreshed with timeouts and/or concurrently
+                self._apply_state_refresh(
+                    refresh_states(providers, self._session.function_result, self._current_states())
+                )
+                self._report_action(action_response, out)
+            else:
+                if function is not None:
+                    # update worker states
+                    self.worker_states[self.current_worker_id] = self._refresh_worker_state(
+                        self._session.function_result, self._current_states())
+
+                self._report_action(action_response, out)
+
+                # update agent state
+                self.agent_state = self._refresh_agent_state(self._session.function_result, self._current_states())
+
+            self._update_observation(update_observation)
+
+        self._after_step()
         return action_response, self._session.function_result
 
+    async def astep(self):
+        """
+        Async counterpart of `step`. The GAME API call is awaited, while the executable and
+        state functions run on the shared bounded thread pool, so one event loop can drive
+        many agents.
+        """
+        # notifications received so far are handled by this step
+        self._wake_signal.clear()
+        with tracing.span("agent.step", agent_name=self.name, agent_id=self.agent_id) as span:
+            # get next task/action from GAME API
+            action_response = await self._aget_action(self._session.function_result)
+            span.set_attribute("action_type", action_response.action_type.value)
+            function, out, update_observation = self._start_action(action_response)
+
+            if function is not None:
+                with tracing.span("function.execute", fn_name=function.fn_name), use_output(self._output):
+                    self._session.function_result = await function.aexecute(**action_response.action_args)
+                if self._get_output().renders:
+                    out += (f"🏭 Function Results:\n{self._session.function_result}\n")
+
+            providers = self._state_providers(function is not None)
+            if providers is not None:
+                # worker and agent states refreshed with timeouts and/or concurrently
+                self._apply_state_refresh(
+                    await arefresh_states(providers, self._session.function_result, self._current_states())
+                )
+                self._report_action(action_response, out)
+            else:
+                if function is not None:
+                    # update worker states
+                    self.worker_states[self.current_worker_id] = await run_in_executor(
+                        self._refresh_worker_state, self._session.function_result, self._current_states()
+                    )
+
+                self._report_action(action_response, out)
+
+                # update agent state
+                self.agent_state = await run_in_executor(
+                    self._refresh_agent_state, self._session.function_result, self._current_states()
+                )
+
+            self._update_observation(update_observation)
+
+        self._after_step()
+        return action_response, self._session.function_result
+
+    def _current_states(self) -> Dict[str, Any]:
+        return {
+            "worker_state": self.worker_states[self.current_worker_id],
+            "agent_state": self.agent_state,
+        }
+
+    def _refresh_worker_state(self, function_result: FunctionResult, states: Dict[str, Any]) -> Any:
+        with tracing.span("worker.get_state_fn", worker_id=self.current_worker_id):
+            return self.workers[self.current_worker_id].get_state_fn(function_result, states["worker_state"])
+
+    def _refresh_agent_state(self, function_result: FunctionResult, states: Dict[str, Any]) -> Any:
+        with tracing.span("agent.get_agent_state_fn"):
+            return self.get_agent_state_fn(function_result, states["agent_state"])
+
+    def _state_providers(self, function_called: bool) -> Optional[Dict[str, StateProvider]]:
+        """
+        State functions to run after a step as providers for `refresh_states`, or None to
+        run them inline one after the other (the default)
+        """
+        if not self.concurrent_state_refresh and self.state_timeout is None:
+            return None
+        providers = {
+            "agent_state": StateProvider(self._refresh_agent_state, timeout=self.state_timeout),
+        }
+        if function_called:
+            providers["worker_state"] = StateProvider(self._refresh_worker_state, timeout=self.state_timeout)
+            if not self.concurrent_state_refresh:
+                # same order as the inline refresh: worker state first
+                providers["agent_state"].depends_on = ("worker_state",)
+        return providers
+
+    def _apply_state_refresh(self, refresh: StateRefresh):
+        self.worker_states[self.current_worker_id] = refresh.state["worker_state"]
+        self.agent_state = refresh.state["agent_state"]
+        for name in refresh.timed_out:
+            self._get_output().message(
+                "state.timeout",
+                lambda name=name: f"⏱️ {name} not refreshed within {self.state_timeout}s, keeping the previous state",
+                level=logging.WARNING,
+                agent_id=self.agent_id,
+                state=name,
+                timeout=self.state_timeout,
+            )
+
+    def notify(self, event: Any = None):
+        """
+        Wakes the agent if it is idling after WAIT, so its next step runs immediately, and
+        resets the idle backoff. Safe to call from any thread, e.g. from a plugin's message
+        handler. `event` is only reported (see `push_event` to pass data to the agent).
+        """
+        self._consecutive_waits = 0
+        self._get_output().message(
+            "agent.notify",
+            lambda: f"🔔 Agent notified: {event}",
+            level=logging.DEBUG,
+            agent_id=self.agent_id,
+            reason=event,
+        )
+        self._wake_signal.notify()
+
+    def push_event(self, content: Any, source: Optional[str] = None, key: Optional[str] = None, priority: int = 0) -> bool:
+        """
+        Adds a platform event to the agent's inbox and wakes the agent (see `notify`).
+        Pending events are coalesced into the `observations` of the next step. Safe to call
+        from any thread.
+
+        Returns:
+            False if the event was merged into a pending one with the same key.
+        """
+        added = self.inbox.push(content, source=source, key=key, priority=priority)
+        self.notify(source)
+        return added
+
+    def _idle_delay(self, action_response: ActionResponse) -> float:
+        """Updates the WAIT streak and returns how long to idle before the next step"""
+        if action_response.action_type == ActionType.WAIT:
+            self._consecutive_waits += 1
+        else:
+            self._consecutive_waits = 0
+        return self.idle_policy.delay(self._consecutive_waits)
+
+    def _idle(self, delay: float):
+        if delay <= 0:
+            return
+        with tracing.span("agent.idle", agent_id=self.agent_id, delay=delay) as span:
+            woken = self._wake_signal.wait(delay)
+            span.set_attribute("woken", woken)
+
+    async def _aidle(self, delay: float):
+        if delay <= 0:
+            return
+        with tracing.span("agent.idle", agent_id=self.agent_id, delay=delay) as span:
+            woken = await self._wake_signal.await_(delay)
+            span.set_attribute("woken", woken)
+
     def run(self):
-        self._session = Session()
+        if not self._resume_session:
+            self._session = Session()
+        self._resume_session = False
+        while True:
+            action_response, _ = self.step()
+            self._idle(self._idle_delay(action_response))
+
+    async def arun(self):
+        """ Async counterpart of `run`"""
+        if not self._resume_session:
+            self._session = Session()
+        self._resume_session = False
         while True:
-            self.step()
+            action_response, _ = await self.astep()
+            await self._aidle(self._idle_delay(action_response))
@@ -1,20 +1,40 @@
-import requests
 from typing import List, Dict, Optional
+from game_sdk.game.rate_limit import RateLimiter, get_rate_limiter
+from game_sdk.game.resilience import Resilience, get_resilience
+from game_sdk.game.transport import HTTPTransport, get_default_transport
+from game_sdk.game.token_cache import access_token_cache
 
 
 class GAMEClient:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, transport: Optional[HTTPTransport] = None,
+                 resilience: Optional[Resilience] = None, rate_limiter: Optional[RateLimiter] = None):
         self.api_key = api_key
         self.base_url = "https://game.virtuals.io"
+        # pooled keep-alive transport, shared process-wide unless one is given
+        self.transport = transport or get_default_transport()
+        # retries, backoff and circuit breaking, shared process-wide unless one is given
+        self.resilience = resilience or get_resilience()
+        # client-side budgets shared by all clients with the same API key
+        self.rate_limiter = rate_limiter or get_rate_limiter()
         
     def _get_access_token(self) -> str:
         """
-        Internal method to get access token
+        Internal method to get access token (cached process-wide per API key)
         """
-        response = requests.post(
-            "https://api.virtuals.io/api/accesses/tokens",
-            json={"data": {}},
-            headers={"x-api-key": self.api_key},
+        return access_token_cache.get(self.api_key, self._fetch_access_token)
+
+    def _fetch_access_token(self) -> str:
+        """
+        Internal method to request a new access token
+        """
+        response = self.resilience.call(
+            "get_access_token",
+            lambda: self.transport.post(
+                "https://api.virtuals.io/api/accesses/tokens",
+                json={"data": {}},
+                headers={"x-api-key": self.api_key},
+            ),
+            idempotent=True,
         )
 
         if response.status_code != 200:
@@ -24,13 +44,45 @@ class GAMEClient:
         return response_json["data"]["accessToken"]
 
     def _post(
-        self, endpoint: str, data: dict, extra_headers: Optional[Dict[str, str]] = None
+        self,
+        endpoint: str,
+        data: dict,
+        extra_headers: Optional[Dict[str, str]] = None,
+        name: Optional[str] = None,
     ) -> dict:
         """
-        Internal method to post data
+        Internal method to post data (`name` identifies the call for retries and circuit breaking)
         """
+        name = name or endpoint
+        payload = {
+            "data": {
+                "method": "post",
+                "headers": {
+                    "Content-Type": "application/json",
+                },
+                "route": endpoint,
+                "data": data,
+            },
+        }
+
         access_token = self._get_access_token()
+        response = self._post_with_token(name, payload, access_token, extra_headers)
+
+        # token revoked or expired early - drop it and retry once with a fresh one
+        if response.status_code == 401:
+            access_token_cache.invalidate(self.api_key, access_token)
+            access_token = self._get_access_token()
+            response = self._post_with_token(name, payload, access_token, extra_headers)
+
+        if response.status_code != 200:
+            raise ValueError(f"Failed to post data (status {response.status_code}). Response: {response.text}")
 
+        response_json = response.json()
+        return response_json["data"]
+
+    def _post_with_token(
+        self, name: str, payload: dict, access_token: str, extra_headers: Optional[Dict[str, str]] = None
+    ):
         # Default headers with Authorization
         headers = {"Authorization": f"Bearer {access_token}"}
 
@@ -38,26 +90,15 @@ class GAMEClient:
         if extra_headers:
             headers.update(extra_headers)
 
-        response = requests.post(
-            f"{self.base_url}/prompts",
-            json={
-                "data": {
-                    "method": "post",
-                    "headers": {
-                        "Content-Type": "application/json",
-                    },
-                    "route": endpoint,
-                    "data": data,
-                },
-            },
-            headers=headers,
-        )
+        def send():
+            self.rate_limiter.acquire(self.api_key, name)
+            return self.transport.post(
+                f"{self.base_url}/prompts",
+                json=payload,
+                headers=headers,
+            )
 
-        if response.status_code != 200:
-            raise ValueError(f"Failed to post data (status {response.status_code}). Response: {response.text}")
-
-        response_json = response.json()
-        return response_json["data"]
+        return self.resilience.call(name, send)
 
     def create_agent(self, name: str, description: str, goal: str) -> str:
         """
@@ -65,6 +106,7 @@ class GAMEClient:
         """
         create_agent_response = self._post(
             endpoint="/v2/agents",
+            name="create_agent",
             data={
                 "name": name,
                 "description": description,
@@ -80,6 +122,7 @@ class GAMEClient:
         """
         res = self._post(
             endpoint="/v2/maps",
+            name="create_workers",
             data={
                 "locations": [
                     {"id": w.id, "name": w.id, "description": w.worker_description}
@@ -96,6 +139,7 @@ class GAMEClient:
         """
         return self._post(
             endpoint=f"/v2/agents/{agent_id}/tasks",
+            name="set_worker_task",
             data={"task": task},
         )
 
@@ -111,6 +155,7 @@ class GAMEClient:
         """
         return self._post(
             endpoint=f"/v2/agents/{agent_id}/tasks/{submission_id}/next",
+            name="get_worker_action",
             data=data,
             extra_headers={"model_name": model_name},
         )
@@ -121,6 +166,7 @@ class GAMEClient:
         """
         return self._post(
             endpoint=f"/v2/agents/{agent_id}/actions",
+            name="get_agent_action",
             data=data,
             extra_headers={"model_name": model_name},
         )
\ No newline at end of file
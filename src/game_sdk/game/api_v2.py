@@ -1,14 +1,30 @@
-import requests
-from typing import List, Dict
+import os
+from typing import TYPE_CHECKING, Any, List, Dict, Optional
+from game_sdk.game.rate_limit import RateLimiter, get_rate_limiter
+from game_sdk.game.resilience import Resilience, get_resilience
+from game_sdk.game.transport import HTTPTransport, get_default_transport
+
+if TYPE_CHECKING:
+    import requests
+
+DEFAULT_BASE_URL = "https://sdk.game.virtuals.io/v2"
 
 class GAMEClientV2:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, transport: Optional[HTTPTransport] = None, base_url: Optional[str] = None,
+                 resilience: Optional[Resilience] = None, rate_limiter: Optional[RateLimiter] = None):
         self.api_key = api_key
-        self.base_url = "https://sdk.game.virtuals.io/v2"
+        # GAME_API_BASE_URL points clients at another server (e.g. the local mock server)
+        self.base_url = (base_url or os.environ.get("GAME_API_BASE_URL") or DEFAULT_BASE_URL).rstrip("/")
         self.headers = {
             "Content-Type": "application/json",
             "x-api-key": self.api_key
         }
+        # pooled keep-alive transport, shared process-wide unless one is given
+        self.transport = transport or get_default_transport()
+        # retries, backoff and circuit breaking, shared process-wide unless one is given
+        self.resilience = resilience or get_resilience()
+        # client-side budgets shared by all clients with the same API key
+        self.rate_limiter = rate_limiter or get_rate_limiter()
 
     def create_agent(self, name: str, description: str, goal: str) -> str:
         """
@@ -22,7 +38,8 @@ class GAMEClientV2:
             }
         }
 
-        response = requests.post(
+        response = self._post(
+            "create_agent",
             f"{self.base_url}/agents",
             headers=self.headers,
             json=payload
@@ -43,7 +60,8 @@ class GAMEClientV2:
             }
         }
 
-        response = requests.post(
+        response = self._post(
+            "create_workers",
             f"{self.base_url}/maps",
             headers=self.headers,
             json=payload
@@ -61,7 +79,8 @@ class GAMEClientV2:
             }
         }
 
-        response = requests.post(
+        response = self._post(
+            "set_worker_task",
             f"{self.base_url}/agents/{agent_id}/tasks",
             headers=self.headers,
             json=payload
@@ -73,7 +92,8 @@ class GAMEClientV2:
         """
         API call to get worker actions (for standalone worker)
         """
-        response = requests.post(
+        response = self._post(
+            "get_worker_action",
             f"{self.base_url}/agents/{agent_id}/tasks/{submission_id}/next",
             headers=self.headers | {"model_name": model_name},
             json={
@@ -92,7 +112,8 @@ class GAMEClientV2:
         """
         API call to get agent actions/next step (for agent)
         """
-        response = requests.post(
+        response = self._post(
+            "get_agent_action",
             f"{self.base_url}/agents/{agent_id}/actions",
             headers=self.headers | {"model_name": model_name},
             json={
@@ -108,7 +129,8 @@ class GAMEClientV2:
         return response_json["data"]
     
     def create_chat(self, data: dict) -> str:
-        response = requests.post(
+        response = self._post(
+            "create_chat",
             f"{self.base_url}/conversation",
             headers=self.headers,
             json={
@@ -122,7 +144,8 @@ class GAMEClientV2:
         return chat_id
     
     def update_chat(self, conversation_id: str, data: dict) -> dict:
-        response = requests.post(
+        response = self._post(
+            "update_chat",
             f"{self.base_url}/conversation/{conversation_id}/next",
             headers=self.headers,
             json={
@@ -138,7 +161,8 @@ class GAMEClientV2:
         return response_json["data"]
     
     def report_function(self, conversation_id: str, data: dict) -> dict:
-        response = requests.post(
+        response = self._post(
+            "report_function",
             f"{self.base_url}/conversation/{conversation_id}/function/result",
             headers=self.headers,
             json={
@@ -149,7 +173,8 @@ class GAMEClientV2:
         return self._get_response_body(response)
     
     def end_chat(self, conversation_id: str, data: dict) -> dict:
-        response = requests.post(
+        response = self._post(
+            "end_chat",
             f"{self.base_url}/conversation/{conversation_id}/end",
             headers=self.headers,
             json={
@@ -159,7 +184,17 @@ class GAMEClientV2:
 
         return self._get_response_body(response)
     
-    def _get_response_body(self, response: requests.Response) -> dict:
+    def _post(self, endpoint: str, url: str, headers: Dict[str, str], json: Any, idempotent: bool = False) -> "requests.Response":
+        """
+        Sends one API request through the transport, with rate limiting, retries and circuit breaking
+        """
+        def send():
+            self.rate_limiter.acquire(self.api_key, endpoint)
+            return self.transport.post(url, headers=headers, json=json)
+
+        return self.resilience.call(endpoint, send, idempotent=idempotent)
+
+    def _get_response_body(self, response: "requests.Response") -> dict:
         if response.status_code != 200:
             raise ValueError(f"Failed to get response body (status {response.status_code}). Response: {response.text}")
 
@@ -0,0 +1,220 @@
+import os
+from typing import Any, List, Dict, Optional
+from game_sdk.game.api_v2 import DEFAULT_BASE_URL, GAMEClientV2
+from game_sdk.game.rate_limit import RateLimiter, get_rate_limiter
+from game_sdk.game.resilience import Resilience, get_resilience
+from game_sdk.game.transport import HTTPTransport, get_default_transport
+
+
+class AsyncGAMEClientV2:
+    """
+    asyncio counterpart of GAMEClientV2 with the same methods, each returning a coroutine.
+
+    Requests go through `HTTPTransport.apost`, so one event loop can drive many agents
+    over a shared connection pool without a thread per agent.
+    """
+    def __init__(self, api_key: str, transport: Optional[HTTPTransport] = None, base_url: Optional[str] = None,
+                 resilience: Optional[Resilience] = None, rate_limiter: Optional[RateLimiter] = None):
+        self.api_key = api_key
+        # GAME_API_BASE_URL points clients at another server (e.g. the local mock server)
+        self.base_url = (base_url or os.environ.get("GAME_API_BASE_URL") or DEFAULT_BASE_URL).rstrip("/")
+        self.headers = {
+            "Content-Type": "application/json",
+            "x-api-key": self.api_key
+        }
+        # pooled keep-alive transport, shared process-wide unless one is given
+        self.transport = transport or get_default_transport()
+        # retries, backoff and circuit breaking, shared process-wide unless one is given
+        self.resilience = resilience or get_resilience()
+        # client-side budgets shared by all clients with the same API key
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+
+    @classmethod
+    def from_client(cls, client: GAMEClientV2) -> "AsyncGAMEClientV2":
+        """
+        Creates an async client with the same API key, base URL, transport, resilience and
+        rate limiting settings as a sync client.
+        """
+        return cls(
+            client.api_key,
+            transport=client.transport,
+            base_url=client.base_url,
+            resilience=client.resilience,
+            rate_limiter=client.rate_limiter,
+        )
+
+    async def create_agent(self, name: str, description: str, goal: str) -> str:
+        """
+        API call to create an agent instance (worker or agent with task generator)
+        """
+        payload = {
+            "data": {
+                "name": name,
+                "goal": goal,
+                "description": description
+            }
+        }
+
+        response = await self._post(
+            "create_agent",
+            f"{self.base_url}/agents",
+            headers=self.headers,
+            json=payload
+        )
+
+        return self._get_response_body(response)["id"]
+
+    async def create_workers(self, workers: List) -> str:
+        """
+        API call to create workers and worker description for the task generator (agent)
+        """
+        payload = {
+            "data": {
+                "locations": [
+                    {"id": w.id, "name": w.id, "description": w.worker_description}
+                    for w in workers
+                ]
+            }
+        }
+
+        response = await self._post(
+            "create_workers",
+            f"{self.base_url}/maps",
+            headers=self.headers,
+            json=payload
+        )
+
+        return self._get_response_body(response)["id"]
+
+    async def set_worker_task(self, agent_id: str, task: str) -> Dict:
+        """
+        API call to set worker task (for standalone worker)
+        """
+        payload = {
+            "data": {
+                "task": task
+            }
+        }
+
+        response = await self._post(
+            "set_worker_task",
+            f"{self.base_url}/agents/{agent_id}/tasks",
+            headers=self.headers,
+            json=payload
+        )
+
+        return self._get_response_body(response)
+
+    async def get_worker_action(self, agent_id: str, submission_id: str, data: dict, model_name: str) -> Dict:
+        """
+        API call to get worker actions (for standalone worker)
+        """
+        response = await self._post(
+            "get_worker_action",
+            f"{self.base_url}/agents/{agent_id}/tasks/{submission_id}/next",
+            headers=self.headers | {"model_name": model_name},
+            json={
+                "data": data
+            }
+        )
+
+        if response.status_code != 200:
+            raise ValueError(f"Failed to get worker action (status {response.status_code}). Response: {response.text}")
+
+        response_json = response.json()
+
+        return response_json["data"]
+
+    async def get_agent_action(self, agent_id: str, data: dict, model_name: str) -> Dict:
+        """
+        API call to get agent actions/next step (for agent)
+        """
+        response = await self._post(
+            "get_agent_action",
+            f"{self.base_url}/agents/{agent_id}/actions",
+            headers=self.headers | {"model_name": model_name},
+            json={
+                "data": data
+            }
+        )
+
+        if response.status_code != 200:
+            raise ValueError(f"Failed to get agent action (status {response.status_code}). Response: {response.text}")
+
+        response_json = response.json()
+
+        return response_json["data"]
+
+    async def create_chat(self, data: dict) -> str:
+        response = await self._post(
+            "create_chat",
+            f"{self.base_url}/conversation",
+            headers=self.headers,
+            json={
+                "data": data
+            }
+        )
+
+        chat_id = self._get_response_body(response).get("conversation_id")
+        if not chat_id:
+            raise Exception("Agent did not return a conversation_id for the chat.")
+        return chat_id
+
+    async def update_chat(self, conversation_id: str, data: dict) -> dict:
+        response = await self._post(
+            "update_chat",
+            f"{self.base_url}/conversation/{conversation_id}/next",
+            headers=self.headers,
+            json={
+                "data": data
+            }
+        )
+
+        if response.status_code != 200:
+            raise ValueError(f"Failed to update conversation (status {response.status_code}). Response: {response.text}")
+
+        response_json = response.json()
+
+        return response_json["data"]
+
+    async def report_function(self, conversation_id: str, data: dict) -> dict:
+        response = await self._post(
+            "report_function",
+            f"{self.base_url}/conversation/{conversation_id}/function/result",
+            headers=self.headers,
+            json={
+                "data": data
+            }
+        )
+
+        return self._get_response_body(response)
+
+    async def end_chat(self, conversation_id: str, data: dict) -> dict:
+        response = await self._post(
+            "end_chat",
+            f"{self.base_url}/conversation/{conversation_id}/end",
+            headers=self.headers,
+            json={
+                "data": data
+            }
+        )
+
+        return self._get_response_body(response)
+
+    async def _post(self, endpoint: str, url: str, headers: Dict[str, str], json: Any, idempotent: bool = False):
+        """
+        Sends one API request through the transport, with rate limiting, retries and circuit breaking
+        """
+        async def send():
+            await self.rate_limiter.aacquire(self.api_key, endpoint)
+            return await self.transport.apost(url, headers=headers, json=json)
+
+        return await self.resilience.acall(endpoint, send, idempotent=idempotent)
+
+    def _get_response_body(self, response: Any) -> dict:
+        if response.status_code != 200:
+            raise ValueError(f"Failed to get response body (status {response.status_code}). Response: {response.text}")
+
+        response_json = response.json()
+
+        return response_json["data"]
@@ -0,0 +1,197 @@
+import contextlib
+import gzip
+import json
+import os
+import threading
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+from game_sdk.game.serialization import dumps
+from game_sdk.game.token_cache import access_token_cache
+from game_sdk.game.transport import HTTPTransport, get_default_transport, set_default_transport
+
+
+class CassetteError(LookupError):
+    """Raised when a replayed request has no recorded response left"""
+
+
+def _open(path: str, mode: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _route_key(url: str, payload: Any) -> str:
+    """
+    Key used to match requests to recorded responses: the URL path, plus the inner route
+    for legacy GAMEClient requests (which all go to /prompts).
+    """
+    key = urlsplit(url).path
+    if isinstance(payload, dict):
+        data = payload.get("data")
+        if isinstance(data, dict) and isinstance(data.get("route"), str):
+            key += " " + data["route"]
+    return key
+
+
+class Cassette:
+    """
+    A recording of GAME API traffic: one JSON line per request/response pair
+    (gzip-compressed when the path ends in `.gz`).
+
+    Args:
+        path (str): Cassette file path.
+        record_requests (bool): Whether request bodies are stored too (useful to profile
+            real payload shapes; responses are always stored). Headers are never stored,
+            so API keys and access tokens stay out of the file.
+    """
+    def __init__(self, path: str, record_requests: bool = True):
+        self.path = path
+        self.record_requests = record_requests
+        self._lock = threading.Lock()
+
+    def interactions(self) -> List[Dict[str, Any]]:
+        """Reads all recorded interactions"""
+        with _open(self.path, "r") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def _start_recording(self):
+        with _open(self.path, "w"):
+            pass
+
+    def _append(self, interaction: Dict[str, Any]):
+        line = json.dumps(interaction, separators=(",", ":"))
+        with self._lock:
+            with _open(self.path, "a") as f:
+                f.write(line + "\n")
+
+
+class _RecordedResponse:
+    """Response rebuilt from a cassette, with the attributes the GAME clients use"""
+
+    def __init__(self, status_code: int, text: str, headers: Dict[str, str]):
+        self.status_code = status_code
+        self.text = text
+        self.content = text.encode("utf-8")
+        self.headers = headers
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+class RecordingTransport:
+    """
+    Transport that forwards requests to another transport and records every
+    request/response pair into a cassette.
+    """
+    def __init__(self, cassette: Cassette, transport: Optional[HTTPTransport] = None):
+        self.cassette = cassette
+        self.transport = transport or get_default_transport()
+        self.cassette._start_recording()
+
+    def post(self, url: str, headers: Optional[Dict[str, str]] = None, json: Any = None):
+        response = self.transport.post(url, headers=headers, json=json)
+        self._record(url, json, response)
+        return response
+
+    async def apost(self, url: str, headers: Optional[Dict[str, str]] = None, json: Any = None):
+        response = await self.transport.apost(url, headers=headers, json=json)
+        self._record(url, json, response)
+        return response
+
+    def _record(self, url: str, payload: Any, response: Any):
+        route = _route_key(url, payload)
+        text = response.text
+        if route.endswith("/accesses/tokens") and response.status_code == 200:
+            # keep access tokens out of the file; replayed runs never need a real one
+            body = response.json()
+            body["data"]["accessToken"] = "cassette-token"
+            text = json.dumps(body)
+        interaction = {
+            "route": route,
+            "status": response.status_code,
+            "response": text,
+        }
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            interaction["headers"] = {"Retry-After": retry_after}
+        if self.cassette.record_requests and payload is not None:
+            # RawJSON fragments (e.g. cached function definitions) are expanded here
+            interaction["request"] = dumps(payload)
+        self.cassette._append(interaction)
+
+
+class ReplayTransport:
+    """
+    Transport that answers requests from a cassette without touching the network.
+
+    Responses are matched by route (URL path) in recorded order, so a replayed run gets
+    the same agent IDs, actions and chat replies as the recorded one.
+    """
+    def __init__(self, cassette: Cassette):
+        self.cassette = cassette
+        self._lock = threading.Lock()
+        self._queues: Dict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
+        for interaction in cassette.interactions():
+            self._queues[interaction["route"]].append(interaction)
+
+    def remaining(self) -> int:
+        """Number of recorded responses not replayed yet"""
+        with self._lock:
+            return sum(len(queue) for queue in self._queues.values())
+
+    def post(self, url: str, headers: Optional[Dict[str, str]] = None, json: Any = None):
+        route = _route_key(url, json)
+        with self._lock:
+            queue = self._queues.get(route)
+            if not queue:
+                raise CassetteError(f"No recorded response left for {route} in {self.cassette.path}")
+            interaction = queue.popleft()
+        return _RecordedResponse(
+            interaction["status"], interaction["response"], interaction.get("headers", {})
+        )
+
+    async def apost(self, url: str, headers: Optional[Dict[str, str]] = None, json: Any = None):
+        return self.post(url, headers=headers, json=json)
+
+
+@contextlib.contextmanager
+def use_cassette(path: str, mode: str = "auto", record_requests: bool = True) -> Iterator[Any]:
+    """
+    Records or replays all GAME API traffic of clients created inside the block.
+
+    Args:
+        path (str): Cassette file path (use a `.gz` suffix for a compressed file).
+        mode (str): "record", "replay", or "auto" (replay if the file exists, else record).
+        record_requests (bool): Whether request bodies are stored when recording.
+
+    Example:
+        ```python
+        with use_cassette("run.jsonl.gz", mode="record"):
+            agent = Agent(...)
+            agent.compile()
+            for _ in range(20):
+                agent.step()
+        ```
+    """
+    if mode == "auto":
+        mode = "replay" if os.path.exists(path) else "record"
+    if mode not in ("record", "replay"):
+        raise ValueError(f"Unknown cassette mode: {mode}")
+
+    cassette = Cassette(path, record_requests=record_requests)
+    previous = get_default_transport()
+    if mode == "record":
+        transport = RecordingTransport(cassette, previous)
+    else:
+        transport = ReplayTransport(cassette)
+
+    set_default_transport(transport)
+    try:
+        # tokens cached outside the block would keep a recording from capturing the
+        # token request, and replayed tokens must not be used outside the block
+        with access_token_cache.isolated():
+            yield transport
+    finally:
+        set_default_transport(previous)
@@ -5,9 +5,13 @@ from game_sdk.game.custom_types import (
     FunctionResult,
     GameChatResponse,
     Function,
+    FunctionDefsCache,
     AgentMessage,
 )
 from game_sdk.game.api_v2 import GAMEClientV2
+from game_sdk.game.api_v2_async import AsyncGAMEClientV2
+from game_sdk.game.executor import run_in_executor
+from game_sdk.game import tracing
 
 
 class Chat:
@@ -24,45 +28,94 @@ class Chat:
             {f.fn_name: f for f in action_space} if action_space else None
         )
         self.get_state_fn = get_state_fn
+        # pre-serialized function definitions sent with every message
+        self._function_defs = FunctionDefsCache()
+        # async client for anext (created on first use)
+        self._async_client: Optional[AsyncGAMEClientV2] = None
 
     def next(self, message: str) -> ChatResponse:
-
-        convo_response = self._update_conversation(message)
-
-        # execute functions/actions if present
-        if convo_response.function_call:
-            if not self.action_space:
-                raise Exception("No functions provided")
-
-            fn_name = convo_response.function_call.fn_name
-
-            fn_to_call = self.action_space.get(fn_name)
-            if not fn_to_call:
-                raise Exception(
-                    f"Function {fn_name}, returned by the agent, not found in action space"
+        with tracing.span("chat.next", chat_id=self.chat_id):
+            convo_response = self._update_conversation(message)
+
+            # execute functions/actions if present
+            if convo_response.function_call:
+                if not self.action_space:
+                    raise Exception("No functions provided")
+
+                fn_name = convo_response.function_call.fn_name
+
+                fn_to_call = self.action_space.get(fn_name)
+                if not fn_to_call:
+                    raise Exception(
+                        f"Function {fn_name}, returned by the agent, not found in action space"
+                    )
+
+                with tracing.span("function.execute", fn_name=fn_name):
+                    result = fn_to_call.execute(
+                        **{
+                            "fn_id": convo_response.function_call.id,
+                            "args": convo_response.function_call.args,
+                        }
+                    )
+                response_message = self._report_function_result(result)
+                function_call_response = FunctionCallResponse(
+                    fn_name=fn_name,
+                    fn_args=convo_response.function_call.args,
+                    result=result,
                 )
-
-            result = fn_to_call.execute(
-                **{
-                    "fn_id": convo_response.function_call.id,
-                    "args": convo_response.function_call.args,
-                }
-            )
-            response_message = self._report_function_result(result)
-            function_call_response = FunctionCallResponse(
-                fn_name=fn_name,
-                fn_args=convo_response.function_call.args,
-                result=result,
+            else:
+                response_message = convo_response.message or ""
+                function_call_response = None
+
+            return ChatResponse(
+                message=response_message,
+                is_finished=convo_response.is_finished,
+                function_call=function_call_response,
             )
-        else:
-            response_message = convo_response.message or ""
-            function_call_response = None
 
-        return ChatResponse(
-            message=response_message,
-            is_finished=convo_response.is_finished,
-            function_call=function_call_response,
-        )
+    async def anext(self, message: str) -> ChatResponse:
+        """
+        Async counterpart of `next` - awaits the GAME API and runs function executables
+        on the shared bounded thread pool
+        """
+        with tracing.span("chat.next", chat_id=self.chat_id):
+            convo_response = await self._aupdate_conversation(message)
+
+            # execute functions/actions if present
+            if convo_response.function_call:
+                if not self.action_space:
+                    raise Exception("No functions provided")
+
+                fn_name = convo_response.function_call.fn_name
+
+                fn_to_call = self.action_space.get(fn_name)
+                if not fn_to_call:
+                    raise Exception(
+                        f"Function {fn_name}, returned by the agent, not found in action space"
+                    )
+
+                with tracing.span("function.execute", fn_name=fn_name):
+                    result = await fn_to_call.aexecute(
+                        **{
+                            "fn_id": convo_response.function_call.id,
+                            "args": convo_response.function_call.args,
+                        }
+                    )
+                response_message = await self._areport_function_result(result)
+                function_call_response = FunctionCallResponse(
+                    fn_name=fn_name,
+                    fn_args=convo_response.function_call.args,
+                    result=result,
+                )
+            else:
+                response_message = convo_response.message or ""
+                function_call_response = None
+
+            return ChatResponse(
+                message=response_message,
+                is_finished=convo_response.is_finished,
+                function_call=function_call_response,
+            )
 
     def end(self, message: Optional[str] = None):
         self.client.end_chat(
@@ -73,20 +126,61 @@ class Chat:
         )
 
     def _update_conversation(self, message: str) -> GameChatResponse:
-        data = {
+        with tracing.span("chat.get_state_fn"):
+            state = self.get_state_fn() if self.get_state_fn else None
+        data = self._get_conversation_payload(message, state)
+        with tracing.span("chat.update_conversation"):
+            result = self.client.update_chat(self.chat_id, data)
+        with tracing.span("chat_response.validate"):
+            return GameChatResponse.model_validate(result)
+
+    async def _aupdate_conversation(self, message: str) -> GameChatResponse:
+        with tracing.span("chat.get_state_fn"):
+            state = await run_in_executor(self.get_state_fn) if self.get_state_fn else None
+        data = self._get_conversation_payload(message, state)
+        with tracing.span("chat.update_conversation"):
+            result = await self._get_async_client().update_chat(self.chat_id, data)
+        with tracing.span("chat_response.validate"):
+            return GameChatResponse.model_validate(result)
+
+    def _get_conversation_payload(self, message: str, state: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
             "message": message,
-            "state": self.get_state_fn() if self.get_state_fn else None,
+            "state": state,
             "functions": (
-                [f.get_function_def() for f in self.action_space.values()]
+                self._function_defs.get(self.action_space.values())
                 if self.action_space
                 else None
             ),
         }
-        result = self.client.update_chat(self.chat_id, data)
-        return GameChatResponse.model_validate(result)
+
+    def _get_async_client(self) -> AsyncGAMEClientV2:
+        if self._async_client is None:
+            self._async_client = AsyncGAMEClientV2.from_client(self.client)
+        return self._async_client
 
     def _report_function_result(self, result: FunctionResult) -> str:
-        data = {
+        data = self._get_function_report_payload(result)
+        with tracing.span("chat.report_function"):
+            response = self.client.report_function(self.chat_id, data)
+
+        message = response.get("message")
+        if not message:
+            raise Exception("Agent did not return a message for the function report.")
+        return message
+
+    async def _areport_function_result(self, result: FunctionResult) -> str:
+        data = self._get_function_report_payload(result)
+        with tracing.span("chat.report_function"):
+            response = await self._get_async_client().report_function(self.chat_id, data)
+
+        message = response.get("message")
+        if not message:
+            raise Exception("Agent did not return a message for the function report.")
+        return message
+
+    def _get_function_report_payload(self, result: FunctionResult) -> Dict[str, Any]:
+        return {
             "fn_id": result.action_id,
             "result": (
                 f"{result.action_status.value}: {result.feedback_message}"
@@ -94,12 +188,6 @@ class Chat:
                 else result.action_status.value
             ),
         }
-        response = self.client.report_function(self.chat_id, data)
-
-        message = response.get("message")
-        if not message:
-            raise Exception("Agent did not return a message for the function report.")
-        return message
 
 
 class ChatAgent:
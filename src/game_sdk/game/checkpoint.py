@@ -0,0 +1,105 @@
+import gzip
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+
+CHECKPOINT_FORMAT = "game_sdk.agent_checkpoint"
+CHECKPOINT_VERSION = 1
+
+logger = logging.getLogger("game_sdk")
+
+
+def encode_checkpoint(state: Dict[str, Any]) -> str:
+    """Serializes checkpoint state to compact, versioned JSON"""
+    return json.dumps(
+        {"format": CHECKPOINT_FORMAT, "version": CHECKPOINT_VERSION, **state},
+        separators=(",", ":"),
+        allow_nan=False,
+    )
+
+
+def write_checkpoint(path: str, data: str):
+    """
+    Atomically writes encoded checkpoint data (gzip-compressed if the path ends in `.gz`),
+    so a crash mid-write never leaves a truncated checkpoint behind.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".checkpoint-", suffix=".tmp")
+    try:
+        raw = data.encode("utf-8")
+        with os.fdopen(fd, "wb") as f:
+            f.write(gzip.compress(raw, compresslevel=6) if path.endswith(".gz") else raw)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def read_checkpoint(path: str) -> Dict[str, Any]:
+    """
+    Reads a checkpoint written by `write_checkpoint`.
+
+    Raises:
+        ValueError: If the file is not an agent checkpoint or has an unsupported version.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    if raw[:2] == b"\x1f\x8b":
+        raw = gzip.decompress(raw)
+    state = json.loads(raw)
+    if not isinstance(state, dict) or state.get("format") != CHECKPOINT_FORMAT:
+        raise ValueError(f"{path} is not an agent checkpoint")
+    if state.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(
+            f"Unsupported checkpoint version {state.get('version')} (expected {CHECKPOINT_VERSION})"
+        )
+    return state
+
+
+class CheckpointWriter:
+    """
+    Writes checkpoints on a background thread so taking one never waits on disk I/O.
+
+    Only the latest submitted checkpoint is kept: if the writer falls behind, older
+    pending snapshots are dropped in favor of the newest one.
+    """
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._pending: Optional[Tuple[str, str]] = None
+        self._busy = False
+        self._thread = threading.Thread(target=self._run, name="game-checkpoint", daemon=True)
+        self._thread.start()
+
+    def submit(self, path: str, data: str):
+        """Queues encoded checkpoint data to be written to `path`"""
+        with self._condition:
+            self._pending = (path, data)
+            self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Waits until every submitted checkpoint is written; returns False on timeout"""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._pending is None and not self._busy, timeout=timeout
+            )
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None)
+                path, data = self._pending
+                self._pending = None
+                self._busy = True
+            try:
+                write_checkpoint(path, data)
+            except Exception:
+                logger.exception("Failed to write agent checkpoint to %s", path)
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
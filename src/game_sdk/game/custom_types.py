@@ -1,9 +1,16 @@
+import inspect
 import json
-from typing import Any, Dict, Optional, List, Union, Sequence, Callable, Tuple
-from pydantic import BaseModel, Field
+import logging
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Awaitable, Dict, Iterable, Literal, Optional, List, Union, Sequence, Callable, Tuple
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 from enum import Enum
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from game_sdk.game.executor import abandon_function, run_coroutine, run_in_executor, submit_function
+from game_sdk.game.serialization import RawJSON
+from game_sdk.game.output import get_output
+from game_sdk.game.function_cache import FunctionCache
 
 
 class Argument(BaseModel):
@@ -16,6 +23,8 @@ class Argument(BaseModel):
         type (Optional[Union[List[str], str]]): The expected type(s) of the argument.
         optional (Optional[bool]): Whether this argument is optional, defaults to False.
     """
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     description: str
     type: Optional[Union[List[str], str]] = None
@@ -42,6 +51,8 @@ class FunctionResult(BaseModel):
         feedback_message (Optional[str]): Human-readable message about the execution result.
         info (Optional[Dict[str, Any]]): Additional information or data from the execution.
     """
+    model_config = ConfigDict(defer_build=True)
+
     action_id: str
     action_status: FunctionResultStatus
     feedback_message: Optional[str] = None
@@ -57,6 +68,10 @@ class FunctionResult(BaseModel):
         )
         return output
 
+class _ExecutableTimeout(Exception):
+    """Raised when an executable exceeds the Function's timeout"""
+
+
 class Function(BaseModel):
     """
     Defines a callable function within the GAME SDK.
@@ -69,18 +84,62 @@ class Function(BaseModel):
         fn_description (str): Detailed description of what the function does.
         args (List[Argument]): List of arguments the function accepts.
         hint (Optional[str]): Optional usage hint or example.
-        executable (Callable): The actual function implementation to be called.
+        executable (Callable): The actual function implementation to be called. May be an
+            `async def` function: it is awaited directly by async agent loops and run on a
+            persistent background event loop by blocking ones (`Agent.step`), so it can
+            reuse async clients without `asyncio.run` per call.
+        timeout (Optional[float]): Seconds to wait for the executable; a call that takes
+            longer comes back as a FAILED FunctionResult.
+        execution_backend (Optional[str]): Where the executable runs: "inline" (on the
+            stepping thread), "thread" (a dedicated thread pool, see
+            `executor.configure_function_executors`) or "process" (a process pool, or a
+            process of its own for calls with a timeout, for CPU-heavy executables; they
+            must be picklable). Defaults to "thread" when a
+            timeout is set and "inline" otherwise. Does not apply to coroutine executables,
+            which always run on an event loop (and are cancelled on timeout).
+        cache (Optional[FunctionCache]): Opt-in result cache for executables that only
+            read data; see `game_sdk.game.function_cache`.
+
+    `timeout`, `execution_backend` and `cache` are local settings and not part of the definition
+    sent to GAME.
+
+    The serialized definition sent to GAME is cached and invalidated whenever a field is
+    reassigned. Replace `args` (rather than mutating an Argument in place) or call
+    `invalidate_function_def()` after in-place changes.
     """
+    model_config = ConfigDict(defer_build=True, arbitrary_types_allowed=True)
+
     fn_name: str
     fn_description: str
     args: List[Argument]
     hint: Optional[str] = None
     
     # Make executable required but with a default value
-    executable: Callable[..., Tuple[FunctionResultStatus, str, dict]] = Field(
+    executable: Callable[..., Union[Tuple[FunctionResultStatus, str, dict], Awaitable[Tuple[FunctionResultStatus, str, dict]]]] = Field(
         default_factory=lambda: Function._default_executable
     )
 
+    timeout: Optional[float] = None
+    execution_backend: Optional[Literal["inline", "thread", "process"]] = None
+    cache: Optional[FunctionCache] = None
+
+    # cached JSON of get_function_def()
+    _function_def_json: Optional[str] = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def _check_timeout(self) -> "Function":
+        if self._is_coroutine_executable():
+            if self.execution_backend not in (None, "inline"):
+                raise ValueError("Coroutine executables run on an event loop; execution_backend does not apply")
+        elif self.timeout is not None and self.execution_backend == "inline":
+            raise ValueError("A timeout needs the 'thread' or 'process' execution backend")
+        return self
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._function_def_json = None
+
     def get_function_def(self):
         """
         Returns the function definition without the executable component.
@@ -88,7 +147,24 @@ class Function(BaseModel):
         Returns:
             dict: Function metadata excluding the executable field.
         """
-        return self.model_dump(exclude={'executable'})
+        return self.model_dump(exclude={'executable', 'timeout', 'execution_backend', 'cache'})
+
+    def get_function_def_json(self) -> str:
+        """
+        Returns the function definition serialized to JSON, cached until the function changes.
+
+        Returns:
+            str: JSON of `get_function_def()`.
+        """
+        if self._function_def_json is None:
+            self._function_def_json = json.dumps(self.get_function_def())
+        return self._function_def_json
+
+    def invalidate_function_def(self):
+        """
+        Drops the cached serialized definition (needed after mutating `args` in place).
+        """
+        self._function_def_json = None
 
     @staticmethod
     def _default_executable(**kwargs) -> Tuple[FunctionResultStatus, str, dict]:
@@ -114,23 +190,19 @@ class Function(BaseModel):
 
         Raises:
             Any exceptions from the executable are caught and returned as a FAILED FunctionResult.
+            So are calls that exceed `timeout`.
         """
-        fn_id = kwds.get('fn_id')
-        args = kwds.get('args', {})
-        print(f"Function Args: {args}")
-        print(f"Function ID: {fn_id}")
+        fn_id, processed_args = self._start_execute(kwds)
         try:
-            # Extract values from the nested dictionary structure
-            processed_args = {}
-            for arg_name, arg_value in args.items():
-                if isinstance(arg_value, dict) and 'value' in arg_value:
-                    processed_args[arg_name] = arg_value['value']
-                else:
-                    processed_args[arg_name] = arg_value
-                    
-            # print("Processed args: ", processed_args)
-            # execute the function provided
-            status, feedback, info = self.executable(**processed_args)
+            # execute the function provided (or reuse a cached result)
+            if self.cache is not None:
+                status, feedback, info = self.cache.call(
+                    self.cache.key(self.fn_name, processed_args),
+                    lambda: self._call(processed_args),
+                    lambda job: submit_function("thread", job, {}),
+                )
+            else:
+                status, feedback, info = self._call(processed_args)
 
             return FunctionResult(
                 action_id=fn_id,
@@ -138,14 +210,128 @@ class Function(BaseModel):
                 feedback_message=feedback,
                 info=info,
             )
+        except _ExecutableTimeout:
+            return self._failed(fn_id, f"timed out after {self.timeout}s")
         except Exception as e:
+            return self._failed(fn_id, str(e))
+
+    async def aexecute(self, **kwds: Any) -> FunctionResult:
+        """
+        Async counterpart of `execute` for async agent loops. Coroutine executables are
+        awaited directly. Inline executables run on the shared bounded thread pool so they
+        never block the event loop; the others are awaited on the pool of their execution
+        backend.
+
+        Args:
+            **kwds: Same keyword arguments as `execute`.
+
+        Returns:
+            FunctionResult: Result of the function execution including status and feedback.
+        """
+        if self._get_execution_backend() == "inline" and self.cache is None:
+            return await run_in_executor(self.execute, **kwds)
+
+        fn_id, processed_args = self._start_execute(kwds)
+        try:
+            if self.cache is not None:
+                status, feedback, info = await self.cache.acall(
+                    self.cache.key(self.fn_name, processed_args),
+                    lambda: self._acall(processed_args),
+                )
+            else:
+                status, feedback, info = await self._acall(processed_args)
+
             return FunctionResult(
                 action_id=fn_id,
-                action_status=FunctionResultStatus.FAILED,
-                feedback_message=f"Error executing function: {str(e)}",
-                info={},
+                action_status=status,
+                feedback_message=feedback,
+                info=info,
             )
-        
+        except _ExecutableTimeout:
+            return self._failed(fn_id, f"timed out after {self.timeout}s")
+        except Exception as e:
+            return self._failed(fn_id, str(e))
+
+    def _call(self, processed_args: Dict[str, Any]) -> Tuple[FunctionResultStatus, str, dict]:
+        """Runs the executable on its execution backend"""
+        backend = self._get_execution_backend()
+        if backend == "inline":
+            return self.executable(**processed_args)
+        if backend == "coroutine":
+            future = run_coroutine(self.executable(**processed_args))
+            try:
+                return future.result(timeout=self.timeout)
+            except FutureTimeoutError:
+                future.cancel()
+                raise _ExecutableTimeout()
+        future = submit_function(backend, self.executable, processed_args, abandonable=self.timeout is not None)
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            abandon_function(backend, future)
+            raise _ExecutableTimeout()
+
+    async def _acall(self, processed_args: Dict[str, Any]) -> Tuple[FunctionResultStatus, str, dict]:
+        """Async counterpart of `_call`"""
+        import asyncio
+
+        backend = self._get_execution_backend()
+        if backend == "inline":
+            return await run_in_executor(self.executable, **processed_args)
+        if backend == "coroutine":
+            # awaited on the caller's loop (cancelled on timeout)
+            try:
+                return await asyncio.wait_for(self.executable(**processed_args), self.timeout)
+            except asyncio.TimeoutError:
+                raise _ExecutableTimeout()
+        future = submit_function(backend, self.executable, processed_args, abandonable=self.timeout is not None)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            abandon_function(backend, future)
+            raise _ExecutableTimeout()
+
+    def _start_execute(self, kwds: Dict[str, Any]) -> Tuple[Optional[str], Dict[str, Any]]:
+        """Reports the call and returns the function ID and the argument values"""
+        fn_id = kwds.get('fn_id')
+        args = kwds.get('args', {})
+        get_output().message(
+            "function.execute",
+            lambda: f"Function Args: {args}\nFunction ID: {fn_id}",
+            level=logging.DEBUG,
+            fn_name=self.fn_name,
+            fn_id=fn_id,
+        )
+        # Extract values from the nested dictionary structure
+        processed_args = {}
+        for arg_name, arg_value in args.items():
+            if isinstance(arg_value, dict) and 'value' in arg_value:
+                processed_args[arg_name] = arg_value['value']
+            else:
+                processed_args[arg_name] = arg_value
+        return fn_id, processed_args
+
+    def _is_coroutine_executable(self) -> bool:
+        executable = self.executable
+        return inspect.iscoroutinefunction(executable) or inspect.iscoroutinefunction(
+            getattr(executable, "__call__", None)
+        )
+
+    def _get_execution_backend(self) -> str:
+        if self._is_coroutine_executable():
+            return "coroutine"
+        if self.execution_backend is not None:
+            return self.execution_backend
+        return "thread" if self.timeout is not None else "inline"
+
+    def _failed(self, fn_id: Optional[str], error: str) -> FunctionResult:
+        return FunctionResult(
+            action_id=fn_id,
+            action_status=FunctionResultStatus.FAILED,
+            feedback_message=f"Error executing function: {error}",
+            info={},
+        )
+
     def __str__(self) -> str:
         output = (
             f"🔧 Function:\n"
@@ -157,6 +343,32 @@ class Function(BaseModel):
         return output
 
 
+class FunctionDefsCache:
+    """
+    Caches the pre-serialized `functions` payload for an action space.
+
+    The combined JSON array is rebuilt only when a function is added, removed, replaced
+    or changed, so building a step payload no longer serializes every function.
+    """
+    def __init__(self):
+        self._fragments: Tuple[str, ...] = ()
+        self._payload: Optional[RawJSON] = None
+
+    def get(self, functions: Iterable[Function]) -> RawJSON:
+        """
+        Returns the functions payload as a RawJSON array ready to splice into a request body.
+        """
+        fragments = tuple(f.get_function_def_json() for f in functions)
+        if (
+            self._payload is None
+            or len(fragments) != len(self._fragments)
+            or any(a is not b for a, b in zip(fragments, self._fragments))
+        ):
+            self._fragments = fragments
+            self._payload = RawJSON("[" + ",".join(fragments) + "]")
+        return self._payload
+
+
 # Different ActionTypes returned by the GAME API
 class ActionType(Enum):
     """
@@ -394,6 +606,8 @@ class ActionResponse(BaseModel):
         reaction_info (Optional[str]): TODO: Get explanation from Steven Lee
         agents (Optional[List[str]]): TODO: Get explanation from Steven Lee
     """
+    model_config = ConfigDict(defer_build=True)
+
     action_type: ActionType
     agent_state: AgentStateResponse
     action_args: Optional[Dict[str, Any]] = None
@@ -414,25 +628,35 @@ class ActionResponse(BaseModel):
 
 
 class ChatActionRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     fn_name: str
     args: Dict[str, Any]
     id: str
 
 class GameChatResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     message: Optional[str] = Field(default=None)
     is_finished: bool = Field(default=False)
     function_call: Optional[ChatActionRequest] = Field(default=None)
 
 class AgentMessage(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     message: str
     chat_id: str
 
 class FunctionCallResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     fn_name: str
     fn_args: Dict[str, Any]
     result: FunctionResult
 
 class ChatResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     message: str
     is_finished: bool
     function_call: Optional[FunctionCallResponse] = None
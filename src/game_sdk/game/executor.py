@@ -0,0 +1,308 @@
+import contextvars
+import functools
+import os
+import queue
+import threading
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import ProcessPoolExecutor
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_max_workers: int = min(32, (os.cpu_count() or 1) + 4)
+
+# pools for Function executables with the "thread"/"process" execution backends, kept
+# apart from the shared pool so hung executables cannot starve state functions
+_function_threads: Optional["DaemonThreadPool"] = None
+_function_processes: Optional["ProcessPoolExecutor"] = None
+_function_limits: Dict[str, Optional[int]] = {"thread": 32, "process": None}
+# single-process pools of the "process" calls that can be abandoned, by call
+_isolated_calls: Dict[Future, "ProcessPoolExecutor"] = {}
+
+# pool for state providers refreshed concurrently, apart from both of the above so
+# neither hung executables nor blocking agent loops can delay a state refresh
+_state_threads: Optional["DaemonThreadPool"] = None
+_state_limit: int = 32
+
+# event loop running coroutine executables for the blocking agent loops
+_background_loop: Optional["asyncio.AbstractEventLoop"] = None
+_background_thread: Optional[threading.Thread] = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Returns the bounded thread pool used to run blocking work (sync executables,
+    state functions, legacy API calls) from async agent loops.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=_max_workers, thread_name_prefix="game-sdk"
+                )
+    return _executor
+
+
+def configure_executor(max_workers: int) -> ThreadPoolExecutor:
+    """
+    Replaces the shared thread pool with one bounded to `max_workers` threads.
+    Work already submitted to the previous pool is allowed to finish.
+    """
+    global _executor, _max_workers
+    with _executor_lock:
+        previous = _executor
+        _max_workers = max_workers
+        _executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="game-sdk"
+        )
+    if previous is not None:
+        previous.shutdown(wait=False)
+    return _executor
+
+
+async def run_in_executor(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Runs a blocking callable on the shared thread pool and awaits its result. The caller's
+    context variables (current trace span, output sink) are visible to the callable.
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        get_executor(), functools.partial(context.run, fn, *args, **kwargs)
+    )
+
+
+class DaemonThreadPool:
+    """
+    Minimal bounded thread pool with daemon threads. Unlike ThreadPoolExecutor, whose
+    threads are joined at interpreter exit, an executable that never returns (and was
+    abandoned after its timeout) cannot keep the process from exiting.
+    """
+    def __init__(self, max_workers: int, thread_name_prefix: str):
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._threads = 0
+        # threads blocked on the queue, and calls queued but not picked up yet
+        self._waiting = 0
+        self._pending = 0
+        self._shutdown = False
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        future: Future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new calls after shutdown")
+            self._queue.put((future, fn, args, kwargs))
+            self._pending += 1
+            if self._pending > self._waiting and self._threads < self._max_workers:
+                self._threads += 1
+                threading.Thread(
+                    target=self._work, name=f"{self._thread_name_prefix}_{self._threads}", daemon=True
+                ).start()
+        return future
+
+    def shutdown(self, wait: bool = False):
+        """Stops the threads once the queued calls are done (never waits for them)"""
+        with self._lock:
+            self._shutdown = True
+            for _ in range(self._threads):
+                self._queue.put(None)
+
+    def _work(self):
+        while True:
+            with self._lock:
+                self._waiting += 1
+            item = self._queue.get()
+            with self._lock:
+                self._waiting -= 1
+                if item is None:
+                    return
+                self._pending -= 1
+            future, fn, args, kwargs = item
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn(*args, **kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+
+
+def get_function_executor(backend: str):
+    """
+    Returns the pool for Function executables with the given execution backend: a thread
+    pool for "thread", a process pool (one process per CPU by default) for "process".
+    """
+    global _function_threads, _function_processes
+    if backend == "thread":
+        if _function_threads is None:
+            with _executor_lock:
+                if _function_threads is None:
+                    _function_threads = DaemonThreadPool(
+                        max_workers=_function_limits["thread"], thread_name_prefix="game-sdk-fn"
+                    )
+        return _function_threads
+    if backend == "process":
+        if _function_processes is None:
+            with _executor_lock:
+                if _function_processes is None:
+                    # imports multiprocessing, so only when a process backend is used
+                    from concurrent.futures import ProcessPoolExecutor
+
+                    _function_processes = ProcessPoolExecutor(max_workers=_function_limits["process"])
+        return _function_processes
+    raise ValueError(f"Unknown execution backend: {backend}")
+
+
+def configure_function_executors(max_threads: Optional[int] = None, max_processes: Optional[int] = None):
+    """
+    Bounds the pools used by Function executables with the "thread" and "process"
+    execution backends. Pools are recreated on next use; calls already running finish.
+    """
+    global _function_threads, _function_processes
+    with _executor_lock:
+        previous = []
+        if max_threads is not None:
+            _function_limits["thread"] = max_threads
+            previous.append(_function_threads)
+            _function_threads = None
+        if max_processes is not None:
+            _function_limits["process"] = max_processes
+            previous.append(_function_processes)
+            _function_processes = None
+    for pool in previous:
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+
+def submit_function(backend: str, fn: Callable[..., Any], kwargs: Dict[str, Any],
+                    abandonable: bool = False) -> Future:
+    """
+    Submits a Function executable to the pool of its execution backend. Thread calls see
+    the caller's context variables; process calls need a picklable executable and
+    arguments (e.g. a module-level function).
+
+    With `abandonable` (calls with a timeout), a process call gets a process of its own
+    instead of one of the shared pool, so `abandon_function` can terminate it without
+    failing other calls.
+    """
+    if backend == "process" and abandonable:
+        from concurrent.futures import ProcessPoolExecutor
+
+        pool = ProcessPoolExecutor(max_workers=1)
+        future = pool.submit(fn, **kwargs)
+        with _executor_lock:
+            _isolated_calls[future] = pool
+        future.add_done_callback(_release_isolated_call)
+        return future
+    pool = get_function_executor(backend)
+    if backend == "thread":
+        return pool.submit(contextvars.copy_context().run, fn, **kwargs)
+    return pool.submit(fn, **kwargs)
+
+
+def abandon_function(backend: str, future: Future):
+    """
+    Gives up on a timed-out executable. A thread cannot be interrupted and runs on in
+    the background; the process of an abandonable process call is terminated.
+    """
+    if future.cancel() or backend != "process":
+        return
+    with _executor_lock:
+        pool = _isolated_calls.pop(future, None)
+    if pool is None:
+        return
+    # the pool's only worker process (there is no public API to stop a running task)
+    for process in list(getattr(pool, "_processes", {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False)
+
+
+def _release_isolated_call(future: Future):
+    with _executor_lock:
+        pool = _isolated_calls.pop(future, None)
+    if pool is not None:
+        pool.shutdown(wait=False)
+
+
+def get_state_executor() -> DaemonThreadPool:
+    """Returns the pool that runs state providers (see `state_refresh.refresh_states`)"""
+    global _state_threads
+    if _state_threads is None:
+        with _executor_lock:
+            if _state_threads is None:
+                _state_threads = DaemonThreadPool(max_workers=_state_limit, thread_name_prefix="game-sdk-state")
+    return _state_threads
+
+
+def submit_state_provider(fn: Callable[[], Any]) -> Future:
+    """Submits a state provider call to the state pool; it sees the caller's context variables"""
+    return get_state_executor().submit(contextvars.copy_context().run, fn)
+
+
+def get_background_loop() -> "asyncio.AbstractEventLoop":
+    """
+    Returns the event loop that runs coroutine executables for blocking callers (e.g.
+    `Agent.step`). It is started on first use in a daemon thread and lives for the rest of
+    the process, so async clients (HTTP sessions, bots) can be reused across calls.
+    """
+    global _background_loop, _background_thread
+    if _background_loop is None:
+        with _executor_lock:
+            if _background_loop is None:
+                import asyncio
+
+                loop = asyncio.new_event_loop()
+                _background_thread = threading.Thread(
+                    target=loop.run_forever, name="game-sdk-loop", daemon=True
+                )
+                _background_thread.start()
+                _background_loop = loop
+    return _background_loop
+
+
+def run_coroutine(coro: Any) -> Future:
+    """
+    Schedules a coroutine on the background loop and returns a future for its result.
+    Cancelling the future cancels the coroutine. The caller's context variables (current
+    trace span, output sink) are visible to the coroutine.
+    """
+    loop = get_background_loop()
+    if threading.current_thread() is _background_thread:
+        coro.close()
+        raise RuntimeError("Cannot block on the background loop from a coroutine running on it; await instead")
+
+    future: Future = Future()
+
+    def start():
+        if future.cancelled():
+            coro.close()
+            return
+        task = loop.create_task(coro)
+
+        def done(task):
+            try:
+                if task.cancelled():
+                    future.cancel()
+                elif task.exception() is not None:
+                    future.set_exception(task.exception())
+                else:
+                    future.set_result(task.result())
+            except InvalidStateError:
+                # cancelled by the caller in the meantime
+                pass
+
+        task.add_done_callback(done)
+        # the future stays pending until the task is done, so callers can cancel it
+        future.add_done_callback(lambda f: f.cancelled() and loop.call_soon_threadsafe(task.cancel))
+
+    # tasks copy the current context when created, i.e. the caller's one here
+    loop.call_soon_threadsafe(start, context=contextvars.copy_context())
+    return future
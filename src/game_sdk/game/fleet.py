@@ -0,0 +1,269 @@
+import asyncio
+import threading
+from typing import Callable, Dict, List, Optional, Union
+from game_sdk.game.agent import Agent, Session
+from game_sdk.game.worker import Worker
+
+
+class FleetMember:
+    """
+    An Agent or Worker scheduled by a Fleet, together with its scheduling settings and progress.
+
+    Args:
+        target (Union[Agent, Worker]): The compiled agent or the worker to step.
+        weight (int): Relative share of steps the member gets when the fleet is saturated.
+        max_steps (Optional[int]): Step budget - the member is retired after this many steps.
+        task (Optional[str]): Task to give a Worker before its first step (required for workers).
+
+    Attributes:
+        steps (int): Number of steps completed.
+        error (Optional[BaseException]): Exception that retired the member, if any.
+        done (bool): Whether the member has been retired (budget used up, worker task
+            finished, or step failed).
+    """
+    def __init__(self,
+                 target: Union[Agent, Worker],
+                 weight: int = 1,
+                 max_steps: Optional[int] = None,
+                 task: Optional[str] = None,
+                 ):
+        if weight < 1:
+            raise ValueError("Fleet member weight must be at least 1")
+        if isinstance(target, Worker) and task is None:
+            raise ValueError("A task is required to schedule a Worker")
+
+        self.target = target
+        self.weight = weight
+        self.max_steps = max_steps
+        self.task = task
+
+        self.steps = 0
+        self.error: Optional[BaseException] = None
+        self.done = False
+        self._started = False
+        # event loop time before which an idling agent is not stepped (see Agent.idle_policy)
+        self._idle_until = 0.0
+        # smooth weighted round-robin counter
+        self._current_weight = 0
+
+    async def _start(self):
+        if isinstance(self.target, Worker):
+            await self.target.aset_task(self.task)
+        elif not self.target._resume_session:
+            self.target._session = Session()
+        else:
+            # continue the session restored from a checkpoint
+            self.target._resume_session = False
+        self._started = True
+
+    async def _step(self):
+        if not self._started:
+            await self._start()
+
+        action_response, _ = await self.target.astep()
+        self.steps += 1
+
+        if isinstance(self.target, Agent):
+            delay = self.target._idle_delay(action_response)
+            # if notified while the step was in flight, step again right away
+            if delay > 0 and not self.target._wake_signal.is_set():
+                self._idle_until = asyncio.get_running_loop().time() + delay
+
+        if self.max_steps is not None and self.steps >= self.max_steps:
+            self.done = True
+        # a standalone worker is finished once GAME returns WAIT for its task
+        if isinstance(self.target, Worker) and not self.target._submission_id:
+            self.done = True
+
+
+class Fleet:
+    """
+    Runs many Agents and Workers in one process on a single asyncio event loop.
+
+    Members take turns in smooth weighted round-robin order, each member has at most one
+    step in flight, and at most `max_concurrency` steps (and therefore GAME API calls)
+    are in flight across the whole fleet. Agents idle after WAIT according to their
+    `idle_policy` without holding a slot, and `Agent.notify()` makes them ready again
+    (the fleet listens to its agents' notifications only while it runs).
+
+    Args:
+        max_concurrency (int): Maximum number of steps in flight at once.
+
+    Example:
+        ```python
+        fleet = Fleet(max_concurrency=32)
+        for agent in agents:
+            fleet.add(agent, max_steps=100)
+        fleet.add(worker, task="Summarize the latest news", weight=2)
+        fleet.run()
+        ```
+    """
+    def __init__(self, max_concurrency: int = 16):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.members: List[FleetMember] = []
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+        self._cancelling = False
+        self._running = False
+        # wake-up listeners registered on member agents while the fleet runs
+        self._lock = threading.Lock()
+        self._listeners: Dict[FleetMember, Callable[[], None]] = {}
+
+    def add(self,
+            target: Union[Agent, Worker],
+            weight: int = 1,
+            max_steps: Optional[int] = None,
+            task: Optional[str] = None,
+            ) -> FleetMember:
+        """
+        Schedules an agent (already compiled) or a worker with a task. Members can also be
+        added while the fleet is running.
+        """
+        member = FleetMember(target, weight=weight, max_steps=max_steps, task=task)
+        with self._lock:
+            self.members.append(member)
+            if self._running:
+                self._listen(member)
+        self._wake()
+        return member
+
+    def remove(self, member: FleetMember):
+        """
+        Unschedules a member. A step of the member in flight finishes, but no further step
+        is started. Safe to call from any thread.
+        """
+        with self._lock:
+            if member in self.members:
+                self.members.remove(member)
+            self._unlisten(member)
+        self._wake()
+
+    def stop(self, drain: bool = True):
+        """
+        Stops the fleet. With `drain` the steps in flight are allowed to finish, otherwise
+        they are cancelled. Safe to call from any thread.
+        """
+        self._stopping = True
+        if not drain:
+            self._cancelling = True
+        self._wake()
+
+    def run(self) -> List[FleetMember]:
+        """
+        Runs the fleet until every member is done or the fleet is stopped.
+        """
+        return asyncio.run(self.arun())
+
+    async def arun(self) -> List[FleetMember]:
+        """
+        Async counterpart of `run`.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._cancelling = False
+        with self._lock:
+            self._running = True
+            for member in self.members:
+                if not member.done:
+                    self._listen(member)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        in_flight: Dict[FleetMember, asyncio.Future] = {}
+
+        try:
+            while True:
+                if self._cancelling:
+                    for task in in_flight.values():
+                        task.cancel()
+                    await asyncio.gather(*in_flight.values(), return_exceptions=True)
+                    break
+
+                now = self._loop.time()
+                waiting = [] if self._stopping else [
+                    m for m in self.members if not m.done and m not in in_flight
+                ]
+                ready = [m for m in waiting if m._idle_until <= now]
+                if not waiting and not in_flight:
+                    break
+
+                if ready and not semaphore.locked():
+                    member = self._select(ready)
+                    await semaphore.acquire()
+                    in_flight[member] = asyncio.ensure_future(self._run_step(member, semaphore))
+                    continue
+
+                # wait for a step to finish (freeing a slot), for add()/stop()/notify(),
+                # or for the first idling agent to become ready
+                idle_until = [m._idle_until for m in waiting if m._idle_until > now]
+                timeout = min(idle_until) - now if idle_until and not ready else None
+                self._wakeup.clear()
+                waiter = asyncio.ensure_future(self._wakeup.wait())
+                await asyncio.wait(
+                    list(in_flight.values()) + [waiter],
+                    timeout=timeout,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                waiter.cancel()
+                for member, task in list(in_flight.items()):
+                    if task.done():
+                        del in_flight[member]
+        finally:
+            with self._lock:
+                self._running = False
+                for member in list(self._listeners):
+                    self._unlisten(member)
+            self._loop = None
+
+        return self.members
+
+    def _select(self, ready: List[FleetMember]) -> FleetMember:
+        # smooth weighted round-robin (interleaves members instead of bursting heavy ones)
+        total = 0
+        best = None
+        for member in ready:
+            member._current_weight += member.weight
+            total += member.weight
+            if best is None or member._current_weight > best._current_weight:
+                best = member
+        best._current_weight -= total
+        return best
+
+    async def _run_step(self, member: FleetMember, semaphore: asyncio.Semaphore):
+        try:
+            await member._step()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            member.error = e
+            member.done = True
+        finally:
+            semaphore.release()
+            if member.done:
+                with self._lock:
+                    self._unlisten(member)
+
+    def _listen(self, member: FleetMember):
+        if isinstance(member.target, Agent) and member not in self._listeners:
+            listener = lambda: self._notify_member(member)
+            member.target._wake_signal.add_listener(listener)
+            self._listeners[member] = listener
+
+    def _unlisten(self, member: FleetMember):
+        listener = self._listeners.pop(member, None)
+        if listener is not None:
+            member.target._wake_signal.remove_listener(listener)
+
+    def _notify_member(self, member: FleetMember):
+        # called from Agent.notify, possibly on another thread
+        member._idle_until = 0.0
+        self._wake()
+
+    def _wake(self):
+        loop = self._loop
+        if loop is not None and self._wakeup is not None:
+            loop.call_soon_threadsafe(self._wakeup.set)
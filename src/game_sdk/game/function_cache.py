@@ -0,0 +1,248 @@
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+
+# (status, feedback, info) as returned by an executable
+ExecutableResult = Tuple[Any, str, dict]
+
+
+class FunctionCache:
+    """
+    Opt-in memoization for Functions whose executable only reads data (topic lists,
+    agent searches, ...), set as `Function(..., cache=FunctionCache(ttl=300))`.
+
+    Results are keyed by function name and normalized arguments (sorted, with None
+    arguments left out) and kept for `ttl` seconds, least recently used first out once
+    `max_entries` is reached. Calls whose arguments are not JSON values (objects without
+    a stable representation) are not cached unless `key_fn` maps them to one. Only DONE
+    results are cached, and every caller gets its own copy of the result's `info`.
+    Concurrent misses for the same key wait on a single call instead of each calling the
+    executable. With `stale_while_revalidate`, an expired result is still returned for
+    that many extra seconds while a single background call refreshes it, so callers never
+    wait on the refresh.
+
+    Args:
+        ttl (float): Seconds a result is fresh.
+        max_entries (int): Maximum cached results.
+        stale_while_revalidate (float): Seconds past `ttl` during which the stale result
+            is returned and refreshed in the background (0 disables it).
+        key_fn (Optional[Callable[[Dict[str, Any]], Any]]): Builds the cache key from the
+            executable's arguments instead of the default normalization, e.g. to key an
+            object argument by its id; calls whose key is not JSON-serializable are not
+            cached.
+    """
+    def __init__(self,
+                 ttl: float = 60.0,
+                 max_entries: int = 256,
+                 stale_while_revalidate: float = 0.0,
+                 key_fn: Optional[Callable[[Dict[str, Any]], Any]] = None,
+                 ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stale_while_revalidate = stale_while_revalidate
+        self.key_fn = key_fn
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[ExecutableResult, float]]" = OrderedDict()
+        self._refreshing: Set[str] = set()
+        # background refresh tasks (the loop only keeps weak references to tasks)
+        self._tasks: Set[Any] = set()
+        # calls in flight for missed keys, shared by concurrent callers
+        self._in_flight: Dict[str, Future] = {}
+        self._stats: Dict[str, int] = dict.fromkeys(
+            ("hits", "stale_hits", "misses", "coalesced", "uncacheable", "refreshes", "evictions"), 0
+        )
+
+    def key(self, fn_name: str, args: Dict[str, Any]) -> Optional[str]:
+        """
+        Cache key for a call of `fn_name` with the executable's `args`, or None if the
+        arguments (or the output of `key_fn`) are not JSON values
+        """
+        if self.key_fn is not None:
+            normalized = self.key_fn(args)
+        else:
+            normalized = {name: value for name, value in args.items() if value is not None}
+        try:
+            return json.dumps([fn_name, normalized], sort_keys=True, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return None
+
+    def call(self, key: Optional[str], fn: Callable[[], ExecutableResult],
+             refresh: Callable[[Callable[[], None]], Any]) -> ExecutableResult:
+        """
+        Returns the cached result for `key`, or calls `fn` and caches its result (a None
+        key is not cached). `refresh(job)` must run `job` in the background (used for
+        stale results).
+        """
+        if key is None:
+            return self._uncacheable(fn)
+        result, stale = self._lookup(key)
+        if result is not None:
+            if stale and self._begin_refresh(key):
+                refresh(lambda: self._refresh(key, fn))
+            return _copy(result)
+        future, owner = self._join(key)
+        if not owner:
+            return _copy(future.result())
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key, future, exception=e)
+            raise
+        self._finish(key, future, result)
+        return _copy(result)
+
+    async def acall(self, key: Optional[str], fn: Callable[[], Awaitable[ExecutableResult]]) -> ExecutableResult:
+        """Async counterpart of `call`; stale results are refreshed in a task on the running loop"""
+        import asyncio
+
+        if key is None:
+            return await self._auncacheable(fn)
+        result, stale = self._lookup(key)
+        if result is not None:
+            if stale and self._begin_refresh(key):
+                task = asyncio.ensure_future(self._arefresh(key, fn))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            return _copy(result)
+        future, owner = self._join(key)
+        if not owner:
+            return _copy(await asyncio.wrap_future(future))
+        try:
+            result = await fn()
+        except BaseException as e:
+            self._finish(key, future, exception=e)
+            raise
+        self._finish(key, future, result)
+        return _copy(result)
+
+    def invalidate(self, key: Optional[str] = None):
+        """Drops one cached result, or all of them"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Hits, stale hits, misses (`coalesced` of them waited on another caller's call),
+        uncacheable calls, background refreshes, evictions, size and hit rate
+        """
+        with self._lock:
+            stats: Dict[str, float] = dict(self._stats)
+            stats["size"] = len(self._entries)
+        lookups = stats["hits"] + stats["stale_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["hits"] + stats["stale_hits"]) / lookups if lookups else 0.0
+        return stats
+
+    def _lookup(self, key: str) -> Tuple[Optional[ExecutableResult], bool]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                result, stored_at = entry
+                age = now - stored_at
+                if age <= self.ttl:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return result, False
+                if age <= self.ttl + self.stale_while_revalidate:
+                    self._entries.move_to_end(key)
+                    self._stats["stale_hits"] += 1
+                    return result, True
+                del self._entries[key]
+            self._stats["misses"] += 1
+            return None, False
+
+    def _uncacheable(self, fn: Callable[[], ExecutableResult]) -> ExecutableResult:
+        with self._lock:
+            self._stats["uncacheable"] += 1
+        return fn()
+
+    async def _auncacheable(self, fn: Callable[[], Awaitable[ExecutableResult]]) -> ExecutableResult:
+        with self._lock:
+            self._stats["uncacheable"] += 1
+        return await fn()
+
+    def _join(self, key: str) -> Tuple[Future, bool]:
+        """Returns the call in flight for `key` and whether the caller has to make it"""
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                self._stats["coalesced"] += 1
+                return future, False
+            future = self._in_flight[key] = Future()
+            return future, True
+
+    def _finish(self, key: str, future: Future, result: Optional[ExecutableResult] = None,
+                exception: Optional[BaseException] = None):
+        if exception is None:
+            self._store(key, result)
+        with self._lock:
+            self._in_flight.pop(key, None)
+        if exception is None:
+            future.set_result(result)
+        else:
+            future.set_exception(exception)
+
+    def _store(self, key: str, result: ExecutableResult):
+        if not _is_done(result):
+            return
+        # a copy, so callers mutating their `info` do not change the cached one
+        result = _copy(result)
+        with self._lock:
+            self._entries[key] = (result, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def _begin_refresh(self, key: str) -> bool:
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self._stats["refreshes"] += 1
+            return True
+
+    def _refresh(self, key: str, fn: Callable[[], ExecutableResult]):
+        try:
+            self._store(key, fn())
+        except Exception:
+            # the stale result stays until it expires; the next miss reports the error
+            pass
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    async def _arefresh(self, key: str, fn: Callable[[], Awaitable[ExecutableResult]]):
+        try:
+            self._store(key, await fn())
+        except Exception:
+            pass
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def __repr__(self) -> str:
+        return (
+            f"FunctionCache(ttl={self.ttl}, max_entries={self.max_entries}, "
+            f"stale_while_revalidate={self.stale_while_revalidate})"
+        )
+
+
+def _copy(result: ExecutableResult) -> ExecutableResult:
+    status, feedback, info = result
+    return status, feedback, copy.deepcopy(info)
+
+
+def _is_done(result: ExecutableResult) -> bool:
+    status = result[0]
+    return getattr(status, "value", status) == "done"
@@ -0,0 +1,106 @@
+import random
+import threading
+from typing import Callable, List, Optional
+
+
+class IdlePolicy:
+    """
+    How long an agent loop idles after the GAME API answers WAIT.
+
+    The first WAIT idles for `initial_delay` seconds; every further consecutive WAIT
+    multiplies the delay by `factor`, up to `max_delay`. Any other action, or a call to
+    `Agent.notify`, resets the backoff. `IdlePolicy(initial_delay=0)` disables idling.
+
+    Args:
+        initial_delay (float): Seconds to idle after the first WAIT.
+        factor (float): Growth of the delay per consecutive WAIT.
+        max_delay (float): Upper bound for the delay.
+        jitter (float): Relative random spread applied to each delay (0.1 = +/-10%), so
+            many idle agents do not wake up in lockstep.
+    """
+    def __init__(self,
+                 initial_delay: float = 1.0,
+                 factor: float = 2.0,
+                 max_delay: float = 60.0,
+                 jitter: float = 0.1,
+                 ):
+        self.initial_delay = initial_delay
+        self.factor = factor
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self._random = random.Random()
+
+    def delay(self, consecutive_waits: int) -> float:
+        """Seconds to idle after `consecutive_waits` WAITs in a row (0 if none)"""
+        if consecutive_waits < 1 or self.initial_delay <= 0:
+            return 0.0
+        delay = min(self.initial_delay * self.factor ** (consecutive_waits - 1), self.max_delay)
+        if self.jitter:
+            delay *= 1 + self._random.uniform(-self.jitter, self.jitter)
+        return max(0.0, delay)
+
+
+class WakeSignal:
+    """
+    Thread-safe wake-up signal for an idling agent loop.
+
+    `notify()` may be called from any thread (or event loop); it interrupts a blocking
+    `wait()`, an `await_()` on any event loop, and calls the registered listeners.
+    A notification arriving while nobody waits is kept until the next wait.
+    """
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[], None]] = []
+
+    def notify(self):
+        self._event.set()
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener()
+
+    def add_listener(self, listener: Callable[[], None]):
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[], None]):
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def is_set(self) -> bool:
+        return self._event.is_set()
+
+    def clear(self):
+        self._event.clear()
+
+    def wait(self, timeout: Optional[float]) -> bool:
+        """Blocks up to `timeout` seconds; returns True (and resets) if notified"""
+        woken = self._event.wait(timeout)
+        self._event.clear()
+        return woken
+
+    async def await_(self, timeout: Optional[float]) -> bool:
+        """Async counterpart of `wait`"""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+
+        def listener():
+            loop.call_soon_threadsafe(event.set)
+
+        self.add_listener(listener)
+        try:
+            # checked after registering, so a notify() in between is not lost
+            if not self._event.is_set():
+                try:
+                    await asyncio.wait_for(event.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self.remove_listener(listener)
+        woken = self._event.is_set()
+        self._event.clear()
+        return woken
@@ -0,0 +1,194 @@
+import dataclasses
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class InboxEvent:
+    """
+    An event pushed by a plugin, waiting to be shown to the agent.
+
+    Attributes:
+        content (Any): JSON-serializable payload (message text, mention, job update, ...).
+        source (Optional[str]): Where the event came from (e.g. "telegram").
+        key (str): Deduplication key; pushing an event with a pending key merges them.
+        priority (int): Higher priorities are shown first and dropped last.
+        received_at (float): Time of the latest push with this key.
+        count (int): Number of pushes merged into this event.
+    """
+    content: Any
+    source: Optional[str]
+    key: str
+    priority: int = 0
+    received_at: float = field(default_factory=time.time)
+    count: int = 1
+
+    def rank(self):
+        return (self.priority, self.received_at)
+
+    def to_observation(self) -> Dict[str, Any]:
+        entry = {"content": self.content}
+        if self.source is not None:
+            entry["source"] = self.source
+        if self.count > 1:
+            entry["count"] = self.count
+        return entry
+
+
+@dataclass
+class InboxBatch:
+    """
+    Events taken from an inbox for one step, coalesced into a single observation.
+
+    Attributes:
+        events (List[InboxEvent]): The events taken, highest ranked first.
+        observation (Dict[str, Any]): `{"events": [...], "omitted": n}` - the events taken,
+            plus how many lower ranked events did not fit the size budget and stay pending
+            for the next step ("omitted" only if any).
+    """
+    events: List[InboxEvent]
+    observation: Dict[str, Any]
+
+
+class EventInbox:
+    """
+    Bounded, thread-safe inbox of platform events for an Agent or Worker.
+
+    Plugins push events from any thread; before each step the pending events are taken
+    in one batch: duplicates (same key) are merged, events are ranked by priority and
+    recency, and as many as fit in `max_chars` of JSON become one `observations` entry
+    of the step payload (the rest stay pending). A burst of messages is then handled by
+    a single step.
+
+    Args:
+        max_events (int): Maximum pending events; when full, the lowest ranked
+            (lowest priority, then oldest) event is dropped.
+        max_chars (int): Budget for the serialized observation. Events that do not fit
+            wait for the next step and are counted as "omitted"; a single oversized event
+            is truncated (non-text content as its JSON text).
+
+    Attributes:
+        dropped (int): Events dropped because the inbox was full.
+        merged (int): Pushes merged into an already pending event.
+    """
+    def __init__(self, max_events: int = 100, max_chars: int = 4000):
+        self.max_events = max_events
+        self.max_chars = max_chars
+        self.dropped = 0
+        self.merged = 0
+        self._lock = threading.Lock()
+        self._events: Dict[str, InboxEvent] = {}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._events)
+
+    def push(self,
+             content: Any,
+             source: Optional[str] = None,
+             key: Optional[str] = None,
+             priority: int = 0,
+             ) -> bool:
+        """
+        Adds an event. Returns False if it was merged into a pending event with the same
+        key (by default, the same source and content) instead of being added.
+        """
+        if key is None:
+            key = json.dumps([source, content], sort_keys=True, default=str)
+        now = time.time()
+        with self._lock:
+            pending = self._events.get(key)
+            if pending is not None:
+                pending.content = content
+                pending.priority = max(pending.priority, priority)
+                pending.received_at = now
+                pending.count += 1
+                self.merged += 1
+                return False
+
+            self._events[key] = InboxEvent(content, source, key, priority, now)
+            if len(self._events) > self.max_events:
+                lowest = min(self._events.values(), key=InboxEvent.rank)
+                del self._events[lowest.key]
+                self.dropped += 1
+            return True
+
+    def take(self) -> Optional[InboxBatch]:
+        """
+        Takes the highest ranked pending events that fit the size budget as one coalesced
+        batch (None if there are no events)
+        """
+        with self._lock:
+            if not self._events:
+                return None
+            events = sorted(self._events.values(), key=InboxEvent.rank, reverse=True)
+            entries = self._coalesce(events)
+            taken = events[:len(entries)]
+            for event in taken:
+                del self._events[event.key]
+
+        observation: Dict[str, Any] = {"events": entries}
+        if len(taken) < len(events):
+            observation["omitted"] = len(events) - len(taken)
+        return InboxBatch(taken, observation)
+
+    def put_back(self, batch: InboxBatch):
+        """Returns a batch whose step failed, so its events are shown on the next step"""
+        with self._lock:
+            for event in batch.events:
+                pending = self._events.get(event.key)
+                if pending is None:
+                    self._events[event.key] = event
+                else:
+                    pending.count += event.count
+                    pending.priority = max(pending.priority, event.priority)
+            while len(self._events) > self.max_events:
+                lowest = min(self._events.values(), key=InboxEvent.rank)
+                del self._events[lowest.key]
+                self.dropped += 1
+
+    def clear(self):
+        with self._lock:
+            self._events = {}
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Pending events as JSON-serializable dicts (e.g. for a checkpoint)"""
+        with self._lock:
+            return [dataclasses.asdict(event) for event in self._events.values()]
+
+    def restore(self, events: List[Dict[str, Any]]):
+        """Replaces the pending events with ones saved by `snapshot`"""
+        with self._lock:
+            self._events = {event["key"]: InboxEvent(**event) for event in events}
+
+    def _coalesce(self, events: List[InboxEvent]) -> List[Dict[str, Any]]:
+        entries = []
+        size = len('{"events":[],"omitted":000}')
+        for event in events:
+            entry = event.to_observation()
+            entry_size = len(json.dumps(entry, default=str)) + 1
+            if size + entry_size > self.max_chars:
+                if not entries:
+                    # always make progress: truncate the top event to the budget
+                    text = event.content if isinstance(event.content, str) else json.dumps(event.content, default=str)
+                    entry["content"] = ""
+                    room = self.max_chars - size - len(json.dumps(entry, default=str)) - 1 - len("...")
+                    entry["content"] = _truncate_encoded(text, room) + "..."
+                    entries.append(entry)
+                break
+            entries.append(entry)
+            size += entry_size
+        return entries
+
+
+def _truncate_encoded(text: str, room: int) -> str:
+    """Longest prefix of `text` that takes at most `room` chars inside a JSON string"""
+    used = 0
+    for i, char in enumerate(text):
+        used += len(json.dumps(char)) - 2
+        if used > room:
+            return text[:i]
+    return text
@@ -0,0 +1,194 @@
+import threading
+from typing import Any, Callable, Dict, FrozenSet, Optional, Set, Tuple
+
+
+_MISSING = object()
+
+
+class StateSnapshot(dict):
+    """
+    A state dict produced by IncrementalState. The same object is returned for as long as
+    the state does not change, so consumers can skip work with an identity check; treat it
+    as read-only.
+
+    Attributes:
+        version (int): Version of the IncrementalState the snapshot was taken at.
+    """
+    __slots__ = ("version",)
+
+    def __init__(self, *args: Any, version: int = 0, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.version = version
+
+
+class IncrementalState:
+    """
+    A worker or agent state that is updated key by key instead of rebuilt on every step.
+
+    Keys are either set directly (e.g. from a plugin's event handler) or computed by
+    registered providers, which only run again once their key is invalidated (or on every
+    step if registered with `every_step=True`). The instance is itself a state function, so
+    it can be passed as `get_state_fn`/`get_agent_state_fn`: each call recomputes the
+    invalidated keys and returns a StateSnapshot - the previous snapshot object if nothing
+    changed, otherwise a shallow copy with the changed keys replaced.
+
+    Args:
+        initial (Optional[Dict[str, Any]]): Initial keys and values.
+
+    Attributes:
+        version (int): Incremented every time a refresh changes the state.
+        last_changed (FrozenSet[str]): Keys changed by the last refresh (empty if unchanged).
+
+    Example:
+        ```python
+        state = IncrementalState({"wallet": "0x..."})
+        state.register("jobs", lambda function_result: acp_client.get_jobs())
+        state.register("clock", lambda function_result: time.time(), every_step=True)
+
+        def accept_job(job_id, **kwargs):
+            ...
+            state.invalidate("jobs")  # recomputed on the next step only
+            return FunctionResultStatus.DONE, "accepted", {}
+
+        worker = WorkerConfig(..., get_state_fn=state, action_space=[...])
+        ```
+    """
+    def __init__(self, initial: Optional[Dict[str, Any]] = None):
+        self._lock = threading.RLock()
+        self._values: Dict[str, Any] = dict(initial or {})
+        self._providers: Dict[str, Tuple[Callable[[Any], Any], bool]] = {}
+        self._invalid: Set[str] = set()
+        # keys changed since the last snapshot (set, updated or deleted)
+        self._changed: Set[str] = set(self._values)
+        self._snapshot: Optional[StateSnapshot] = None
+        self.version = 0
+        self.last_changed: FrozenSet[str] = frozenset()
+
+    def register(self, key: str, provider: Callable[[Any], Any], every_step: bool = False):
+        """
+        Computes `key` with `provider(function_result)` on the next refresh and then
+        whenever it is invalidated (or on every refresh with `every_step`).
+        """
+        with self._lock:
+            self._providers[key] = (provider, every_step)
+            self._invalid.add(key)
+
+    def invalidate(self, *keys: str):
+        """Marks provider keys (all of them if none are given) to be recomputed on the next refresh"""
+        with self._lock:
+            self._invalid.update(keys or self._providers)
+
+    def set(self, key: str, value: Any):
+        """
+        Sets a key; the state only counts as changed if the value differs (by identity,
+        then equality). After mutating a value in place, call `touch(key)` instead.
+        """
+        with self._lock:
+            previous = self._values.get(key, _MISSING)
+            if previous is value or (previous is not _MISSING and previous == value):
+                return
+            self._values[key] = value
+            self._changed.add(key)
+
+    def touch(self, key: str):
+        """Marks a key as changed, e.g. after its value was mutated in place"""
+        with self._lock:
+            if key in self._values:
+                self._changed.add(key)
+
+    def update(self, values: Dict[str, Any]):
+        for key, value in values.items():
+            self.set(key, value)
+
+    def delete(self, key: str):
+        with self._lock:
+            if self._values.pop(key, _MISSING) is not _MISSING:
+                self._changed.add(key)
+            self._providers.pop(key, None)
+            self._invalid.discard(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            return self._values.get(key, default)
+
+    @property
+    def unchanged(self) -> bool:
+        """Whether the last refresh left the state as it was"""
+        return not self.last_changed
+
+    def refresh(self, function_result: Any = None) -> StateSnapshot:
+        """
+        Recomputes the invalidated keys and returns the current snapshot. Providers run
+        without holding the lock, so `set()` from other threads does not wait for them.
+        """
+        with self._lock:
+            stale = [
+                (key, provider) for key, (provider, every_step) in self._providers.items()
+                if every_step or key in self._invalid
+            ]
+            self._invalid.difference_update(key for key, _ in stale)
+
+        values = []
+        try:
+            for key, provider in stale:
+                values.append((key, provider, provider(function_result)))
+        except BaseException:
+            # nothing is applied; all of them are recomputed on the next refresh
+            self.invalidate(*(key for key, _ in stale))
+            raise
+
+        with self._lock:
+            for key, provider, value in values:
+                # skip keys deleted or re-registered while their provider ran
+                registered = self._providers.get(key)
+                if registered is not None and registered[0] is provider:
+                    self.set(key, value)
+
+            if self._snapshot is not None and not self._changed:
+                self.last_changed = frozenset()
+                return self._snapshot
+
+            self.version += 1
+            snapshot = StateSnapshot(self._snapshot or {}, version=self.version)
+            for key in self._changed:
+                value = self._values.get(key, _MISSING)
+                if value is _MISSING:
+                    snapshot.pop(key, None)
+                else:
+                    snapshot[key] = value
+            self.last_changed = frozenset(self._changed)
+            self._changed.clear()
+            self._snapshot = snapshot
+            return snapshot
+
+    def __call__(self, function_result: Any, current_state: Any = None) -> StateSnapshot:
+        return self.refresh(function_result)
+
+
+class StateWithInstructions:
+    """
+    State function wrapper that puts the owner's (worker's) current `instruction` into the
+    state under "instructions", as `WorkerConfig` and `Worker` do for every state function.
+
+    When the wrapped function returns the same StateSnapshot as last time and the
+    instructions did not change, the previous merged state is returned as is, so an
+    unchanged IncrementalState is not copied on every step.
+    """
+    def __init__(self, get_state_fn: Callable, owner: Any):
+        self.get_state_fn = get_state_fn
+        self._owner = owner
+        self._last: Optional[Tuple[Any, Any, Dict[str, Any]]] = None
+
+    def __call__(self, function_result: Any, current_state: Any) -> Dict[str, Any]:
+        state = self.get_state_fn(function_result, current_state)
+        instructions = self._owner.instruction
+        if not isinstance(state, StateSnapshot):
+            # instructions are set up in the state, the rest of the state function output follows
+            return {"instructions": instructions, **state}
+
+        last = self._last
+        if last is not None and last[0] is state and last[1] == instructions:
+            return last[2]
+        merged = StateSnapshot({"instructions": instructions, **state}, version=state.version)
+        self._last = (state, instructions, merged)
+        return merged
@@ -0,0 +1,330 @@
+"""
+Local stand-in for the GAME V2 API, for offline load testing and benchmarks.
+
+Serves the routes used by GAMEClientV2 and returns scripted or randomized (but valid)
+ActionResponse payloads, with configurable latency and error injection. Point the SDK at
+it with the `GAME_API_BASE_URL` environment variable (or the client's `base_url`):
+
+    python -m game_sdk.game.mock_server --port 8765 --latency 0.05 --error-rate 0.01
+    GAME_API_BASE_URL=http://127.0.0.1:8765/v2 python my_agent.py
+"""
+import argparse
+import itertools
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+
+_ROUTES = [
+    ("create_agent", re.compile(r"^/v2/agents$")),
+    ("create_workers", re.compile(r"^/v2/maps$")),
+    ("set_worker_task", re.compile(r"^/v2/agents/(?P<agent_id>[^/]+)/tasks$")),
+    ("get_worker_action", re.compile(r"^/v2/agents/(?P<agent_id>[^/]+)/tasks/(?P<submission_id>[^/]+)/next$")),
+    ("get_agent_action", re.compile(r"^/v2/agents/(?P<agent_id>[^/]+)/actions$")),
+    ("create_chat", re.compile(r"^/v2/conversation$")),
+    ("update_chat", re.compile(r"^/v2/conversation/(?P<conversation_id>[^/]+)/next$")),
+    ("report_function", re.compile(r"^/v2/conversation/(?P<conversation_id>[^/]+)/function/result$")),
+    ("end_chat", re.compile(r"^/v2/conversation/(?P<conversation_id>[^/]+)/end$")),
+]
+
+
+class MockGAMEServer:
+    """
+    Threaded HTTP server implementing the GAME V2 routes used by GAMEClientV2.
+
+    Args:
+        host (str): Interface to bind.
+        port (int): Port to bind (0 picks a free port).
+        latency (Union[float, Tuple[float, float]]): Delay in seconds added to every
+            response, either fixed or a (min, max) range sampled uniformly.
+        error_rate (float): Probability that a request fails with one of `error_statuses`.
+        error_statuses (Sequence[int]): Status codes used for injected errors (429 responses
+            carry a `Retry-After` header).
+        script (Optional[List[dict]]): ActionResponse payloads returned in order (cycled) for
+            agent and worker actions instead of randomized ones.
+        wait_probability (float): Probability that a randomized action is WAIT.
+        go_to_probability (float): Probability that a randomized agent action is GO_TO
+            another worker (only if the agent's map has more than one worker).
+        seed (Optional[int]): Seed for the randomized responses and injected errors.
+
+    Attributes:
+        requests (Counter): Number of requests served per route name.
+
+    Example:
+        ```python
+        with MockGAMEServer(latency=(0.02, 0.2), error_rate=0.01) as server:
+            os.environ["GAME_API_BASE_URL"] = server.base_url
+            agent = Agent(api_key="apt-local", ...)
+        ```
+    """
+    def __init__(self,
+                 host: str = "127.0.0.1",
+                 port: int = 0,
+                 latency: Union[float, Tuple[float, float]] = 0.0,
+                 error_rate: float = 0.0,
+                 error_statuses: Sequence[int] = (500,),
+                 script: Optional[List[Dict[str, Any]]] = None,
+                 wait_probability: float = 0.1,
+                 go_to_probability: float = 0.0,
+                 seed: Optional[int] = None,
+                 ):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.script = script
+        self.wait_probability = wait_probability
+        self.go_to_probability = go_to_probability
+        self.requests: Counter = Counter()
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._script_index = itertools.count()
+        # map id -> worker (location) ids, used for GO_TO actions
+        self._maps: Dict[str, List[str]] = {}
+
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to give GAMEClientV2 (`GAME_API_BASE_URL`)"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v2"
+
+    def start(self) -> "MockGAMEServer":
+        """Starts serving on a background thread"""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="game-mock-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops serving and closes the socket"""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def serve_forever(self):
+        """Serves on the calling thread until interrupted"""
+        self._server.serve_forever()
+
+    def __enter__(self) -> "MockGAMEServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # send headers and body in one write and without Nagle delays
+            wbufsize = -1
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                try:
+                    body = json.loads(raw) if raw else {}
+                except ValueError:
+                    self._respond(400, {"error": "invalid JSON body"})
+                    return
+                status, payload, headers = server._handle(self.path, body)
+                self._respond(status, payload, headers)
+
+            def _respond(self, status: int, payload: Any, headers: Optional[Dict[str, str]] = None):
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def _handle(self, path: str, body: Dict[str, Any]) -> Tuple[int, Any, Dict[str, str]]:
+        path = path.split("?", 1)[0].rstrip("/")
+        for name, pattern in _ROUTES:
+            match = pattern.match(path)
+            if match:
+                break
+        else:
+            return 404, {"error": f"unknown route {path}"}, {}
+
+        with self._lock:
+            self.requests[name] += 1
+            delay = self._sample_latency()
+            failed = self._random.random() < self.error_rate
+            status = self._random.choice(self.error_statuses) if failed else 200
+
+        if delay:
+            time.sleep(delay)
+        if failed:
+            headers = {"Retry-After": "1"} if status == 429 else {}
+            return status, {"error": f"injected error ({status})"}, headers
+
+        data = body.get("data") or {}
+        handler = getattr(self, f"_{name}")
+        return 200, {"data": handler(data, **match.groupdict())}, {}
+
+    def _sample_latency(self) -> float:
+        if isinstance(self.latency, (tuple, list)):
+            return self._random.uniform(*self.latency)
+        return self.latency
+
+    # route handlers
+
+    def _create_agent(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {"id": str(uuid.uuid4())}
+
+    def _create_workers(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        map_id = str(uuid.uuid4())
+        with self._lock:
+            self._maps[map_id] = [loc["id"] for loc in data.get("locations", [])]
+        return {"id": map_id}
+
+    def _set_worker_task(self, data: Dict[str, Any], agent_id: str) -> Dict[str, Any]:
+        return {"submission_id": str(uuid.uuid4())}
+
+    def _get_worker_action(self, data: Dict[str, Any], agent_id: str, submission_id: str) -> Dict[str, Any]:
+        return self._next_action(data.get("functions") or [], location=None, locations=[])
+
+    def _get_agent_action(self, data: Dict[str, Any], agent_id: str) -> Dict[str, Any]:
+        with self._lock:
+            locations = self._maps.get(data.get("map_id"), [])
+        return self._next_action(
+            data.get("functions") or [], location=data.get("location"), locations=locations
+        )
+
+    def _create_chat(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {"conversation_id": str(uuid.uuid4())}
+
+    def _update_chat(self, data: Dict[str, Any], conversation_id: str) -> Dict[str, Any]:
+        functions = data.get("functions") or []
+        with self._lock:
+            call_function = functions and self._random.random() >= self.wait_probability
+            function = self._random.choice(functions) if call_function else None
+        if function is not None:
+            return {
+                "message": None,
+                "is_finished": False,
+                "function_call": {
+                    "id": str(uuid.uuid4()),
+                    "fn_name": function["fn_name"],
+                    "args": {arg["name"]: f"mock {arg['name']}" for arg in function.get("args", [])},
+                },
+            }
+        return {"message": f"Mock reply to: {data.get('message')}", "is_finished": False}
+
+    def _report_function(self, data: Dict[str, Any], conversation_id: str) -> Dict[str, Any]:
+        return {"message": f"Mock follow-up on {data.get('fn_id')}: {data.get('result')}"}
+
+    def _end_chat(self, data: Dict[str, Any], conversation_id: str) -> Dict[str, Any]:
+        return {}
+
+    def _next_action(self, functions: List[Dict[str, Any]], location: Optional[str], locations: List[str]) -> Dict[str, Any]:
+        if self.script:
+            return self.script[next(self._script_index) % len(self.script)]
+
+        with self._lock:
+            roll = self._random.random()
+            other_locations = [loc for loc in locations if loc != location]
+            if not functions or roll < self.wait_probability:
+                action = {"action_type": "wait", "action_args": None}
+            elif other_locations and roll < self.wait_probability + self.go_to_probability:
+                action = {
+                    "action_type": "go_to",
+                    "action_args": {"location_id": self._random.choice(other_locations)},
+                }
+            else:
+                function = self._random.choice(functions)
+                action = {
+                    "action_type": "call_function",
+                    "action_args": {
+                        "fn_id": str(uuid.uuid4()),
+                        "fn_name": function["fn_name"],
+                        "args": {
+                            arg["name"]: {"value": f"mock {arg['name']}"}
+                            for arg in function.get("args", [])
+                        },
+                    },
+                }
+
+        step_id = str(uuid.uuid4())
+        action["agent_state"] = {
+            "hlp": {
+                "plan_id": step_id,
+                "observation_reflection": "Mock observation reflection",
+                "plan": ["Mock plan step"],
+                "plan_reasoning": "Mock plan reasoning",
+                "current_state_of_execution": "Mock execution state",
+                "change_indicator": None,
+                "log": [],
+            },
+            "current_task": {
+                "task_id": step_id,
+                "task": "Mock task",
+                "task_reasoning": "Mock task reasoning",
+                "task_result": None,
+                "location_id": location or "*not provided*",
+            },
+        }
+        return action
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the GAME V2 API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, nargs="+", default=[0.0],
+                        help="fixed latency in seconds, or MIN MAX for a uniform range")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, nargs="+", default=[500])
+    parser.add_argument("--wait-probability", type=float, default=0.1)
+    parser.add_argument("--go-to-probability", type=float, default=0.0)
+    parser.add_argument("--script", help="JSON file with a list of ActionResponse payloads")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    script = None
+    if args.script:
+        with open(args.script, encoding="utf-8") as f:
+            script = json.load(f)
+
+    server = MockGAMEServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency[0] if len(args.latency) == 1 else tuple(args.latency[:2]),
+        error_rate=args.error_rate,
+        error_statuses=args.error_status,
+        script=script,
+        wait_probability=args.wait_probability,
+        go_to_probability=args.go_to_probability,
+        seed=args.seed,
+    )
+    print(f"Mock GAME API listening - set GAME_API_BASE_URL={server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
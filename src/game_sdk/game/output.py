@@ -0,0 +1,105 @@
+import contextlib
+import contextvars
+import json
+import logging
+import os
+from typing import Any, Callable, Iterator, Optional, Union
+
+
+logger = logging.getLogger("game_sdk")
+
+OUTPUT_MODES = ("none", "log", "rich")
+
+
+class Output:
+    """
+    Output sink for what agents, workers and functions report while running.
+
+    Modes:
+        none: Nothing is formatted or written.
+        log: One structured record per event on the `game_sdk` logger
+            (`<event> {"key": value, ...}`), only built if the logger is enabled for the level.
+        rich: Human-readable output on stdout (rich panels for agent steps) - the default.
+
+    Text is passed as zero-argument callables so it is only built in `rich` mode.
+
+    Args:
+        mode (str): One of "none", "log" or "rich".
+    """
+    def __init__(self, mode: str = "rich"):
+        if mode not in OUTPUT_MODES:
+            raise ValueError(f"Unknown output mode: {mode} (expected one of {OUTPUT_MODES})")
+        self.mode = mode
+
+    @property
+    def renders(self) -> bool:
+        """Whether human-readable text is consumed (callers can skip building it otherwise)."""
+        return self.mode == "rich"
+
+    def panel(self, event: str, title: str, render: Callable[[], str], level: int = logging.INFO, **fields: Any):
+        """
+        Reports an event that is shown as a rich panel in `rich` mode.
+        """
+        if self.mode == "rich":
+            from rich import print as rich_print, box
+            from rich.panel import Panel
+
+            rich_print(Panel(render(), title=title, box=box.ROUNDED, title_align="left"))
+        elif self.mode == "log":
+            self._log(event, level, fields)
+
+    def message(self, event: str, render: Callable[[], str], level: int = logging.INFO, **fields: Any):
+        """
+        Reports an event that is printed as plain text in `rich` mode.
+        """
+        if self.mode == "rich":
+            print(render())
+        elif self.mode == "log":
+            self._log(event, level, fields)
+
+    def _log(self, event: str, level: int, fields: dict):
+        if logger.isEnabledFor(level):
+            logger.log(level, "%s %s", event, json.dumps(fields, default=str))
+
+
+_output = Output(os.environ.get("GAME_SDK_OUTPUT", "rich"))
+# sink of the agent/worker currently executing a function (overrides the process-wide one)
+_current_output: contextvars.ContextVar = contextvars.ContextVar("game_sdk_output", default=None)
+
+
+def get_output() -> Output:
+    """Returns the output sink of the running agent/worker, or the process-wide one"""
+    return _current_output.get() or _output
+
+
+@contextlib.contextmanager
+def use_output(output: Optional[Output]) -> Iterator[None]:
+    """
+    Makes `output` the sink returned by `get_output` inside the block (no-op for None).
+    """
+    if output is None:
+        yield
+        return
+    token = _current_output.set(output)
+    try:
+        yield
+    finally:
+        _current_output.reset(token)
+
+
+def set_output(output: Union[str, Output]) -> Output:
+    """
+    Sets the process-wide output sink used by agents, workers and functions that were not
+    given their own. Accepts an Output or a mode name ("none", "log", "rich").
+    """
+    global _output
+    _output = resolve_output(output)
+    return _output
+
+
+def resolve_output(output: Optional[Union[str, Output]]) -> Output:
+    if output is None:
+        return get_output()
+    if isinstance(output, Output):
+        return output
+    return Output(output)
@@ -0,0 +1,224 @@
+import hashlib
+import os
+import struct
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Optional, Tuple
+
+from game_sdk.game import tracing
+
+
+# API calls sharing a budget; calls not listed here are not rate limited
+ENDPOINT_BUCKETS = {
+    "get_agent_action": "agent_action",
+    "get_worker_action": "worker_action",
+    "create_chat": "chat",
+    "update_chat": "chat",
+    "report_function": "chat",
+    "end_chat": "chat",
+}
+
+
+class RateLimit:
+    """
+    A request budget: `rate` requests per second on average, with bursts of up to
+    `burst` requests.
+    """
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+
+    def __repr__(self) -> str:
+        return f"RateLimit(rate={self.rate}, burst={self.burst})"
+
+
+class TokenBucket:
+    """
+    In-process token bucket that hands out reservations instead of rejecting requests.
+
+    Each `reserve()` books the next free slot and returns how long the caller must wait
+    for it, so waiting callers are served in arrival order (virtual scheduling: the
+    bucket tracks the time at which it will next have a token).
+    """
+    def __init__(self, limit: RateLimit):
+        self.limit = limit
+        self._interval = 1.0 / limit.rate
+        self._tolerance = (limit.burst - 1) * self._interval
+        self._lock = threading.Lock()
+        self._next_free = 0.0
+
+    def reserve(self) -> float:
+        """Reserves one request slot; returns the delay in seconds before using it"""
+        with self._lock:
+            now = time.monotonic()
+            next_free = max(self._next_free, now)
+            self._next_free = next_free + self._interval
+            return max(0.0, next_free - self._tolerance - now)
+
+
+class FileTokenBucket:
+    """
+    Token bucket whose state lives in a small file guarded by `fcntl.flock`, shared by
+    every process using the same path (POSIX only).
+    """
+    _STATE = struct.Struct("d")
+
+    def __init__(self, limit: RateLimit, path: str):
+        try:
+            import fcntl
+        except ImportError:
+            raise ImportError("Cross-process rate limits need fcntl (POSIX); omit `path` to limit per process")
+        self._fcntl = fcntl
+        self.limit = limit
+        self.path = path
+        self._interval = 1.0 / limit.rate
+        self._tolerance = (limit.burst - 1) * self._interval
+        # flock is per open file description, so threads of this process still need a lock
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserves one request slot; returns the delay in seconds before using it"""
+        with self._lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                self._fcntl.flock(fd, self._fcntl.LOCK_EX)
+                raw = os.pread(fd, self._STATE.size, 0)
+                next_free = self._STATE.unpack(raw)[0] if len(raw) == self._STATE.size else 0.0
+                # wall clock: monotonic clocks are not comparable across processes
+                now = time.time()
+                next_free = max(next_free, now)
+                os.pwrite(fd, self._STATE.pack(next_free + self._interval), 0)
+                return max(0.0, next_free - self._tolerance - now)
+            finally:
+                os.close(fd)
+
+
+class RateLimiter:
+    """
+    Client-side rate limits shared by all GAME clients using the same API key.
+
+    Requests are grouped into budgets (see `ENDPOINT_BUCKETS`): `agent_action`,
+    `worker_action` and `chat`. A request over budget waits for its turn (first come,
+    first served) instead of failing. Budgets without a RateLimit are unlimited.
+
+    Args:
+        agent_action (Optional[RateLimit]): Budget for `get_agent_action`.
+        worker_action (Optional[RateLimit]): Budget for `get_worker_action`.
+        chat (Optional[RateLimit]): Budget shared by the chat endpoints.
+        path (Optional[str]): Directory for bucket state files, to share the budgets with
+            other processes on this machine (POSIX only). In-process if None.
+    """
+    def __init__(self,
+                 agent_action: Optional[RateLimit] = None,
+                 worker_action: Optional[RateLimit] = None,
+                 chat: Optional[RateLimit] = None,
+                 path: Optional[str] = None,
+                 ):
+        self.limits: Dict[str, RateLimit] = {
+            name: limit
+            for name, limit in (("agent_action", agent_action), ("worker_action", worker_action), ("chat", chat))
+            if limit is not None
+        }
+        self.path = path
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+        self._buckets: Dict[Tuple[str, str], object] = {}
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: {"requests": 0, "delayed": 0, "wait_seconds": 0.0}
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.limits)
+
+    def reserve(self, api_key: str, endpoint: str) -> float:
+        """
+        Reserves a slot for one `endpoint` call with `api_key`; returns the delay in seconds
+        to wait before sending it (0 if the endpoint is not limited).
+        """
+        bucket_name = ENDPOINT_BUCKETS.get(endpoint)
+        if bucket_name is None or bucket_name not in self.limits:
+            return 0.0
+        delay = self._bucket(api_key, bucket_name).reserve()
+        with self._stats_lock:
+            stats = self._stats[bucket_name]
+            stats["requests"] += 1
+            if delay > 0:
+                stats["delayed"] += 1
+                stats["wait_seconds"] += delay
+        return delay
+
+    def acquire(self, api_key: str, endpoint: str):
+        """Blocks until one `endpoint` call with `api_key` may be sent"""
+        delay = self.reserve(api_key, endpoint)
+        if delay > 0:
+            with tracing.span("rate_limit.wait", endpoint=endpoint, delay=delay):
+                time.sleep(delay)
+
+    async def aacquire(self, api_key: str, endpoint: str):
+        """Async counterpart of `acquire`"""
+        import asyncio
+
+        delay = self.reserve(api_key, endpoint)
+        if delay > 0:
+            with tracing.span("rate_limit.wait", endpoint=endpoint, delay=delay):
+                await asyncio.sleep(delay)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Requests, delayed requests and total wait time per budget (this process only)"""
+        with self._stats_lock:
+            return {name: dict(stats) for name, stats in self._stats.items()}
+
+    def _bucket(self, api_key: str, bucket_name: str):
+        # keyed by a digest so API keys never end up in file names
+        key_digest = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+        key = (key_digest, bucket_name)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    limit = self.limits[bucket_name]
+                    if self.path is None:
+                        bucket = TokenBucket(limit)
+                    else:
+                        bucket = FileTokenBucket(
+                            limit, os.path.join(self.path, f"{key_digest}-{bucket_name}.bucket")
+                        )
+                    self._buckets[key] = bucket
+        return bucket
+
+
+_default_rate_limiter: Optional[RateLimiter] = None
+_default_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Returns the process-wide RateLimiter shared by every client that was not given its own
+    (unlimited until `configure_rate_limits` is called).
+    """
+    global _default_rate_limiter
+    if _default_rate_limiter is None:
+        with _default_rate_limiter_lock:
+            if _default_rate_limiter is None:
+                _default_rate_limiter = RateLimiter()
+    return _default_rate_limiter
+
+
+def configure_rate_limits(**kwargs) -> RateLimiter:
+    """
+    Replaces the process-wide RateLimiter with one built from the given options, e.g.
+    `configure_rate_limits(agent_action=RateLimit(rate=2, burst=5), chat=RateLimit(rate=10))`.
+
+    Clients created before this call keep the limiter they were created with.
+    """
+    global _default_rate_limiter
+    with _default_rate_limiter_lock:
+        _default_rate_limiter = RateLimiter(**kwargs)
+    return _default_rate_limiter
@@ -0,0 +1,148 @@
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # not POSIX: writes are only serialized within the process
+    fcntl = None
+
+logger = logging.getLogger("game_sdk")
+
+REGISTRY_VERSION = 1
+
+
+def registration_key(kind: str, api_key: str, base_url: str, *parts: Any) -> str:
+    """
+    Digest identifying a remote registration: the kind of object ("agent", "map"), the
+    API key and server it was created with, and the configuration it was created from.
+    """
+    data = json.dumps([kind, api_key, base_url, *parts], separators=(",", ":"), sort_keys=True)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class AgentRegistry:
+    """
+    On-disk record of agents and worker maps already created on the GAME API, so a
+    restarted process with the same configuration reuses their IDs instead of creating
+    new remote objects.
+
+    Entries are keyed by a digest of the API key and the configuration (name, description,
+    goal, worker descriptions); any change to them results in a new registration. The file
+    is rewritten atomically under an `fcntl.flock` on a "<path>.lock" file, so it can be
+    shared by processes on the same machine. A corrupt file is treated as empty.
+
+    Args:
+        path (str): JSON file holding the registrations (created on first write).
+
+    Example:
+        ```python
+        agent = Agent(..., registry="~/.game/registry.json")
+        agent.compile()  # network-free after the first run, until the config changes
+        ```
+    """
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns the registered remote ID for `key`, if any"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                # another process may have registered it since we loaded the file
+                self._entries = self._load()
+                entry = self._entries.get(key)
+            return entry["id"] if entry else None
+
+    def put(self, key: str, remote_id: str, kind: str):
+        """Records `remote_id` as the registration for `key`"""
+        with self._lock, self._file_lock():
+            entries = self._load()
+            entries[key] = {"kind": kind, "id": remote_id, "created_at": time.time()}
+            self._save(entries)
+            self._entries = entries
+
+    def get_or_create(self, key: str, kind: str, create: Callable[[], str]) -> str:
+        """Returns the registered ID for `key`, calling `create()` and recording it if missing"""
+        remote_id = self.get(key)
+        if remote_id is None:
+            remote_id = create()
+            self.put(key, remote_id, kind)
+        return remote_id
+
+    def invalidate(self, key: str):
+        """Forgets one registration (e.g. after the remote object was deleted)"""
+        with self._lock, self._file_lock():
+            entries = self._load()
+            if entries.pop(key, None) is not None:
+                self._save(entries)
+            self._entries = entries
+
+    def clear(self):
+        """Forgets all registrations"""
+        with self._lock, self._file_lock():
+            self._entries = {}
+            self._save(self._entries)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            # unreadable registry - start over rather than fail agent creation
+            logger.warning("Ignoring unreadable agent registry %s: %s", self.path, e)
+            return {}
+        if not isinstance(data, dict) or not isinstance(data.get("entries", {}), dict):
+            logger.warning("Ignoring malformed agent registry %s", self.path)
+            return {}
+        if data.get("version") != REGISTRY_VERSION:
+            return {}
+        return {
+            key: entry for key, entry in data.get("entries", {}).items()
+            if isinstance(entry, dict) and isinstance(entry.get("id"), str)
+        }
+
+    @contextlib.contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Serializes read-modify-write of the file across processes"""
+        if fcntl is None:
+            yield
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        # a separate file, as the registry itself is replaced on every write
+        fd = os.open(self.path + ".lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
+
+    def _save(self, entries: Dict[str, Dict[str, Any]]):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".registry-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": REGISTRY_VERSION, "entries": entries}, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def resolve_registry(registry: Union[str, AgentRegistry, None]) -> Optional[AgentRegistry]:
+    """Accepts a registry or a path to one"""
+    if registry is None or isinstance(registry, AgentRegistry):
+        return registry
+    return AgentRegistry(registry)
@@ -0,0 +1,368 @@
+import random
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from game_sdk.game import tracing
+
+
+# statuses that mean the request was rejected before being processed
+_REJECTED_STATUSES = (429,)
+
+
+def _connection_errors() -> Tuple[type, ...]:
+    # requests' ConnectionError/Timeout are OSErrors; httpx errors are not
+    errors: Tuple[type, ...] = (OSError,)
+    try:
+        import httpx
+    except ImportError:
+        return errors
+    return errors + (httpx.TransportError,)
+
+
+async def _async_sleep(delay: float):
+    # asyncio is only imported by async callers
+    import asyncio
+
+    await asyncio.sleep(delay)
+
+
+class CircuitOpenError(ValueError):
+    """Raised instead of calling an endpoint whose circuit breaker is open"""
+
+
+class RetryPolicy:
+    """
+    When and how long to wait before retrying a failed GAME API call.
+
+    Responses with a status in `retry_statuses` and connection errors are retried with
+    exponential backoff and full jitter; a `Retry-After` header takes precedence over the
+    computed delay. Action calls (getting the next agent/worker action, chat turns) and
+    calls that create resources are not idempotent: they are only retried on 429 unless
+    `retry_non_idempotent` is set, since a 5xx or a dropped connection may come after the
+    server already acted on the request.
+
+    Args:
+        max_attempts (int): Total attempts per call, including the first (1 disables retries).
+        backoff_base (float): Delay in seconds before the first retry (doubled each attempt).
+        backoff_max (float): Upper bound in seconds for any single delay, `Retry-After` included.
+        jitter (bool): Whether delays are drawn uniformly from [0, backoff] (full jitter).
+        retry_statuses (Tuple[int, ...]): Response statuses considered transient.
+        retry_non_idempotent (bool): Whether non-idempotent calls are retried on 5xx and
+            connection errors too.
+    """
+    def __init__(self,
+                 max_attempts: int = 3,
+                 backoff_base: float = 0.5,
+                 backoff_max: float = 30.0,
+                 jitter: bool = True,
+                 retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504),
+                 retry_non_idempotent: bool = False,
+                 ):
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retry_statuses = tuple(retry_statuses)
+        self.retry_non_idempotent = retry_non_idempotent
+        self._random = random.Random()
+
+    def should_retry(self, status: Optional[int], idempotent: bool) -> bool:
+        """
+        Whether a call that ended with `status` (None for a connection error) may be retried.
+        """
+        if status is not None and status not in self.retry_statuses:
+            return False
+        if status in _REJECTED_STATUSES:
+            return True
+        return idempotent or self.retry_non_idempotent
+
+    def delay(self, attempt: int, response: Any = None) -> float:
+        """Seconds to wait before retry number `attempt` (starting at 1)"""
+        retry_after = _retry_after(response)
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        backoff = min(self.backoff_base * (2 ** (attempt - 1)), self.backoff_max)
+        return self._random.uniform(0, backoff) if self.jitter else backoff
+
+
+def _retry_after(response: Any) -> Optional[float]:
+    if response is None:
+        return None
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    import email.utils
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class CircuitBreaker:
+    """
+    Stops calling an endpoint after repeated failures, so a struggling backend is not hit
+    by every agent in the process at once.
+
+    After `failure_threshold` consecutive failed calls the circuit opens and calls fail
+    fast with CircuitOpenError. After `reset_timeout` seconds one trial call is let
+    through (half-open): its success closes the circuit, its failure opens it again, and
+    a neutral outcome (a client error) lets the next call be the trial.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may be made now (reserves the trial call when half-open)"""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_neutral(self):
+        """Records a call that says nothing about the endpoint's health (e.g. a 4xx)"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self) -> bool:
+        """Records a failed call; returns True if this failure opened the circuit"""
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._state == self.HALF_OPEN or (
+                self._state == self.CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                return True
+            return False
+
+
+class ResilienceMetrics:
+    """
+    Thread-safe per-endpoint counters.
+
+    Attributes (per endpoint, see `as_dict`):
+        calls: Client calls made.
+        attempts: HTTP requests sent for them (calls + retries).
+        retries: Requests repeated after a transient failure.
+        failures: Calls that still failed after all their attempts.
+        short_circuited: Calls rejected because the circuit was open.
+        circuit_opened: Times the endpoint's circuit opened.
+    """
+    _FIELDS = ("calls", "attempts", "retries", "failures", "short_circuited", "circuit_opened")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[str, int]] = defaultdict(lambda: dict.fromkeys(self._FIELDS, 0))
+
+    def record(self, endpoint: str, field: str):
+        with self._lock:
+            self._counters[endpoint][field] += 1
+
+    def as_dict(self) -> Dict[str, Dict[str, float]]:
+        """Counters per endpoint, plus `retry_amplification` (attempts per call sent)"""
+        with self._lock:
+            result: Dict[str, Dict[str, float]] = {}
+            for endpoint, counters in self._counters.items():
+                result[endpoint] = dict(counters)
+                sent = counters["calls"] - counters["short_circuited"]
+                result[endpoint]["retry_amplification"] = counters["attempts"] / sent if sent else 0.0
+            return result
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+
+
+class Resilience:
+    """
+    Retry policy, per-endpoint circuit breakers and metrics applied to GAME API calls.
+
+    One instance is shared process-wide by all clients not given their own (see
+    `get_resilience`/`configure_resilience`), so every agent sees the same circuit state.
+
+    Args:
+        retry (Optional[RetryPolicy]): Retry policy (default: `RetryPolicy()`).
+        failure_threshold (int): Consecutive failures that open an endpoint's circuit
+            (0 disables circuit breaking).
+        reset_timeout (float): Seconds an open circuit waits before a trial call.
+    """
+    def __init__(self,
+                 retry: Optional[RetryPolicy] = None,
+                 failure_threshold: int = 5,
+                 reset_timeout: float = 30.0,
+                 ):
+        self.retry = retry or RetryPolicy()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.metrics = ResilienceMetrics()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._breakers_lock = threading.Lock()
+        self._connection_errors = _connection_errors()
+
+    def breaker(self, endpoint: str) -> Optional[CircuitBreaker]:
+        """The circuit breaker of an endpoint (None if circuit breaking is disabled)"""
+        if self.failure_threshold <= 0:
+            return None
+        with self._breakers_lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = self._breakers[endpoint] = CircuitBreaker(
+                    self.failure_threshold, self.reset_timeout
+                )
+            return breaker
+
+    def call(self, endpoint: str, send: Callable[[], Any], idempotent: bool = False) -> Any:
+        """
+        Calls `send()` (which performs one HTTP request and returns its response) with
+        retries. Returns the last response, successful or not; re-raises the last
+        connection error if every attempt failed with one.
+        """
+        breaker = self._start(endpoint)
+        attempt = 0
+        while True:
+            attempt += 1
+            self.metrics.record(endpoint, "attempts")
+            response, error = None, None
+            try:
+                response = send()
+            except self._connection_errors as e:
+                error = e
+            delay = self._after_attempt(endpoint, breaker, attempt, response, idempotent)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return response
+            with tracing.span("http.retry", endpoint=endpoint, attempt=attempt, delay=delay):
+                time.sleep(delay)
+
+    async def acall(self, endpoint: str, send: Callable[[], Awaitable[Any]], idempotent: bool = False) -> Any:
+        """Async counterpart of `call` (`send` returns an awaitable)"""
+        breaker = self._start(endpoint)
+        attempt = 0
+        while True:
+            attempt += 1
+            self.metrics.record(endpoint, "attempts")
+            response, error = None, None
+            try:
+                response = await send()
+            except self._connection_errors as e:
+                error = e
+            delay = self._after_attempt(endpoint, breaker, attempt, response, idempotent)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return response
+            with tracing.span("http.retry", endpoint=endpoint, attempt=attempt, delay=delay):
+                await _async_sleep(delay)
+
+    def _start(self, endpoint: str) -> Optional[CircuitBreaker]:
+        self.metrics.record(endpoint, "calls")
+        breaker = self.breaker(endpoint)
+        if breaker is not None and not breaker.allow():
+            self.metrics.record(endpoint, "short_circuited")
+            raise CircuitOpenError(
+                f"Circuit open for {endpoint} after repeated failures; retrying in up to {self.reset_timeout}s"
+            )
+        return breaker
+
+    def _after_attempt(self,
+                       endpoint: str,
+                       breaker: Optional[CircuitBreaker],
+                       attempt: int,
+                       response: Any,
+                       idempotent: bool,
+                       ) -> Optional[float]:
+        """Updates breaker and metrics; returns the delay before retrying, or None to stop"""
+        status = response.status_code if response is not None else None
+        if breaker is not None:
+            if status is None or status >= 500:
+                if breaker.record_failure():
+                    self.metrics.record(endpoint, "circuit_opened")
+            elif status < 400:
+                breaker.record_success()
+            else:
+                # client errors (4xx, 429 included) say nothing about the endpoint's health
+                breaker.record_neutral()
+        if status == 200:
+            return None
+
+        circuit_open = breaker is not None and breaker.state != CircuitBreaker.CLOSED
+        if (
+            attempt >= self.retry.max_attempts
+            or circuit_open
+            or not self.retry.should_retry(status, idempotent)
+        ):
+            self.metrics.record(endpoint, "failures")
+            return None
+
+        self.metrics.record(endpoint, "retries")
+        return self.retry.delay(attempt, response)
+
+
+_default_resilience: Optional[Resilience] = None
+_default_resilience_lock = threading.Lock()
+
+
+def get_resilience() -> Resilience:
+    """
+    Returns the process-wide Resilience shared by every client that was not given its own.
+    """
+    global _default_resilience
+    if _default_resilience is None:
+        with _default_resilience_lock:
+            if _default_resilience is None:
+                _default_resilience = Resilience()
+    return _default_resilience
+
+
+def configure_resilience(**kwargs) -> Resilience:
+    """
+    Replaces the process-wide Resilience with one built from the given options, e.g.
+    `configure_resilience(retry=RetryPolicy(max_attempts=5, retry_non_idempotent=True))`.
+
+    Clients created before this call keep the instance they were created with.
+    """
+    global _default_resilience
+    with _default_resilience_lock:
+        _default_resilience = Resilience(**kwargs)
+    return _default_resilience
@@ -0,0 +1,43 @@
+import json
+import uuid
+from typing import Any
+
+
+class RawJSON:
+    """
+    A pre-serialized JSON fragment that `dumps` splices into the output as-is.
+
+    Used for parts of a request body that rarely change (e.g. function definitions),
+    so they are serialized once instead of on every request.
+    """
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def __repr__(self) -> str:
+        return f"RawJSON({self.text!r})"
+
+
+_PLACEHOLDER = f"__game_sdk_raw_json_{uuid.uuid4().hex}_"
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serializes a request body to JSON, splicing in any RawJSON fragments verbatim.
+    """
+    fragments = []
+
+    def default(o: Any) -> Any:
+        if isinstance(o, RawJSON):
+            fragments.append(o.text)
+            return f"{_PLACEHOLDER}{len(fragments) - 1}"
+        raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+    text = json.dumps(obj, default=default, allow_nan=False)
+    for index, fragment in enumerate(fragments):
+        text = text.replace(f'"{_PLACEHOLDER}{index}"', fragment, 1)
+    return text
@@ -0,0 +1,226 @@
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from game_sdk.game.incremental_state import StateSnapshot
+
+
+class KeepNewest:
+    """
+    Keeps the newest `n` items of a list (e.g. the latest jobs or messages).
+
+    Args:
+        n (int): Items to keep.
+        newest_first (bool): Whether the list is ordered newest first (keeps the head)
+            instead of oldest first (keeps the tail, the default).
+    """
+    def __init__(self, n: int, newest_first: bool = False):
+        if n < 0:
+            raise ValueError("n must not be negative")
+        self.n = n
+        self.newest_first = newest_first
+
+    def apply(self, value: Any) -> Tuple[Any, Optional[str]]:
+        if not isinstance(value, list) or len(value) <= self.n:
+            return value, None
+        kept = value[:self.n] if self.newest_first else value[len(value) - self.n:]
+        return kept, f"kept newest {self.n} of {len(value)} items"
+
+    def __repr__(self) -> str:
+        return f"KeepNewest({self.n}, newest_first={self.newest_first})"
+
+
+class TruncateString:
+    """
+    Truncates strings to `max_chars` characters, including strings nested in lists and
+    dicts under the key.
+    """
+    def __init__(self, max_chars: int, suffix: str = "..."):
+        if max_chars < 0:
+            raise ValueError("max_chars must not be negative")
+        self.max_chars = max_chars
+        self.suffix = suffix
+
+    def apply(self, value: Any) -> Tuple[Any, Optional[str]]:
+        counter = [0]
+        truncated = self._truncate(value, counter)
+        if not counter[0]:
+            return value, None
+        return truncated, f"truncated {counter[0]} string(s) to {self.max_chars} chars"
+
+    def _truncate(self, value: Any, counter: List[int]) -> Any:
+        if isinstance(value, str):
+            if len(value) <= self.max_chars:
+                return value
+            counter[0] += 1
+            return value[:self.max_chars] + self.suffix
+        if isinstance(value, list):
+            return [self._truncate(item, counter) for item in value]
+        if isinstance(value, dict):
+            return {key: self._truncate(item, counter) for key, item in value.items()}
+        return value
+
+    def __repr__(self) -> str:
+        return f"TruncateString({self.max_chars})"
+
+
+class DropKey:
+    """Removes the key from the state."""
+    def apply(self, value: Any) -> Tuple[Any, Optional[str]]:
+        return _DROP, "dropped"
+
+    def __repr__(self) -> str:
+        return "DropKey()"
+
+
+_DROP = object()
+
+
+@dataclass
+class StateBudgetReport:
+    """
+    What a StateBudget did to one state.
+
+    Attributes:
+        original_chars (int): Serialized size of the state before trimming.
+        final_chars (int): Serialized size of the state sent to the GAME API.
+        trimmed (Dict[str, str]): What was trimmed, by dotted key path.
+        over_budget (bool): Whether the state is still larger than the budget after all
+            policies were applied.
+    """
+    original_chars: int
+    final_chars: int
+    trimmed: Dict[str, str] = field(default_factory=dict)
+    over_budget: bool = False
+
+
+class StateBudget:
+    """
+    Bounds the size of a worker or agent state sent to the GAME API on every step.
+
+    Policies are keyed by dotted paths into the state ("acp.jobs", "tweets"; "*" matches
+    any key at its level) and applied in the given order. With `max_chars`, policies are
+    only applied while the serialized state is over budget, so small states are sent
+    unchanged; without it, every policy is always applied. The state returned by the
+    state function is never modified - trimming works on a copy, so the next call of the
+    state function still gets the full current state.
+
+    Args:
+        max_chars (Optional[int]): Maximum size of the state serialized as JSON.
+        policies (Optional[Dict[str, Any]]): KeepNewest, TruncateString or DropKey (or any
+            object with a compatible `apply(value)`) per key path.
+
+    Example:
+        ```python
+        budget = StateBudget(
+            max_chars=20_000,
+            policies={
+                "acp.jobs": KeepNewest(20),
+                "tweets.*.text": TruncateString(280),
+                "debug": DropKey(),
+            },
+        )
+        ```
+    """
+    def __init__(self, max_chars: Optional[int] = None, policies: Optional[Dict[str, Any]] = None):
+        self.max_chars = max_chars
+        self.policies: Dict[str, Any] = dict(policies or {})
+        # last StateSnapshot, the budget settings and its result: an unchanged snapshot is
+        # not measured again while `max_chars` and `policies` stay the same
+        self._last: Optional[Tuple[Any, Tuple, Any, Optional[StateBudgetReport]]] = None
+
+    def apply(self, state: Any) -> Tuple[Any, Optional[StateBudgetReport]]:
+        """
+        Applies the budget to `state`. Returns the (possibly trimmed copy of the) state and
+        a report, or None instead of a report if nothing was trimmed and the state is within
+        budget.
+        """
+        if not isinstance(state, dict):
+            return state, None
+        settings = (self.max_chars, tuple(self.policies.items()))
+        last = self._last
+        if last is not None and last[0] is state and last[1] == settings:
+            return last[2], last[3]
+        trimmed, report = self._apply(state)
+        if isinstance(state, StateSnapshot):
+            self._last = (state, settings, trimmed, report)
+        return trimmed, report
+
+    def _apply(self, state: Dict[str, Any]) -> Tuple[Any, Optional[StateBudgetReport]]:
+        size = _size(state)
+        if self.max_chars is not None and size <= self.max_chars:
+            return state, None
+
+        report = StateBudgetReport(original_chars=size, final_chars=size)
+        for path, policy in self.policies.items():
+            state = _apply_at(state, path.split("."), policy, "", report.trimmed)
+            if self.max_chars is not None:
+                size = _size(state)
+                if size <= self.max_chars:
+                    break
+        report.final_chars = _size(state) if self.max_chars is None else size
+        report.over_budget = self.max_chars is not None and report.final_chars > self.max_chars
+        if not report.trimmed and not report.over_budget:
+            return state, None
+        return state, report
+
+    def __repr__(self) -> str:
+        return f"StateBudget(max_chars={self.max_chars}, policies={self.policies})"
+
+
+def _size(state: Any) -> int:
+    return len(json.dumps(state, default=str))
+
+
+def _apply_at(obj: Any, segments: List[str], policy: Any, prefix: str, trimmed: Dict[str, str]) -> Any:
+    """Applies `policy` at `segments` below `obj`; copies containers on the way instead of mutating them"""
+    if not isinstance(obj, dict):
+        return obj
+    head, rest = segments[0], segments[1:]
+    keys = list(obj) if head == "*" else [head] if head in obj else []
+    result = obj
+    for key in keys:
+        path = f"{prefix}{key}"
+        value = obj[key]
+        if rest:
+            if isinstance(value, list) and rest[0] == "*":
+                new_value = _apply_to_items(value, rest[1:], policy, path, trimmed)
+            else:
+                new_value = _apply_at(value, rest, policy, f"{path}.", trimmed)
+        else:
+            new_value, detail = policy.apply(value)
+            if detail is not None:
+                trimmed[path] = detail
+        if new_value is value:
+            continue
+        if result is obj:
+            result = dict(obj)
+        if new_value is _DROP:
+            del result[key]
+        else:
+            result[key] = new_value
+    return result
+
+
+def _apply_to_items(items: List[Any], segments: List[str], policy: Any, path: str, trimmed: Dict[str, str]) -> List[Any]:
+    """Applies `policy` below every item of a list (for "key.*.field" paths)"""
+    if not segments:
+        result, details = [], []
+        for item in items:
+            new_item, detail = policy.apply(item)
+            if detail is not None:
+                details.append(detail)
+            if new_item is not _DROP:
+                result.append(new_item)
+        if not details:
+            return items
+        trimmed[f"{path}.*"] = f"{details[0]} (in {len(details)} item(s))"
+        return result
+
+    changed = False
+    result = []
+    for item in items:
+        new_item = _apply_at(item, segments, policy, f"{path}.*.", trimmed)
+        changed = changed or new_item is not item
+        result.append(new_item)
+    return result if changed else items
@@ -0,0 +1,154 @@
+import functools
+import inspect
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from game_sdk.game.executor import run_coroutine, run_in_executor, submit_state_provider
+
+
+class StateProvider:
+    """
+    One independently refreshable piece of state.
+
+    Args:
+        fn (Callable): `fn(function_result, current_state)` returning the new value of this
+            piece of state; may be an `async def` function. `current_state` holds the
+            previous values of all pieces, with the fresh values of `depends_on` filled in.
+        depends_on (Iterable[str]): Providers that must finish before this one starts.
+        timeout (Optional[float]): Seconds to wait for the provider; on timeout its previous
+            value is kept (the call keeps running in the background and its result is
+            discarded).
+    """
+    def __init__(self, fn: Callable, depends_on: Iterable[str] = (), timeout: Optional[float] = None):
+        self.fn = fn
+        self.depends_on = tuple(depends_on)
+        self.timeout = timeout
+
+    def __repr__(self) -> str:
+        return f"StateProvider({getattr(self.fn, '__name__', self.fn)!r}, depends_on={self.depends_on}, timeout={self.timeout})"
+
+
+@dataclass
+class StateRefresh:
+    """
+    Result of `refresh_states`.
+
+    Attributes:
+        state (Dict[str, Any]): New value per provider (the previous one for timed-out providers).
+        timed_out (List[str]): Providers that did not finish within their timeout.
+        durations (Dict[str, float]): Seconds each finished provider took.
+    """
+    state: Dict[str, Any]
+    timed_out: List[str] = field(default_factory=list)
+    durations: Dict[str, float] = field(default_factory=dict)
+
+
+def refresh_states(providers: Dict[str, StateProvider], function_result: Any,
+                   current_state: Dict[str, Any]) -> StateRefresh:
+    """
+    Runs state providers concurrently on their own thread pool, each as soon as the
+    providers it depends on are done, so a refresh takes about as long as the slowest
+    chain of providers rather than the sum of all of them.
+
+    Raises:
+        ValueError: If a provider depends on an unknown provider or dependencies are cyclic.
+        Exception: The first exception raised by a provider.
+    """
+    _check_dependencies(providers)
+    result = StateRefresh(state=dict(current_state))
+    pending = dict(providers)
+    running: Dict[Future, str] = {}
+    started: Dict[str, float] = {}
+    done: set = set()
+
+    while pending or running:
+        # start everything whose dependencies are done
+        for name in [n for n, p in pending.items() if all(d in done for d in p.depends_on)]:
+            provider = pending.pop(name)
+            started[name] = time.monotonic()
+            running[_submit(provider, function_result, dict(result.state))] = name
+
+        deadlines = [
+            started[name] + providers[name].timeout
+            for name in running.values() if providers[name].timeout is not None
+        ]
+        timeout = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+        finished, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+
+        for future in finished:
+            name = running.pop(future)
+            result.state[name] = future.result()
+            result.durations[name] = time.monotonic() - started[name]
+            done.add(name)
+
+        now = time.monotonic()
+        for future, name in list(running.items()):
+            timeout = providers[name].timeout
+            if timeout is not None and now - started[name] >= timeout and not future.done():
+                # keep the previous value; dependents still run with it
+                future.cancel()
+                del running[future]
+                result.timed_out.append(name)
+                done.add(name)
+
+    return result
+
+
+async def arefresh_states(providers: Dict[str, StateProvider], function_result: Any,
+                          current_state: Dict[str, Any]) -> StateRefresh:
+    """Async counterpart of `refresh_states` (the providers still run on threads)"""
+    return await run_in_executor(refresh_states, providers, function_result, current_state)
+
+
+def combine_providers(providers: Dict[str, StateProvider]) -> Callable:
+    """
+    Builds a state function (for `WorkerConfig`, `Worker` or `Agent`) whose result is
+    `{name: value}` for every provider, refreshed concurrently.
+
+    Example:
+        ```python
+        get_state_fn = combine_providers({
+            "jobs": StateProvider(fetch_jobs, timeout=5),
+            "wallet": StateProvider(fetch_wallet, timeout=5),
+            "summary": StateProvider(summarize_jobs, depends_on=["jobs"]),
+        })
+        ```
+    """
+    _check_dependencies(providers)
+
+    def get_state_fn(function_result: Any, current_state: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        previous = {name: (current_state or {}).get(name) for name in providers}
+        return refresh_states(providers, function_result, previous).state
+
+    return get_state_fn
+
+
+def _submit(provider: StateProvider, function_result: Any, current_state: Dict[str, Any]) -> Future:
+    if inspect.iscoroutinefunction(provider.fn):
+        return run_coroutine(provider.fn(function_result, current_state))
+    return submit_state_provider(functools.partial(provider.fn, function_result, current_state))
+
+
+def _check_dependencies(providers: Dict[str, StateProvider]):
+    for name, provider in providers.items():
+        unknown = [d for d in provider.depends_on if d not in providers]
+        if unknown:
+            raise ValueError(f"State provider {name!r} depends on unknown providers: {unknown}")
+
+    visiting, checked = set(), set()
+
+    def visit(name: str):
+        if name in checked:
+            return
+        if name in visiting:
+            raise ValueError(f"Cyclic state provider dependencies involving {name!r}")
+        visiting.add(name)
+        for dependency in providers[name].depends_on:
+            visit(dependency)
+        visiting.discard(name)
+        checked.add(name)
+
+    for name in providers:
+        visit(name)
@@ -0,0 +1,139 @@
+import base64
+import contextlib
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, Optional
+
+
+def _token_expiry(token: str) -> Optional[float]:
+    """
+    Reads the `exp` claim (unix seconds) of a JWT access token without verifying it.
+    Returns None if the token is not a JWT or carries no expiry.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return float(claims["exp"])
+    except Exception:
+        return None
+
+
+@dataclass
+class _CachedToken:
+    token: str
+    expires_at: float
+    refresh_at: float
+    refreshing: bool = False
+
+
+class AccessTokenCache:
+    """
+    Process-wide cache of GAME access tokens keyed by API key.
+
+    Tokens are reused until they expire. Once a token enters its refresh window a single
+    background refresh is started while callers keep using the still-valid token, and
+    concurrent callers that find no valid token wait on one shared fetch (single-flight)
+    instead of each requesting their own.
+
+    Args:
+        default_ttl (float): Lifetime in seconds assumed for tokens without an `exp` claim.
+        refresh_margin (float): How many seconds before expiry to start a background refresh.
+    """
+    def __init__(self, default_ttl: float = 600.0, refresh_margin: float = 60.0):
+        self.default_ttl = default_ttl
+        self.refresh_margin = refresh_margin
+        self._entries: Dict[str, _CachedToken] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, api_key: str, fetch: Callable[[], str]) -> str:
+        """
+        Returns a valid access token for the API key, calling `fetch` only when needed.
+        """
+        entry = self._entries.get(api_key)
+        now = time.time()
+        if entry is not None and now < entry.expires_at:
+            if now >= entry.refresh_at:
+                self._start_refresh(api_key, entry, fetch)
+            return entry.token
+
+        with self._key_lock(api_key):
+            # another caller may have fetched the token while we were waiting
+            entry = self._entries.get(api_key)
+            if entry is not None and time.time() < entry.expires_at:
+                return entry.token
+            return self._fetch(api_key, fetch).token
+
+    def invalidate(self, api_key: str, token: Optional[str] = None):
+        """
+        Drops the cached token for the API key. If `token` is given, the entry is only
+        dropped if it still holds that token (so a fresher token is not discarded).
+        """
+        with self._lock:
+            entry = self._entries.get(api_key)
+            if entry is not None and (token is None or entry.token == token):
+                del self._entries[api_key]
+
+    def clear(self):
+        """Drops all cached tokens"""
+        with self._lock:
+            self._entries.clear()
+
+    @contextlib.contextmanager
+    def isolated(self) -> Iterator[None]:
+        """
+        Runs the block with an empty cache and puts the previous tokens back afterwards;
+        tokens fetched inside the block are dropped.
+        """
+        with self._lock:
+            saved, self._entries = self._entries, {}
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._entries = saved
+
+    def _key_lock(self, api_key: str) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(api_key, threading.Lock())
+
+    def _fetch(self, api_key: str, fetch: Callable[[], str]) -> _CachedToken:
+        token = fetch()
+        now = time.time()
+        expires_at = _token_expiry(token) or now + self.default_ttl
+        lifetime = max(expires_at - now, 0.0)
+        entry = _CachedToken(
+            token=token,
+            expires_at=expires_at,
+            refresh_at=expires_at - min(self.refresh_margin, lifetime / 2),
+        )
+        with self._lock:
+            self._entries[api_key] = entry
+        return entry
+
+    def _start_refresh(self, api_key: str, entry: _CachedToken, fetch: Callable[[], str]):
+        with self._lock:
+            if entry.refreshing:
+                return
+            entry.refreshing = True
+
+        def refresh():
+            try:
+                with self._key_lock(api_key):
+                    if self._entries.get(api_key) is entry:
+                        self._fetch(api_key, fetch)
+            except Exception:
+                # keep serving the current token and try again shortly; a synchronous
+                # fetch happens once it expires
+                entry.refresh_at = min(entry.expires_at, time.time() + 5.0)
+            finally:
+                entry.refreshing = False
+
+        threading.Thread(target=refresh, name="game-sdk-token-refresh", daemon=True).start()
+
+
+# shared by every GAMEClient in the process
+access_token_cache = AccessTokenCache()
@@ -0,0 +1,230 @@
+import contextvars
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar("game_sdk_current_span", default=None)
+
+
+class Span:
+    """
+    A timed section of an agent step. Spans opened while another span is active become
+    its children, so each step produces a span tree that is exported once the root ends.
+
+    Attributes:
+        name (str): Name of the span (e.g. "agent.step", "http.post").
+        attributes (Dict[str, Any]): Attributes such as payload sizes or the action type.
+        children (List[Span]): Child spans in start order.
+        error (Optional[str]): Exception raised inside the span, if any.
+    """
+    recording = True
+
+    def __init__(self, name: str, attributes: Dict[str, Any]):
+        self.name = name
+        self.attributes = attributes
+        self.children: List["Span"] = []
+        self.parent: Optional[Span] = None
+        self.error: Optional[str] = None
+        self.trace_id = ""
+        self.span_id = os.urandom(8).hex()
+        self.start_time_ns = 0
+        self.duration_ns = 0
+        self._start_perf_ns = 0
+        self._token = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes: Any):
+        self.attributes.update(attributes)
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration_ns / 1e6
+
+    def __enter__(self) -> "Span":
+        parent = _current_span.get()
+        if parent is not None:
+            self.parent = parent
+            self.trace_id = parent.trace_id
+            parent.children.append(self)
+        else:
+            self.trace_id = os.urandom(16).hex()
+        self._token = _current_span.set(self)
+        self.start_time_ns = time.time_ns()
+        self._start_perf_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.duration_ns = time.perf_counter_ns() - self._start_perf_ns
+        if exc is not None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        _current_span.reset(self._token)
+        if self.parent is None:
+            _export(self)
+        return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the span tree as nested dicts.
+        """
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "start_time_ns": self.start_time_ns,
+            "duration_ms": round(self.duration_ms, 3),
+            "attributes": self.attributes,
+            "error": self.error,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+    def to_otel(self) -> List[Dict[str, Any]]:
+        """
+        Returns the span tree flattened into OpenTelemetry (OTLP/JSON) span dicts.
+        """
+        spans = [{
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent.span_id if self.parent else "",
+            "name": self.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(self.start_time_ns),
+            "endTimeUnixNano": str(self.start_time_ns + self.duration_ns),
+            "attributes": [
+                {"key": key, "value": _otel_value(value)}
+                for key, value in self.attributes.items()
+            ],
+            "status": {"code": 2, "message": self.error} if self.error else {"code": 1},
+        }]
+        for child in self.children:
+            spans.extend(child.to_otel())
+        return spans
+
+
+class _NoopSpan:
+    """Span returned while tracing is disabled - every operation is a no-op"""
+    recording = False
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def set_attributes(self, **attributes: Any):
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def _otel_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class InMemoryExporter:
+    """
+    Keeps finished span trees in memory (useful in tests and notebooks).
+
+    Args:
+        max_spans (Optional[int]): Maximum number of root spans kept (oldest dropped first).
+    """
+    def __init__(self, max_spans: Optional[int] = 10000):
+        self.max_spans = max_spans
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+            if self.max_spans is not None and len(self.spans) > self.max_spans:
+                del self.spans[:len(self.spans) - self.max_spans]
+
+    def clear(self):
+        with self._lock:
+            self.spans.clear()
+
+
+class JSONLFileExporter:
+    """
+    Appends every finished span tree to a file as one JSON line.
+
+    Args:
+        path (str): Path of the JSONL file.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+class OTelDictExporter:
+    """
+    Passes every finished span tree to a callback as a list of OpenTelemetry span dicts,
+    e.g. to forward them to an OTLP collector.
+
+    Args:
+        callback (Callable[[List[dict]], None]): Called with the flattened spans of each trace.
+    """
+    def __init__(self, callback: Callable[[List[Dict[str, Any]]], None]):
+        self.callback = callback
+
+    def export(self, span: Span):
+        self.callback(span.to_otel())
+
+
+_exporters: List[Any] = []
+
+
+def configure(*exporters: Any):
+    """
+    Enables tracing with the given exporters (objects with an `export(span)` method).
+    Calling it without exporters disables tracing.
+    """
+    global _exporters
+    _exporters = list(exporters)
+
+
+def disable():
+    """Disables tracing"""
+    configure()
+
+
+def is_enabled() -> bool:
+    return bool(_exporters)
+
+
+def span(name: str, **attributes: Any):
+    """
+    Opens a span as a context manager. Returns a shared no-op span when tracing is disabled.
+    """
+    if not _exporters:
+        return _NOOP_SPAN
+    return Span(name, attributes)
+
+
+def _export(root: Span):
+    for exporter in _exporters:
+        try:
+            exporter.export(root)
+        except Exception:
+            # tracing must never break a step
+            pass
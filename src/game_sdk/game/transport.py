@@ -0,0 +1,258 @@
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from game_sdk.game.serialization import dumps
+from game_sdk.game import tracing
+
+if TYPE_CHECKING:
+    import requests
+
+
+class TransportStats:
+    """
+    Thread-safe counters describing how an HTTPTransport uses its connections.
+
+    Attributes:
+        requests (int): Number of blocking requests sent through the transport.
+        connections_opened (int): Number of new TCP (+TLS) connections established for them.
+        async_requests (int): Number of requests sent through the async client.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections_opened = 0
+        self.async_requests = 0
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def record_async_request(self):
+        with self._lock:
+            self.async_requests += 1
+
+    def record_connection(self):
+        with self._lock:
+            self.connections_opened += 1
+
+    @property
+    def connections_reused(self) -> int:
+        """Number of requests served on an already open (kept-alive) connection."""
+        return max(self.requests - self.connections_opened, 0)
+
+    def as_dict(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "connections_opened": self.connections_opened,
+                "connections_reused": max(self.requests - self.connections_opened, 0),
+                "async_requests": self.async_requests,
+            }
+
+
+_counting_adapter_class = None
+
+
+def _counting_adapter(stats: TransportStats, **kwargs):
+    """
+    Builds an HTTPAdapter whose connection pools report every new connection to
+    TransportStats (requests is imported on first use to keep `import game_sdk` fast).
+    """
+    global _counting_adapter_class
+    if _counting_adapter_class is None:
+        from requests.adapters import HTTPAdapter
+
+        class _CountingHTTPAdapter(HTTPAdapter):
+            def __init__(self, stats: TransportStats, **kwargs):
+                self._stats = stats
+                super().__init__(**kwargs)
+
+            def init_poolmanager(self, *args, **kwargs):
+                super().init_poolmanager(*args, **kwargs)
+                stats = self._stats
+
+                def counting(pool_cls):
+                    class CountingPool(pool_cls):
+                        def _new_conn(self):
+                            stats.record_connection()
+                            return super()._new_conn()
+
+                    CountingPool.__name__ = f"Counting{pool_cls.__name__}"
+                    return CountingPool
+
+                self.poolmanager.pool_classes_by_scheme = {
+                    scheme: counting(pool_cls)
+                    for scheme, pool_cls in self.poolmanager.pool_classes_by_scheme.items()
+                }
+
+        _counting_adapter_class = _CountingHTTPAdapter
+    return _counting_adapter_class(stats, **kwargs)
+
+
+class HTTPTransport:
+    """
+    Pooled keep-alive HTTP transport used by the GAME API clients.
+
+    A single transport owns a `requests.Session` whose connection pools are reused
+    across calls, so consecutive agent steps skip the TCP+TLS handshake. By default
+    every client in the process shares one transport (see `get_default_transport`).
+
+    Async clients use `apost`, which is backed by one `httpx.AsyncClient` per event loop
+    with the same pool limits (requires the optional `httpx` dependency).
+
+    Args:
+        pool_connections (int): Number of per-host connection pools to keep cached.
+        pool_maxsize (int): Maximum number of connections kept open per host.
+        pool_block (bool): Whether to wait for a free connection when a host's pool is
+            exhausted instead of opening a throwaway connection.
+        keep_alive (bool): Whether to keep connections open between requests.
+        timeout (Optional[float]): Default request timeout in seconds (None waits forever).
+
+    Attributes:
+        stats (TransportStats): Request and connection reuse counters.
+    """
+    def __init__(self,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 32,
+                 pool_block: bool = False,
+                 keep_alive: bool = True,
+                 timeout: Optional[float] = None,
+                 ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self.stats = TransportStats()
+
+        import requests
+
+        self._session = requests.Session()
+        adapter = _counting_adapter(
+            self.stats,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        if not keep_alive:
+            self._session.headers["Connection"] = "close"
+
+        # httpx clients are bound to the event loop they were first used in
+        self._async_clients = weakref.WeakKeyDictionary()
+
+    def post(self, url: str, headers: Optional[Dict[str, str]] = None, json: Any = None) -> "requests.Response":
+        """
+        Sends a POST request over the pooled session. The `json` body may contain
+        pre-serialized RawJSON fragments.
+        """
+        self.stats.record_request()
+        with tracing.span("http.post", url=url) as span:
+            body, headers = _encode_body(json, headers)
+            response = self._session.post(url, headers=headers, data=body, timeout=self.timeout)
+            if span.recording:
+                span.set_attributes(
+                    status_code=response.status_code,
+                    request_bytes=len(body) if body else 0,
+                    response_bytes=len(response.content),
+                )
+        return response
+
+    async def apost(self, url: str, headers: Optional[Dict[str, str]] = None, json: Any = None):
+        """
+        Sends a POST request over the pooled async client of the running event loop.
+        """
+        self.stats.record_async_request()
+        with tracing.span("http.post", url=url) as span:
+            body, headers = _encode_body(json, headers)
+            response = await self._get_async_client().post(url, headers=headers, content=body)
+            if span.recording:
+                span.set_attributes(
+                    status_code=response.status_code,
+                    request_bytes=len(body) if body else 0,
+                    response_bytes=len(response.content),
+                )
+        return response
+
+    def _get_async_client(self):
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            try:
+                import httpx
+            except ImportError:
+                raise ImportError(
+                    "Async GAME clients require httpx. Install it with `pip install game_sdk[async]`"
+                )
+
+            headers = {} if self.keep_alive else {"Connection": "close"}
+            client = httpx.AsyncClient(
+                headers=headers,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.pool_connections * self.pool_maxsize,
+                    max_keepalive_connections=self.pool_maxsize if self.keep_alive else 0,
+                ),
+            )
+            self._async_clients[loop] = client
+        return client
+
+    def close(self):
+        """Closes all pooled (blocking) connections"""
+        self._session.close()
+
+    async def aclose(self):
+        """Closes the pooled async connections of the running event loop"""
+        import asyncio
+
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+
+def _encode_body(payload: Any, headers: Optional[Dict[str, str]]):
+    if payload is None:
+        return None, headers
+    headers = dict(headers) if headers else {}
+    headers.setdefault("Content-Type", "application/json")
+    return dumps(payload).encode("utf-8"), headers
+
+
+_default_transport: Optional[HTTPTransport] = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_transport() -> HTTPTransport:
+    """
+    Returns the process-wide transport shared by every client that was not given its own.
+    """
+    global _default_transport
+    if _default_transport is None:
+        with _default_transport_lock:
+            if _default_transport is None:
+                _default_transport = HTTPTransport()
+    return _default_transport
+
+
+def set_default_transport(transport: HTTPTransport) -> HTTPTransport:
+    """
+    Makes `transport` the process-wide transport (any object with the HTTPTransport
+    `post`/`apost` interface). Clients created before this call keep their transport.
+    """
+    global _default_transport
+    with _default_transport_lock:
+        _default_transport = transport
+    return transport
+
+
+def configure_default_transport(**kwargs) -> HTTPTransport:
+    """
+    Replaces the process-wide transport with one built from the given HTTPTransport options.
+
+    Clients created before this call keep the transport they were created with.
+    """
+    return set_default_transport(HTTPTransport(**kwargs))
@@ -1,7 +1,18 @@
-from typing import Any, Callable, Dict, Optional, List
-from game_sdk.game.custom_types import Function, FunctionResult, FunctionResultStatus, ActionResponse, ActionType
+import copy
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional, List, Union
+from game_sdk.game.custom_types import Function, FunctionDefsCache, FunctionResult, FunctionResultStatus, ActionResponse, ActionType
 from game_sdk.game.api import GAMEClient
 from game_sdk.game.api_v2 import GAMEClientV2
+from game_sdk.game.api_v2_async import AsyncGAMEClientV2
+from game_sdk.game.executor import run_in_executor
+from game_sdk.game import tracing
+from game_sdk.game.output import Output, resolve_output, get_output, use_output
+from game_sdk.game.inbox import EventInbox, InboxBatch
+from game_sdk.game.registry import AgentRegistry, registration_key, resolve_registry
+from game_sdk.game.state_budget import StateBudget, StateBudgetReport
+from game_sdk.game.incremental_state import StateWithInstructions
 
 class Worker:
     """
@@ -17,12 +28,25 @@ class Worker:
         get_state_fn (Callable): Function to retrieve and manage worker state.
         action_space (List[Function]): List of functions available to the worker.
         instruction (Optional[str]): Additional specific instructions for the worker.
+        output (Optional[Union[str, Output]]): Output sink or mode ("none", "log", "rich")
+            for step reports. Defaults to the process-wide sink (see `game_sdk.game.output`).
+        registry (Optional[Union[str, AgentRegistry]]): Registry (or path to one) of agents
+            already created with the same configuration, reused instead of creating a new
+            one on every start.
+        inbox (Optional[EventInbox]): Inbox for platform events (see `push_event`); pending
+            events are coalesced into the `observations` of the next step.
+        state_budget (Optional[StateBudget]): Bounds the size of the state sent to the GAME
+            API on every step (`state` itself is not trimmed).
+        defer_registration (bool): Whether to create the remote agent on the first
+            `set_task` instead of in the constructor.
 
     Attributes:
         description (str): Worker's role description used in interactions.
         instruction (str): Additional behavioral instructions.
         state (dict): Current state of the worker.
         action_space (Dict[str, Function]): Available functions mapped by name.
+        state_budget_report (Optional[StateBudgetReport]): What the state budget trimmed on
+            the last step (None if nothing was trimmed).
 
     Raises:
         ValueError: If API key is not provided.
@@ -50,6 +74,11 @@ class Worker:
         # specific additional instruction for the worker (PROMPT)
         instruction: Optional[str] = "",
         model_name: str = "Llama-3.3-70B-Instruct",
+        output: Optional[Union[str, Output]] = None,
+        registry: Optional[Union[str, AgentRegistry]] = None,
+        inbox: Optional[EventInbox] = None,
+        state_budget: Optional[StateBudget] = None,
+        defer_registration: bool = False,
     ):
 
         if api_key.startswith("apt-"):
@@ -61,6 +90,9 @@ class Worker:
 
         self._model_name: str = model_name
 
+        # output sink for step reports (None follows the process-wide sink)
+        self._output: Optional[Output] = resolve_output(output) if output is not None else None
+
         # checks
         if not self._api_key:
             raise ValueError("API key not set")
@@ -68,12 +100,8 @@ class Worker:
         self.description: str = description
         self.instruction: Optional[str] = instruction
 
-        # setup get state function and initial state
-        self.get_state_fn = lambda function_result, current_state: {
-            "instructions": self.instruction,  # instructions are set up in the state
-            # places the rest of the output of the get_state_fn in the state
-            **get_state_fn(function_result, current_state),
-        }
+        # setup get state function (with the instructions, see StateWithInstructions) and initial state
+        self.get_state_fn = StateWithInstructions(get_state_fn, self)
         dummy_function_result = FunctionResult(
             action_id="",
             action_status=FunctionResultStatus.DONE,
@@ -90,23 +118,80 @@ class Worker:
                 f.get_function_def()["fn_name"]: f for f in action_space}
         else:
             self.action_space: Dict[str, Function] = action_space
-
-        # initialize an agent instance for the worker
-        self._agent_id: str = self.client.create_agent(
-            "StandaloneWorker", self.description, "N/A"
-        )
+        # pre-serialized function definitions sent with every step
+        self._function_defs = FunctionDefsCache()
+
+        # initialize an agent instance for the worker (or reuse the registered one),
+        # now or on the first set_task
+        self._registry: Optional[AgentRegistry] = resolve_registry(registry)
+        self._agent_id: Optional[str] = None
+        self._registration_lock = threading.Lock()
+        # worker this one was forked from (forks share its remote agent)
+        self._origin: Optional["Worker"] = None
+        if not defer_registration:
+            self._ensure_agent()
 
         # persistent variables that is maintained through the worker running
         # task ID for everytime you provide/update the task (i.e. ask the agent to do something)
         self._submission_id: Optional[str] = None
         # current response from the Agent
         self._function_result: Optional[FunctionResult] = None
+        # async client for astep/arun (created on first use)
+        self._async_client: Optional[AsyncGAMEClientV2] = None
+        # events pushed by plugins, shown to the next step
+        self.inbox: EventInbox = inbox if inbox is not None else EventInbox()
+        # size bound for the state sent with each step, and what it last trimmed
+        self.state_budget: Optional[StateBudget] = state_budget
+        self.state_budget_report: Optional[StateBudgetReport] = None
+
+    def _ensure_agent(self) -> str:
+        """Creates the remote agent for the worker if that has not happened yet"""
+        if self._agent_id is None and self._origin is not None:
+            self._agent_id = self._origin._ensure_agent()
+        if self._agent_id is None:
+            with self._registration_lock:
+                if self._agent_id is None:
+                    if self._registry is not None:
+                        self._agent_id = self._registry.get_or_create(
+                            registration_key("agent", self._api_key, self.client.base_url, "StandaloneWorker", self.description, "N/A"),
+                            "agent",
+                            lambda: self.client.create_agent("StandaloneWorker", self.description, "N/A"),
+                        )
+                    else:
+                        self._agent_id = self.client.create_agent(
+                            "StandaloneWorker", self.description, "N/A"
+                        )
+        return self._agent_id
+
+    def fork(self) -> "Worker":
+        """
+        Returns a Worker for another task that shares this worker's remote agent, clients
+        and configuration, without creating a new agent (if the agent is not created yet,
+        the first `set_task` of any of them creates it for all). Task progress, state,
+        instruction and inbox are the fork's own, so forks can run tasks concurrently (see
+        `WorkerPool`).
+        """
+        fork = copy.copy(self)
+        fork._origin = self._origin or self
+        fork.get_state_fn = StateWithInstructions(self.get_state_fn.get_state_fn, fork)
+        dummy_function_result = FunctionResult(
+            action_id="",
+            action_status=FunctionResultStatus.DONE,
+            feedback_message="",
+            info={},
+        )
+        fork.state = fork.get_state_fn(dummy_function_result, None)
+        fork._submission_id = None
+        fork._function_result = None
+        fork.inbox = EventInbox(max_events=self.inbox.max_events, max_chars=self.inbox.max_chars)
+        fork.state_budget_report = None
+        return fork
 
     def set_task(self, task: str):
         """
         Sets the task for the agent
         """
-        set_task_response = self.client.set_worker_task(self._agent_id, task)
+        set_task_response = self.client.set_worker_task(self._ensure_agent(), task)
         # response_json = set_task_response.json()
 
         # if set_task_response.status_code != 200:
@@ -117,6 +202,41 @@ class Worker:
 
         return self._submission_id
 
+    async def aset_task(self, task: str):
+        """
+        Async counterpart of `set_task`
+        """
+        if self._agent_id is None:
+            await run_in_executor(self._ensure_agent)
+
+        if isinstance(self.client, GAMEClientV2):
+            set_task_response = await self._get_async_client().set_worker_task(self._agent_id, task)
+        else:
+            set_task_response = await run_in_executor(self.client.set_worker_task, self._agent_id, task)
+
+        # task ID
+        self._submission_id = set_task_response["submission_id"]
+
+        return self._submission_id
+
+    def push_event(self, content: Any, source: Optional[str] = None, key: Optional[str] = None, priority: int = 0) -> bool:
+        """
+        Adds a platform event to the worker's inbox; pending events are coalesced into the
+        `observations` of the next step. Safe to call from any thread.
+
+        Returns:
+            False if the event was merged into a pending one with the same key.
+        """
+        return self.inbox.push(content, source=source, key=key, priority=priority)
+
+    def _get_output(self) -> Output:
+        return self._output or get_output()
+
+    def _get_async_client(self) -> AsyncGAMEClientV2:
+        if self._async_client is None:
+            self._async_client = AsyncGAMEClientV2.from_client(self.client)
+        return self._async_client
+
     def _get_action(
         self,
         # results of the previous action (if any)
@@ -125,6 +245,73 @@ class Worker:
         """
         Gets the agent action from the GAME API
         """
+        # pending inbox events go into this step (and back to the inbox if it fails)
+        events = self.inbox.take()
+        try:
+            with tracing.span("worker.build_payload"):
+                data = self._get_action_payload(function_result, events)
+
+            # make API call
+            with tracing.span("worker.get_action"):
+                response = self.client.get_worker_action(
+                    self._agent_id, 
+                    self._submission_id, 
+                    data,
+                    model_name=self._model_name
+                )
+        except BaseException:
+            if events is not None:
+                self.inbox.put_back(events)
+            raise
+
+        with tracing.span("action_response.validate"):
+            return ActionResponse.model_validate(response)
+
+    async def _aget_action(
+        self,
+        function_result: Optional[FunctionResult] = None
+    ) -> ActionResponse:
+        """
+        Async counterpart of `_get_action`
+        """
+        # pending inbox events go into this step (and back to the inbox if it fails)
+        events = self.inbox.take()
+        try:
+            with tracing.span("worker.build_payload"):
+                data = self._get_action_payload(function_result, events)
+
+            with tracing.span("worker.get_action"):
+                if isinstance(self.client, GAMEClientV2):
+                    response = await self._get_async_client().get_worker_action(
+                        self._agent_id,
+                        self._submission_id,
+                        data,
+                        model_name=self._model_name
+                    )
+                else:
+                    response = await run_in_executor(
+                        self.client.get_worker_action,
+                        self._agent_id,
+                        self._submission_id,
+                        data,
+                        model_name=self._model_name
+                    )
+        except BaseException:
+            if events is not None:
+                self.inbox.put_back(events)
+            raise
+
+        with tracing.span("action_response.validate"):
+            return ActionResponse.model_validate(response)
+
+    def _get_action_payload(
+        self,
+        function_result: Optional[FunctionResult] = None,
+        events: Optional[InboxBatch] = None,
+    ) -> Dict[str, Any]:
+        """
+        Builds the data payload for the next worker action request
+        """
         # dummy function result if None is provided - for get_state_fn to take the same input all the time
         if function_result is None:
             function_result = FunctionResult(
@@ -141,13 +328,13 @@ class Worker:
             }
         else:
             observations = None
-            
+        if events is not None:
+            observations = {**(observations or {}), **events.observation}
+
         # set up data payload
         data = {
-            "environment": self.state,  # state (updated state)
-            "functions": [
-                f.get_function_def() for f in self.action_space.values()  # functions available
-            ],
+            "environment": self._apply_state_budget(self.state),  # state (updated state)
+            "functions": self._function_defs.get(self.action_space.values()),  # functions available
             "action_result": (
                 function_result.model_dump(
                     exclude={'info'}) if function_result else None
@@ -155,15 +342,27 @@ class Worker:
             "observations": observations
         }
 
-        # make API call
-        response = self.client.get_worker_action(
-            self._agent_id, 
-            self._submission_id, 
-            data,
-            model_name=self._model_name
-        )
-
-        return ActionResponse.model_validate(response)
+        return data
+
+    def _apply_state_budget(self, state: Any) -> Any:
+        """Returns the state to send within the state budget (if any)"""
+        if self.state_budget is None:
+            return state
+        state, report = self.state_budget.apply(state)
+        self.state_budget_report = report
+        if report is not None:
+            self._get_output().message(
+                "state.trimmed",
+                lambda: f"✂️ Trimmed worker state from {report.original_chars} to {report.final_chars} chars: {report.trimmed}",
+                level=logging.WARNING if report.over_budget else logging.DEBUG,
+                agent_id=self._agent_id,
+                state="worker",
+                original_chars=report.original_chars,
+                final_chars=report.final_chars,
+                trimmed=report.trimmed,
+                over_budget=report.over_budget,
+            )
+        return state
 
     def step(self):
         """
@@ -172,36 +371,119 @@ class Worker:
         if not self._submission_id:
             raise ValueError("No task set")
 
-        # get action from GAME API (Agent)
-        action_response = self._get_action(self._function_result)
-        action_type = action_response.action_type
-
-        print(f"Action response: {action_response}")
-        print(f"Action type: {action_type}")
-
-        # execute action
-        if action_type == ActionType.CALL_FUNCTION:
-            if not action_response.action_args:
-                raise ValueError("No function information provided by GAME")
-
-            self._function_result = self.action_space[
-                action_response.action_args["fn_name"]
-            ].execute(**action_response.action_args)
-
-            print(f"Function result: {self._function_result}")
+        with tracing.span("worker.step", agent_id=self._agent_id) as span:
+            # get action from GAME API (Agent)
+            action_response = self._get_action(self._function_result)
+            action_type = action_response.action_type
+            span.set_attribute("action_type", action_type.value)
+
+            self._get_output().message(
+                "worker.action",
+                lambda: f"Action response: {action_response}\nAction type: {action_type}",
+                agent_id=self._agent_id,
+                action_type=action_type.value,
+            )
 
-            # update state
-            self.state = self.get_state_fn(self._function_result, self.state)
+            # execute action
+            if action_type == ActionType.CALL_FUNCTION:
+                if not action_response.action_args:
+                    raise ValueError("No function information provided by GAME")
+
+                fn_name = action_response.action_args["fn_name"]
+                with tracing.span("function.execute", fn_name=fn_name), use_output(self._output):
+                    self._function_result = self.action_space[fn_name].execute(
+                        **action_response.action_args
+                    )
+
+                function_result = self._function_result
+                self._get_output().message(
+                    "worker.function_result",
+                    lambda: f"Function result: {function_result}",
+                    agent_id=self._agent_id,
+                    fn_name=fn_name,
+                    action_status=function_result.action_status.value,
+                )
+
+                # update state
+                with tracing.span("worker.get_state_fn"):
+                    self.state = self.get_state_fn(self._function_result, self.state)
+
+            elif action_response.action_type == ActionType.WAIT:
+                self._get_output().message(
+                    "worker.task_done",
+                    lambda: "Task completed or ended (not possible)",
+                    agent_id=self._agent_id,
+                )
+                self._submission_id = None
+
+            else:
+                raise ValueError(
+                    f"Unexpected action type: {action_response.action_type}")
+
+        return action_response, (
+            self._function_result.model_copy() if self._function_result else None
+        )
 
-        elif action_response.action_type == ActionType.WAIT:
-            print("Task completed or ended (not possible)")
-            self._submission_id = None
+    async def astep(self):
+        """
+        Async counterpart of `step` - awaits the GAME API and runs the executable and
+        state function on the shared bounded thread pool
+        """
+        if not self._submission_id:
+            raise ValueError("No task set")
 
-        else:
-            raise ValueError(
-                f"Unexpected action type: {action_response.action_type}")
+        with tracing.span("worker.step", agent_id=self._agent_id) as span:
+            # get action from GAME API (Agent)
+            action_response = await self._aget_action(self._function_result)
+            action_type = action_response.action_type
+            span.set_attribute("action_type", action_type.value)
+
+            self._get_output().message(
+                "worker.action",
+                lambda: f"Action response: {action_response}\nAction type: {action_type}",
+                agent_id=self._agent_id,
+                action_type=action_type.value,
+            )
 
-        return action_response, self._function_result.model_copy()
+            # execute action
+            if action_type == ActionType.CALL_FUNCTION:
+                if not action_response.action_args:
+                    raise ValueError("No function information provided by GAME")
+
+                fn_name = action_response.action_args["fn_name"]
+                with tracing.span("function.execute", fn_name=fn_name), use_output(self._output):
+                    self._function_result = await self.action_space[fn_name].aexecute(
+                        **action_response.action_args
+                    )
+
+                function_result = self._function_result
+                self._get_output().message(
+                    "worker.function_result",
+                    lambda: f"Function result: {function_result}",
+                    agent_id=self._agent_id,
+                    fn_name=fn_name,
+                    action_status=function_result.action_status.value,
+                )
+
+                # update state
+                with tracing.span("worker.get_state_fn"):
+                    self.state = await run_in_executor(self.get_state_fn, self._function_result, self.state)
+
+            elif action_response.action_type == ActionType.WAIT:
+                self._get_output().message(
+                    "worker.task_done",
+                    lambda: "Task completed or ended (not possible)",
+                    agent_id=self._agent_id,
+                )
+                self._submission_id = None
+
+            else:
+                raise ValueError(
+                    f"Unexpected action type: {action_response.action_type}")
+
+        return action_response, (
+            self._function_result.model_copy() if self._function_result else None
+        )
 
     def run(self, task: str):
         """
@@ -211,3 +493,12 @@ class Worker:
         self.set_task(task)
         while self._submission_id:
             self.step()
+
+    async def arun(self, task: str):
+        """
+        Async counterpart of `run`
+        """
+
+        await self.aset_task(task)
+        while self._submission_id:
+            await self.astep()
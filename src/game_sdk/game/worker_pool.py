@@ -0,0 +1,223 @@
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import AsyncIterator, Iterable, Iterator, List, Optional, Tuple
+
+from game_sdk.game import tracing
+from game_sdk.game.api_v2 import GAMEClientV2
+from game_sdk.game.custom_types import ActionType, FunctionResult
+from game_sdk.game.executor import run_in_executor
+from game_sdk.game.worker import Worker
+
+
+_DONE = object()
+
+
+class WorkerTaskStatus(str, Enum):
+    """
+    How a WorkerPool task ended.
+
+    Values:
+        DONE: GAME answered WAIT (the task is complete or cannot be completed).
+        FAILED: A step raised an exception (see `WorkerTaskResult.error`).
+        TIMED_OUT: The task ran past its deadline.
+        CANCELLED: The pool was cancelled before the task finished.
+    """
+    DONE = "done"
+    FAILED = "failed"
+    TIMED_OUT = "timed_out"
+    CANCELLED = "cancelled"
+
+
+@dataclass
+class WorkerTaskResult:
+    """
+    Outcome of one WorkerPool task.
+
+    Attributes:
+        task (str): The task.
+        status (WorkerTaskStatus): How the task ended.
+        function_results (List[FunctionResult]): Results of the functions the task called, in order.
+        submission_id (Optional[str]): GAME submission ID of the task.
+        error (Optional[BaseException]): Exception that failed the task.
+        duration (float): Seconds from start to end of the task.
+    """
+    task: str
+    status: WorkerTaskStatus = WorkerTaskStatus.DONE
+    function_results: List[FunctionResult] = field(default_factory=list)
+    submission_id: Optional[str] = None
+    error: Optional[BaseException] = None
+    duration: float = 0.0
+
+
+class WorkerPool:
+    """
+    Runs many independent tasks on one Worker definition with bounded concurrency.
+
+    Every task runs on a fork of `worker` (see `Worker.fork`), so all tasks share the
+    remote agent created once by the worker instead of creating one per task. Tasks are
+    pulled from the iterable lazily, so it can be a generator of thousands of tasks, and
+    results are streamed as `(task, WorkerTaskResult)` in completion order.
+
+    Args:
+        worker (Worker): Worker whose agent, action space and state function are used.
+        max_concurrency (int): Maximum tasks running at the same time.
+        task_timeout (Optional[float]): Deadline per task in seconds. `arun` cancels the
+            task at the deadline. `run` checks it between steps, so a step that is still
+            running at the deadline (a GAME request or a function call) finishes first and
+            the task can overrun by that step; set `Function.timeout` to bound function calls.
+
+    Example:
+        ```python
+        pool = WorkerPool(worker, max_concurrency=16, task_timeout=120)
+        for task, result in pool.run(f"Summarize ticket {i}" for i in ticket_ids):
+            print(task, result.status, len(result.function_results))
+        ```
+    """
+    def __init__(self, worker: Worker, max_concurrency: int = 8, task_timeout: Optional[float] = None):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.worker = worker
+        self.max_concurrency = max_concurrency
+        self.task_timeout = task_timeout
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """
+        Stops the pool: no new tasks are started, and running tasks end as CANCELLED at
+        their next step. Safe to call from any thread. A cancel before a run starts stops
+        that run before it starts any task; once a run ends, the pool can be run again.
+        """
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def _end_run(self, cancelled: threading.Event):
+        # tasks still running keep the set event of their run; later runs get a new one
+        if cancelled.is_set() and self._cancelled is cancelled:
+            self._cancelled = threading.Event()
+
+    def run(self, tasks: Iterable[str]) -> Iterator[Tuple[str, WorkerTaskResult]]:
+        """
+        Runs `tasks` on up to `max_concurrency` threads, yielding `(task, result)` as each
+        task ends. Leaving the loop early cancels the remaining tasks.
+        """
+        cancelled = self._cancelled
+        pending = iter(tasks)
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="game-worker-pool")
+        running: "dict[Future, str]" = {}
+        start = lambda task: executor.submit(self._run_task, task, cancelled)
+        try:
+            self._fill(pending, running, start, cancelled)
+            while running:
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    task = running.pop(future)
+                    yield task, future.result()
+                self._fill(pending, running, start, cancelled)
+        finally:
+            # also reached when the caller stops iterating
+            if running:
+                cancelled.set()
+            executor.shutdown(wait=False)
+            self._end_run(cancelled)
+
+    async def arun(self, tasks: Iterable[str]) -> AsyncIterator[Tuple[str, WorkerTaskResult]]:
+        """Async counterpart of `run`: runs up to `max_concurrency` tasks on the current event loop"""
+        import asyncio
+
+        cancelled = self._cancelled
+        running: "dict[asyncio.Task, str]" = {}
+        start = lambda task: asyncio.ensure_future(self._arun_task(task, cancelled))
+        try:
+            if cancelled.is_set():
+                return
+            if isinstance(self.worker.client, GAMEClientV2):
+                # created before forking, so every fork shares one async client
+                self.worker._get_async_client()
+            # registered once, off the event loop, before the forks share the agent
+            await run_in_executor(self.worker._ensure_agent)
+            pending = iter(tasks)
+            self._fill(pending, running, start, cancelled)
+            while running:
+                finished, _ = await asyncio.wait(list(running), return_when=asyncio.FIRST_COMPLETED)
+                for future in finished:
+                    task = running.pop(future)
+                    yield task, future.result()
+                self._fill(pending, running, start, cancelled)
+        finally:
+            for future in running:
+                future.cancel()
+            # wait for the cancelled tasks to unwind (closing their spans) before returning
+            await asyncio.gather(*running, return_exceptions=True)
+            self._end_run(cancelled)
+
+    def _fill(self, pending: Iterator[str], running: dict, start, cancelled: threading.Event):
+        while len(running) < self.max_concurrency and not cancelled.is_set():
+            task = next(pending, _DONE)
+            if task is _DONE:
+                return
+            running[start(task)] = task
+
+    def _run_task(self, task: str, cancelled: threading.Event) -> WorkerTaskResult:
+        result = WorkerTaskResult(task=task)
+        started = time.monotonic()
+        deadline = started + self.task_timeout if self.task_timeout is not None else None
+        worker = self.worker.fork()
+        with tracing.span("worker_pool.task", agent_id=worker._agent_id) as span:
+            try:
+                result.submission_id = worker.set_task(task)
+                while worker._submission_id:
+                    if cancelled.is_set():
+                        result.status = WorkerTaskStatus.CANCELLED
+                        break
+                    if deadline is not None and time.monotonic() >= deadline:
+                        result.status = WorkerTaskStatus.TIMED_OUT
+                        break
+                    action_response, function_result = worker.step()
+                    if action_response.action_type == ActionType.CALL_FUNCTION:
+                        result.function_results.append(function_result)
+            except Exception as e:
+                result.status = WorkerTaskStatus.FAILED
+                result.error = e
+            span.set_attribute("status", result.status.value)
+        result.duration = time.monotonic() - started
+        return result
+
+    async def _arun_task(self, task: str, cancelled: threading.Event) -> WorkerTaskResult:
+        import asyncio
+
+        result = WorkerTaskResult(task=task)
+        started = time.monotonic()
+        # the fork's initial state comes from the (synchronous) state function
+        worker = await run_in_executor(self.worker.fork)
+
+        async def run():
+            result.submission_id = await worker.aset_task(task)
+            while worker._submission_id:
+                if cancelled.is_set():
+                    result.status = WorkerTaskStatus.CANCELLED
+                    return
+                action_response, function_result = await worker.astep()
+                if action_response.action_type == ActionType.CALL_FUNCTION:
+                    result.function_results.append(function_result)
+
+        with tracing.span("worker_pool.task", agent_id=worker._agent_id) as span:
+            try:
+                await asyncio.wait_for(run(), self.task_timeout)
+            except asyncio.TimeoutError:
+                result.status = WorkerTaskStatus.TIMED_OUT
+            except asyncio.CancelledError:
+                result.status = WorkerTaskStatus.CANCELLED
+                raise
+            except Exception as e:
+                result.status = WorkerTaskStatus.FAILED
+                result.error = e
+            finally:
+                span.set_attribute("status", result.status.value)
+                result.duration = time.monotonic() - started
+        return result
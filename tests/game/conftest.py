@@ -0,0 +1,63 @@
+import pytest
+
+from game_sdk.game import output
+from game_sdk.game.agent import Agent, WorkerConfig
+from game_sdk.game.custom_types import Function, FunctionResultStatus
+from game_sdk.game.mock_server import MockGAMEServer
+from game_sdk.game.worker import Worker
+
+
+@pytest.fixture
+def quiet_output(monkeypatch):
+    """Silences the process-wide output sink for the test (restored afterwards)"""
+    monkeypatch.setattr(output, "_output", output.Output("none"))
+
+
+@pytest.fixture
+def server(monkeypatch, quiet_output):
+    """A MockGAMEServer that GAME clients created in the test talk to"""
+    with MockGAMEServer() as server:
+        monkeypatch.setenv("GAME_API_BASE_URL", server.base_url)
+        yield server
+
+
+@pytest.fixture
+def make_function():
+    def make(fn_name="noop", executable=None, **kwargs):
+        return Function(
+            fn_name=fn_name,
+            fn_description="Test function",
+            args=[],
+            executable=executable or (lambda **_: (FunctionResultStatus.DONE, "ok", {})),
+            **kwargs,
+        )
+    return make
+
+
+@pytest.fixture
+def make_worker(make_function):
+    def make(**kwargs):
+        kwargs.setdefault("get_state_fn", lambda function_result, current_state: {})
+        kwargs.setdefault("action_space", [make_function()])
+        return Worker(api_key="apt-test", description="Test worker", **kwargs)
+    return make
+
+
+@pytest.fixture
+def make_agent(make_function):
+    def make(**kwargs):
+        kwargs.setdefault("get_agent_state_fn", lambda function_result, current_state: {})
+        kwargs.setdefault("workers", [WorkerConfig(
+            id="worker",
+            worker_description="Test worker",
+            get_state_fn=lambda function_result, current_state: {},
+            action_space=[make_function()],
+        )])
+        return Agent(
+            api_key="apt-test",
+            name="Test agent",
+            agent_goal="Test",
+            agent_description="Test agent",
+            **kwargs,
+        )
+    return make
@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+
+from game_sdk.game import executor, tracing
+from game_sdk.game.agent import WorkerConfig
+from game_sdk.game.custom_types import ActionType, FunctionResultStatus
+from game_sdk.game.output import Output, get_output, use_output
+
+
+@pytest.fixture
+def spans():
+    exporter = tracing.InMemoryExporter()
+    tracing.configure(exporter)
+    yield exporter.spans
+    tracing.disable()
+
+
+def child_names(span):
+    return [child.name for child in span.children]
+
+
+def observe(seen):
+    """Records the current span and output sink, inside a child span"""
+    with tracing.span("observed"):
+        pass
+    seen.append(get_output())
+
+
+def test_run_in_executor_sees_the_callers_span_and_output(spans):
+    sink, seen = Output("none"), []
+
+    async def main():
+        with tracing.span("root"), use_output(sink):
+            await executor.run_in_executor(observe, seen)
+
+    asyncio.run(main())
+    assert seen == [sink]
+    assert child_names(spans[0]) == ["observed"]
+
+
+def test_run_coroutine_sees_the_callers_span_and_output(spans):
+    sink, seen = Output("none"), []
+
+    async def coroutine():
+        observe(seen)
+
+    with tracing.span("root"), use_output(sink):
+        executor.run_coroutine(coroutine()).result(5)
+
+    assert seen == [sink]
+    assert child_names(spans[0]) == ["observed"]
+
+
+def test_thread_function_calls_see_the_callers_span_and_output(spans):
+    sink, seen = Output("none"), []
+
+    with tracing.span("root"), use_output(sink):
+        executor.submit_function("thread", observe, {"seen": seen}).result(5)
+
+    assert seen == [sink]
+    assert child_names(spans[0]) == ["observed"]
+
+
+def test_worker_astep_nests_function_spans_and_uses_the_worker_output(
+    server, spans, make_worker, make_function
+):
+    server.wait_probability = 0.0
+    sink, seen = Output("none"), []
+
+    def executable(**_):
+        observe(seen)
+        return FunctionResultStatus.DONE, "ok", {}
+
+    worker = make_worker(action_space=[make_function("observe", executable)], output=sink)
+
+    async def main():
+        await worker.aset_task("task")
+        return await worker.astep()
+
+    action_response, function_result = asyncio.run(main())
+    assert action_response.action_type == ActionType.CALL_FUNCTION
+    assert function_result.action_status == FunctionResultStatus.DONE
+    assert seen == [sink]
+
+    [step] = [span for span in spans if span.name == "worker.step"]
+    [execute] = [child for child in step.children if child.name == "function.execute"]
+    assert child_names(execute) == ["observed"]
+    assert "worker.get_state_fn" in child_names(step)
+
+
+def test_agent_astep_runs_coroutine_executables_in_its_span(server, spans, make_agent, make_function):
+    server.wait_probability = 0.0
+    sink, seen = Output("none"), []
+
+    async def executable(**_):
+        await asyncio.sleep(0)
+        observe(seen)
+        return FunctionResultStatus.DONE, "ok", {}
+
+    agent = make_agent(output=sink, workers=[WorkerConfig(
+        id="worker",
+        worker_description="Test worker",
+        get_state_fn=lambda function_result, current_state: {},
+        action_space=[make_function("observe", executable)],
+    )])
+
+    async def main():
+        await asyncio.get_running_loop().run_in_executor(None, agent.compile)
+        for _ in range(5):
+            await agent.astep()
+            if seen:
+                return
+
+    asyncio.run(main())
+    assert seen == [sink]
+    steps = [span for span in spans if span.name == "agent.step"]
+    executes = [child for step in steps for child in step.children if child.name == "function.execute"]
+    assert child_names(executes[0]) == ["observed"]
@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from game_sdk.game.api import GAMEClient
+from game_sdk.game.cassette import use_cassette
+from game_sdk.game.token_cache import access_token_cache
+from game_sdk.game.transport import get_default_transport, set_default_transport
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self.status_code = 200
+        self.text = json.dumps(body)
+        self.headers = {}
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class FakeGAME:
+    """Transport answering the legacy GAMEClient routes used below"""
+    def __init__(self):
+        self.token_requests = 0
+
+    def post(self, url, headers=None, json=None):
+        if url.endswith("/accesses/tokens"):
+            self.token_requests += 1
+            return FakeResponse({"data": {"accessToken": f"token-{self.token_requests}"}})
+        return FakeResponse({"data": {"id": "agent-1"}})
+
+
+@pytest.fixture
+def fake_game():
+    previous = get_default_transport()
+    access_token_cache.clear()
+    fake = set_default_transport(FakeGAME())
+    yield fake
+    set_default_transport(previous)
+    access_token_cache.clear()
+
+
+def test_replay_with_fresh_token_cache(fake_game, tmp_path):
+    path = str(tmp_path / "run.jsonl")
+    # a token cached before recording starts
+    GAMEClient("key").create_agent("name", "description", "goal")
+    assert fake_game.token_requests == 1
+
+    with use_cassette(path, mode="record"):
+        assert GAMEClient("key").create_agent("name", "description", "goal") == "agent-1"
+    assert fake_game.token_requests == 2
+
+    # as in a fresh process: nothing cached
+    access_token_cache.clear()
+    with use_cassette(path, mode="replay") as transport:
+        assert GAMEClient("key").create_agent("name", "description", "goal") == "agent-1"
+        assert transport.remaining() == 0
+    assert fake_game.token_requests == 2
+
+
+def test_tokens_do_not_leak_out_of_the_cassette(fake_game, tmp_path):
+    path = str(tmp_path / "run.jsonl")
+    with use_cassette(path, mode="record"):
+        GAMEClient("key").create_agent("name", "description", "goal")
+
+    GAMEClient("key").create_agent("name", "description", "goal")
+    with use_cassette(path, mode="replay"):
+        GAMEClient("key").create_agent("name", "description", "goal")
+    assert access_token_cache.get("key", lambda: "unused") == "token-2"
@@ -0,0 +1,44 @@
+import json
+
+import pytest
+
+
+def test_restore_resumes_where_the_checkpoint_left_off(server, make_agent, tmp_path):
+    steps = iter(range(100))
+    agent = make_agent(get_agent_state_fn=lambda function_result, current_state: {"step": next(steps)})
+    agent.compile()
+    agent.step()
+    agent.step()
+    agent.push_event("hello", source="test", priority=2)
+    path = str(tmp_path / "agent.json.gz")
+    agent.checkpoint(path)
+
+    restored = make_agent()
+    restored.restore(path)
+    assert restored.agent_id == agent.agent_id
+    assert restored.current_worker_id == "worker"
+    assert restored.agent_state == agent.agent_state
+    assert restored.worker_states == agent.worker_states
+    assert restored.observation == agent.observation
+    assert restored._session.id == agent._session.id
+    assert restored._session.function_result == agent._session.function_result
+    assert [(e.content, e.source, e.priority) for e in restored.inbox.take().events] == [("hello", "test", 2)]
+
+    restored.step()
+    assert restored._session.id == agent._session.id
+
+
+@pytest.mark.parametrize("current_worker_id", ["removed", None])
+def test_restore_rejects_unknown_current_worker(server, make_agent, tmp_path, current_worker_id):
+    agent = make_agent()
+    agent.compile()
+    path = tmp_path / "agent.json"
+    agent.checkpoint(str(path))
+    state = json.loads(path.read_text())
+    state["current_worker_id"] = current_worker_id
+    path.write_text(json.dumps(state))
+
+    restored = make_agent()
+    with pytest.raises(ValueError, match="current worker"):
+        restored.restore(str(path))
+    assert restored.current_worker_id is None
@@ -0,0 +1,83 @@
+import asyncio
+import threading
+
+import pytest
+
+from game_sdk.game.custom_types import FunctionResultStatus
+
+
+async def report_loop(loops, **_):
+    await asyncio.sleep(0)
+    loops.append((asyncio.get_running_loop(), threading.current_thread()))
+    return FunctionResultStatus.DONE, "ok", {}
+
+
+def test_blocking_calls_reuse_one_background_loop(make_function):
+    loops = []
+
+    async def executable(**_):
+        return await report_loop(loops)
+
+    function = make_function(executable=executable)
+    first = function.execute(fn_id="1", args={})
+    second = function.execute(fn_id="2", args={})
+
+    assert first.action_status == second.action_status == FunctionResultStatus.DONE
+    assert loops[0] == loops[1]
+    assert loops[0][1] is not threading.current_thread()
+
+
+def test_async_calls_await_on_the_callers_loop(make_function):
+    loops = []
+
+    async def executable(**_):
+        return await report_loop(loops)
+
+    function = make_function(executable=executable)
+
+    async def main():
+        result = await function.aexecute(fn_id="1", args={})
+        return result, asyncio.get_running_loop()
+
+    result, loop = asyncio.run(main())
+    assert result.action_status == FunctionResultStatus.DONE
+    assert loops == [(loop, threading.current_thread())]
+
+
+def test_async_callable_objects_are_coroutine_executables(make_function):
+    class Executable:
+        async def __call__(self, value, **_):
+            return FunctionResultStatus.DONE, f"got {value}", {}
+
+    function = make_function(executable=Executable())
+    result = function.execute(fn_id="1", args={"value": {"value": 3}})
+    assert result.feedback_message == "got 3"
+
+
+def test_exceptions_fail_the_call(make_function):
+    async def executable(**_):
+        raise RuntimeError("boom")
+
+    function = make_function(executable=executable)
+    for result in (function.execute(fn_id="1", args={}), asyncio.run(function.aexecute(fn_id="2", args={}))):
+        assert result.action_status == FunctionResultStatus.FAILED
+        assert "boom" in result.feedback_message
+
+
+def test_async_timeout_fails_the_call(make_function):
+    async def executable(**_):
+        await asyncio.sleep(30)
+
+    function = make_function(executable=executable, timeout=0.05)
+    result = asyncio.run(function.aexecute(fn_id="1", args={}))
+    assert result.action_status == FunctionResultStatus.FAILED
+    assert "timed out" in result.feedback_message
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_execution_backends_are_rejected(make_function, backend):
+    async def executable(**_):
+        return FunctionResultStatus.DONE, "ok", {}
+
+    with pytest.raises(ValueError):
+        make_function(executable=executable, execution_backend=backend)
@@ -0,0 +1,72 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from game_sdk.game import executor
+from game_sdk.game.custom_types import FunctionResultStatus
+
+
+def sleep_then_done(seconds=0.0, **_):
+    time.sleep(seconds)
+    return FunctionResultStatus.DONE, f"slept {seconds}", {}
+
+
+def test_thread_timeout_fails_the_call(make_function):
+    release = threading.Event()
+    function = make_function(
+        executable=lambda **_: (release.wait(5), (FunctionResultStatus.DONE, "ok", {}))[1],
+        timeout=0.1,
+    )
+    started = time.monotonic()
+    result = function.execute(fn_id="1", args={})
+    release.set()
+    assert result.action_status == FunctionResultStatus.FAILED
+    assert "timed out" in result.feedback_message
+    assert time.monotonic() - started < 2
+
+
+def test_process_timeout_does_not_fail_other_process_calls(make_function):
+    shared = executor.submit_function("process", sleep_then_done, {"seconds": 1.0})
+    hung = make_function(executable=sleep_then_done, execution_backend="process", timeout=0.2)
+
+    result = hung.execute(fn_id="1", args={"seconds": {"value": 30}})
+    assert result.action_status == FunctionResultStatus.FAILED
+    assert "timed out" in result.feedback_message
+    assert shared.result(timeout=10)[1] == "slept 1.0"
+
+
+def test_finished_process_call_releases_its_process(make_function):
+    function = make_function(executable=sleep_then_done, execution_backend="process", timeout=10)
+    result = function.execute(fn_id="1", args={})
+    assert result.action_status == FunctionResultStatus.DONE
+    assert executor._isolated_calls == {}
+
+
+def test_coroutine_timeout_cancels_the_coroutine(make_function):
+    cancelled = threading.Event()
+
+    async def hang(**_):
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    function = make_function(executable=hang, timeout=0.1)
+    assert function.execute(fn_id="1", args={}).action_status == FunctionResultStatus.FAILED
+    assert cancelled.wait(2)
+    assert asyncio.run(function.aexecute(fn_id="2", args={})).action_status == FunctionResultStatus.FAILED
+
+
+def test_run_coroutine_rejects_the_loop_thread():
+    async def nested():
+        coro = asyncio.sleep(0)
+        try:
+            executor.run_coroutine(coro)
+        finally:
+            coro.close()
+
+    with pytest.raises(RuntimeError):
+        executor.run_coroutine(nested()).result(timeout=5)
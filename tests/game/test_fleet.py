@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+
+from game_sdk.game.fleet import Fleet
+from game_sdk.game.idle import IdlePolicy
+
+
+@pytest.fixture
+def make_compiled_agent(make_agent):
+    def make():
+        agent = make_agent(idle_policy=IdlePolicy(initial_delay=0))
+        agent.compile()
+        return agent
+    return make
+
+
+def test_listeners_are_removed_when_the_fleet_finishes(server, make_compiled_agent):
+    agent = make_compiled_agent()
+    fleets = [Fleet(), Fleet()]
+    members = [fleet.add(agent, max_steps=2) for fleet in fleets]
+    assert agent._wake_signal._listeners == []
+
+    for fleet in fleets:
+        fleet.run()
+    assert [member.steps for member in members] == [2, 2]
+    assert agent._wake_signal._listeners == []
+
+    # notifying an agent of finished fleets is a no-op for them
+    agent.notify()
+
+
+def test_removed_member_is_not_stepped(server, make_compiled_agent):
+    agent, other = make_compiled_agent(), make_compiled_agent()
+    fleet = Fleet()
+    removed = fleet.add(agent, max_steps=2)
+    kept = fleet.add(other, max_steps=2)
+    fleet.remove(removed)
+
+    assert fleet.run() == [kept]
+    assert removed.steps == 0 and kept.steps == 2
+    assert agent._wake_signal._listeners == []
+
+
+@pytest.fixture
+def make_scripted_worker(make_worker):
+    """Workers whose steps are recorded in `log` instead of calling GAME"""
+    def make(name, log, delay=0.0, error=None):
+        worker = make_worker()
+
+        async def astep():
+            log.append(("start", name))
+            await asyncio.sleep(delay)
+            log.append(("end", name))
+            if error is not None:
+                raise error
+            return None, None
+
+        worker.astep = astep
+        return worker
+    return make
+
+
+def max_in_flight(log):
+    in_flight = peak = 0
+    for event, _ in log:
+        in_flight += 1 if event == "start" else -1
+        peak = max(peak, in_flight)
+    return peak
+
+
+def test_steps_in_flight_are_bounded(server, make_scripted_worker):
+    log = []
+    fleet = Fleet(max_concurrency=3)
+    members = [fleet.add(make_scripted_worker(i, log, delay=0.02), task="task", max_steps=2) for i in range(8)]
+
+    fleet.run()
+    assert [member.steps for member in members] == [2] * 8
+    assert max_in_flight(log) == 3
+
+
+def test_weights_interleave_steps(server, make_scripted_worker):
+    log = []
+    fleet = Fleet(max_concurrency=1)
+    fleet.add(make_scripted_worker("heavy", log), task="task", weight=3, max_steps=6)
+    fleet.add(make_scripted_worker("light", log), task="task", max_steps=2)
+
+    fleet.run()
+    order = [name for event, name in log if event == "start"]
+    assert order[:4] == ["heavy", "heavy", "light", "heavy"]
+    assert order.count("heavy") == 6 and order.count("light") == 2
+
+
+def test_failed_step_retires_only_that_member(server, make_scripted_worker):
+    log = []
+    fleet = Fleet()
+    failing = fleet.add(make_scripted_worker("failing", log, error=RuntimeError("boom")), task="task")
+    healthy = fleet.add(make_scripted_worker("healthy", log), task="task", max_steps=3)
+
+    fleet.run()
+    assert failing.done and isinstance(failing.error, RuntimeError) and failing.steps == 0
+    assert healthy.steps == 3 and healthy.error is None
+
+
+def test_stop_without_drain_cancels_steps_in_flight(server, make_scripted_worker):
+    log = []
+    fleet = Fleet()
+    member = fleet.add(make_scripted_worker("slow", log, delay=30), task="task")
+
+    async def main():
+        run = asyncio.ensure_future(fleet.arun())
+        while not log:
+            await asyncio.sleep(0.01)
+        fleet.stop(drain=False)
+        return await asyncio.wait_for(run, 5)
+
+    asyncio.run(main())
+    assert log == [("start", "slow")] and member.steps == 0
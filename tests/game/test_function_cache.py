@@ -0,0 +1,207 @@
+import asyncio
+import threading
+import time
+
+from game_sdk.game.custom_types import FunctionResultStatus
+from game_sdk.game.function_cache import FunctionCache
+
+
+def counting(result=None):
+    calls = []
+
+    def fn():
+        calls.append(1)
+        return result or (FunctionResultStatus.DONE, "ok", {"count": len(calls)})
+    return fn, calls
+
+
+def run_inline(job):
+    job()
+
+
+def test_hits_until_ttl_expires():
+    cache = FunctionCache(ttl=0.05)
+    fn, calls = counting()
+    key = cache.key("topics", {"limit": 5})
+
+    assert cache.call(key, fn, run_inline)[2] == {"count": 1}
+    assert cache.call(key, fn, run_inline)[2] == {"count": 1}
+    time.sleep(0.06)
+    assert cache.call(key, fn, run_inline)[2] == {"count": 2}
+    assert len(calls) == 2
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 2
+
+
+def test_keys_ignore_argument_order_and_none():
+    cache = FunctionCache()
+    assert cache.key("f", {"a": 1, "b": 2, "c": None}) == cache.key("f", {"b": 2, "a": 1})
+    assert cache.key("f", {"a": 1}) != cache.key("g", {"a": 1})
+
+
+def test_arguments_without_a_stable_key_are_not_cached():
+    cache = FunctionCache()
+    fn, calls = counting()
+    key = cache.key("search", {"client": object()})
+    assert key is None
+
+    cache.call(key, fn, run_inline)
+    cache.call(key, fn, run_inline)
+    assert len(calls) == 2
+    assert cache.stats()["uncacheable"] == 2 and cache.stats()["size"] == 0
+
+
+def test_key_fn_makes_object_arguments_cacheable():
+    class Client:
+        id = "c1"
+
+    cache = FunctionCache(key_fn=lambda args: {"client": args["client"].id})
+    fn, calls = counting()
+    cache.call(cache.key("search", {"client": Client()}), fn, run_inline)
+    cache.call(cache.key("search", {"client": Client()}), fn, run_inline)
+    assert len(calls) == 1
+
+
+def test_only_done_results_are_cached():
+    cache = FunctionCache()
+    fn, calls = counting((FunctionResultStatus.FAILED, "boom", {}))
+    cache.call("k", fn, run_inline)
+    cache.call("k", fn, run_inline)
+    assert len(calls) == 2
+
+
+def test_least_recently_used_is_evicted():
+    cache = FunctionCache(max_entries=2)
+    fn, calls = counting()
+    cache.call("a", fn, run_inline)
+    cache.call("b", fn, run_inline)
+    cache.call("a", fn, run_inline)
+    cache.call("c", fn, run_inline)
+
+    assert cache.stats()["evictions"] == 1
+    cache.call("a", fn, run_inline)
+    assert len(calls) == 3
+    cache.call("b", fn, run_inline)
+    assert len(calls) == 4
+
+
+def test_callers_get_their_own_copy_of_info():
+    cache = FunctionCache()
+    fn, _ = counting((FunctionResultStatus.DONE, "ok", {"topics": ["a"]}))
+
+    first = cache.call("k", fn, run_inline)
+    first[2]["topics"].append("mutated")
+    second = cache.call("k", fn, run_inline)
+    second[2]["extra"] = True
+
+    assert cache.call("k", fn, run_inline)[2] == {"topics": ["a"]}
+
+
+def test_stale_result_is_returned_while_refreshing():
+    cache = FunctionCache(ttl=0.01, stale_while_revalidate=10)
+    fn, calls = counting()
+    jobs = []
+    cache.call("k", fn, run_inline)
+    time.sleep(0.02)
+
+    assert cache.call("k", fn, jobs.append)[2] == {"count": 1}
+    assert cache.call("k", fn, jobs.append)[2] == {"count": 1}
+    assert len(jobs) == 1 and len(calls) == 1
+
+    jobs[0]()
+    assert cache.call("k", fn, jobs.append)[2] == {"count": 2}
+    assert cache.stats()["refreshes"] == 1
+
+
+def test_concurrent_misses_call_once():
+    cache = FunctionCache()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        release.wait(5)
+        return FunctionResultStatus.DONE, "ok", {"n": 1}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.call("k", slow, run_inline)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while cache.stats()["coalesced"] < 7 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert len(results) == 8 and all(result[2] == {"n": 1} for result in results)
+    assert len({id(result[2]) for result in results}) == 8
+
+
+def test_concurrent_misses_share_the_error():
+    cache = FunctionCache()
+    started, release = threading.Event(), threading.Event()
+    errors = []
+
+    def failing():
+        started.set()
+        release.wait(5)
+        raise RuntimeError("down")
+
+    def call():
+        try:
+            cache.call("k", failing, run_inline)
+        except RuntimeError as e:
+            errors.append(e)
+
+    owner = threading.Thread(target=call)
+    owner.start()
+    started.wait(5)
+    waiter = threading.Thread(target=call)
+    waiter.start()
+    while cache.stats()["coalesced"] < 1:
+        time.sleep(0.005)
+    release.set()
+    owner.join(5)
+    waiter.join(5)
+
+    assert len(errors) == 2
+    calls = []
+    cache.call("k", lambda: calls.append(1) or (FunctionResultStatus.DONE, "ok", {}), run_inline)
+    assert calls == [1]
+
+
+def test_async_concurrent_misses_call_once():
+    cache = FunctionCache()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return FunctionResultStatus.DONE, "ok", {"n": 1}
+
+    async def main():
+        return await asyncio.gather(*(cache.acall("k", fetch) for _ in range(5)))
+
+    results = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(result[2] == {"n": 1} for result in results)
+    assert asyncio.run(cache.acall("k", fetch))[2] == {"n": 1} and len(calls) == 1
+
+
+def test_function_execute_uses_the_cache(make_function):
+    calls = []
+
+    def get_topics(**_):
+        calls.append(1)
+        return FunctionResultStatus.DONE, "topics", {"topics": ["a"]}
+
+    function = make_function("get_topics", get_topics, cache=FunctionCache())
+    first = function.execute(fn_id="1", args={})
+    second = function.execute(fn_id="2", args={})
+    assert first.action_status == second.action_status == FunctionResultStatus.DONE
+    assert second.feedback_message == "topics"
+    assert len(calls) == 1
@@ -0,0 +1,97 @@
+import threading
+
+import pytest
+
+from game_sdk.game.agent import WorkerConfig
+from game_sdk.game.api_v2 import GAMEClientV2
+from game_sdk.game.state_budget import KeepNewest, StateBudget
+
+
+@pytest.fixture
+def create_agent_calls(monkeypatch):
+    calls = []
+    create_agent = GAMEClientV2.create_agent
+
+    def counting(self, *args, **kwargs):
+        calls.append(args)
+        return create_agent(self, *args, **kwargs)
+
+    monkeypatch.setattr(GAMEClientV2, "create_agent", counting)
+    return calls
+
+
+def test_workers_share_one_lazily_created_agent(server, make_agent, create_agent_calls):
+    agent = make_agent()
+    registered = len(create_agent_calls)
+    workers = [agent.get_worker("worker") for _ in range(3)]
+    assert len(create_agent_calls) == registered
+
+    workers[0].set_task("first")
+    workers[1].set_task("second")
+    assert len(create_agent_calls) == registered + 1
+    assert workers[0]._agent_id == workers[1]._agent_id == workers[2]._ensure_agent()
+    assert len(create_agent_calls) == registered + 1
+
+
+def test_each_call_returns_independent_task_state(server, make_agent):
+    agent = make_agent()
+    first, second = agent.get_worker("worker"), agent.get_worker("worker")
+    assert first is not second
+
+    first.set_task("first")
+    assert second._submission_id is None
+    first.inbox.push("event")
+    assert len(second.inbox) == 0
+
+
+def test_concurrent_callers_register_once(server, make_agent, create_agent_calls):
+    agent = make_agent()
+    registered = len(create_agent_calls)
+    workers = [agent.get_worker("worker") for _ in range(8)]
+    threads = [threading.Thread(target=worker.set_task, args=("task",)) for worker in workers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(create_agent_calls) == registered + 1
+    assert len({worker._submission_id for worker in workers}) == 8
+
+
+def test_config_changes_build_a_new_template(server, make_agent, make_function, create_agent_calls):
+    agent = make_agent()
+    config = agent.get_worker_config("worker")
+
+    def agent_id():
+        worker = agent.get_worker("worker")
+        return worker._ensure_agent()
+
+    first = agent_id()
+    assert agent_id() == first
+
+    config.action_space["noop"] = make_function(executable=lambda **_: None)
+    second = agent_id()
+    assert second != first
+
+    config.get_state_fn = lambda function_result, current_state: {"new": True}
+    assert agent.get_worker("worker").state == {"instructions": None, "new": True}
+    third = agent_id()
+    assert third != second
+
+    config.state_budget = StateBudget(policies={"jobs": KeepNewest(1)})
+    assert agent_id() != third
+
+    agent.add_worker(WorkerConfig(
+        id="worker",
+        worker_description="Replaced",
+        get_state_fn=lambda function_result, current_state: {},
+        action_space=[make_function()],
+    ))
+    assert agent_id() not in (first, second, third)
+
+
+def test_fork_follows_its_own_instruction(server, make_worker):
+    worker = make_worker(instruction="original")
+    fork = worker.fork()
+    fork.instruction = "changed"
+    assert fork.get_state_fn(None, None)["instructions"] == "changed"
+    assert worker.get_state_fn(None, None)["instructions"] == "original"
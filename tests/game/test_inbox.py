@@ -0,0 +1,84 @@
+import asyncio
+import json
+
+import pytest
+
+from game_sdk.game.inbox import EventInbox
+from game_sdk.game.state_budget import StateBudget
+
+
+def observation_size(batch):
+    return len(json.dumps(batch.observation, default=str))
+
+
+def test_oversized_non_text_event_is_truncated():
+    inbox = EventInbox(max_chars=200)
+    inbox.push({"blob": "x" * 500}, source="test", priority=5)
+    inbox.push("small", source="test")
+
+    batch = inbox.take()
+    assert len(batch.events) == 1
+    assert batch.events[0].priority == 5
+    content = batch.observation["events"][0]["content"]
+    assert content.startswith('{"blob": "xxx') and content.endswith("...")
+    assert observation_size(batch) <= 200
+
+    # the inbox keeps draining
+    batch = inbox.take()
+    assert batch.observation["events"] == [{"content": "small", "source": "test"}]
+    assert inbox.take() is None
+
+
+def test_truncation_counts_escaped_characters():
+    inbox = EventInbox(max_chars=200)
+    inbox.push('say "hi" \\ ' * 50)
+
+    batch = inbox.take()
+    content = batch.observation["events"][0]["content"]
+    assert len(content) > 50
+    assert observation_size(batch) <= 200
+
+
+def test_truncation_of_non_ascii_text_fits_budget():
+    inbox = EventInbox(max_chars=150)
+    inbox.push("héllo wörld 😀 " * 40)
+
+    batch = inbox.take()
+    assert batch.observation["events"][0]["content"].startswith("héllo")
+    assert observation_size(batch) <= 150
+
+
+class FailingPolicy:
+    def apply(self, value):
+        raise RuntimeError("policy failed")
+
+
+def failing_budget():
+    return StateBudget(policies={"*": FailingPolicy()})
+
+
+def test_worker_keeps_events_when_the_payload_cannot_be_built(server, make_worker):
+    worker = make_worker(
+        get_state_fn=lambda function_result, current_state: {"jobs": []},
+        state_budget=failing_budget(),
+    )
+    worker.set_task("task")
+    worker.inbox.push("message", source="test")
+    with pytest.raises(RuntimeError):
+        worker.step()
+    assert len(worker.inbox) == 1
+    with pytest.raises(RuntimeError):
+        asyncio.run(worker.astep())
+    assert len(worker.inbox) == 1
+
+
+def test_agent_keeps_events_when_the_payload_cannot_be_built(server, make_agent):
+    agent = make_agent(
+        get_agent_state_fn=lambda function_result, current_state: {"jobs": []},
+        state_budget=failing_budget(),
+    )
+    agent.compile()
+    agent.push_event("message", source="test")
+    with pytest.raises(RuntimeError):
+        agent.step()
+    assert len(agent.inbox) == 1
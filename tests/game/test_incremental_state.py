@@ -0,0 +1,110 @@
+import threading
+
+import pytest
+
+from game_sdk.game.incremental_state import IncrementalState, StateSnapshot, StateWithInstructions
+
+
+def test_unchanged_state_returns_the_same_snapshot():
+    state = IncrementalState({"wallet": "0x1"})
+    first = state.refresh()
+    assert isinstance(first, StateSnapshot) and first == {"wallet": "0x1"}
+    assert state.refresh() is first
+    assert state.unchanged
+
+    state.set("wallet", "0x1")
+    assert state.refresh() is first
+
+    state.set("wallet", "0x2")
+    second = state.refresh()
+    assert second == {"wallet": "0x2"} and second.version == first.version + 1
+    assert state.last_changed == {"wallet"}
+    assert first == {"wallet": "0x1"}
+
+
+def test_touch_and_delete_count_as_changes():
+    state = IncrementalState({"jobs": [1], "debug": True})
+    snapshot = state.refresh()
+    state.get("jobs").append(2)
+    state.touch("jobs")
+    state.delete("debug")
+    assert state.refresh() == {"jobs": [1, 2]}
+    assert "debug" in snapshot
+
+
+def test_providers_run_only_when_invalidated():
+    calls = []
+    state = IncrementalState()
+    state.register("jobs", lambda function_result: calls.append(function_result) or len(calls))
+    state.register("clock", lambda function_result: object(), every_step=True)
+
+    first = state.refresh("a")
+    assert first["jobs"] == 1 and calls == ["a"]
+    second = state.refresh("b")
+    assert second["jobs"] == 1 and calls == ["a"] and second is not first
+
+    state.invalidate("jobs")
+    assert state.refresh("c")["jobs"] == 2 and calls == ["a", "c"]
+
+
+def test_works_as_a_state_function():
+    state = IncrementalState({"a": 1})
+    wrapped = StateWithInstructions(state, type("Owner", (), {"instruction": "do it"})())
+    first = wrapped(None, None)
+    assert first == {"instructions": "do it", "a": 1}
+    assert wrapped(None, first) is first
+
+
+def test_set_does_not_wait_for_providers():
+    started, release = threading.Event(), threading.Event()
+
+    def slow(function_result):
+        started.set()
+        release.wait(5)
+        return "slow"
+
+    state = IncrementalState()
+    state.register("slow", slow)
+    refreshing = threading.Thread(target=state.refresh)
+    refreshing.start()
+    assert started.wait(5)
+
+    setter = threading.Thread(target=state.set, args=("event", "message"))
+    setter.start()
+    setter.join(1)
+    assert not setter.is_alive()
+
+    release.set()
+    refreshing.join()
+    assert state.refresh() == {"slow": "slow", "event": "message"}
+
+
+def test_provider_may_register_and_delete_keys():
+    state = IncrementalState()
+
+    def jobs(function_result):
+        state.register("job_count", lambda function_result: len(state.get("jobs", [])))
+        state.delete("stale")
+        return [1, 2]
+
+    state.register("stale", lambda function_result: "old")
+    state.register("jobs", jobs)
+    first = state.refresh()
+    assert "stale" not in first and first["jobs"] == [1, 2]
+    assert state.refresh() == {"jobs": [1, 2], "job_count": 2}
+
+
+def test_failed_provider_is_retried_on_the_next_refresh():
+    attempts = []
+
+    def flaky(function_result):
+        attempts.append(function_result)
+        if len(attempts) == 1:
+            raise RuntimeError("unavailable")
+        return "ok"
+
+    state = IncrementalState()
+    state.register("flaky", flaky)
+    with pytest.raises(RuntimeError):
+        state.refresh()
+    assert state.refresh() == {"flaky": "ok"}
@@ -0,0 +1,95 @@
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from game_sdk.game.rate_limit import FileTokenBucket, RateLimit, RateLimiter, TokenBucket
+
+
+def test_bucket_allows_a_burst_then_spaces_requests():
+    bucket = TokenBucket(RateLimit(rate=10, burst=3))
+    delays = [bucket.reserve() for _ in range(5)]
+    assert delays[:3] == [0.0, 0.0, 0.0]
+    assert delays[3] == pytest.approx(0.1, abs=0.02)
+    assert delays[4] == pytest.approx(0.2, abs=0.02)
+
+
+def test_bucket_reservations_are_unique_across_threads():
+    bucket = TokenBucket(RateLimit(rate=100))
+    delays = []
+    lock = threading.Lock()
+
+    def reserve():
+        for _ in range(25):
+            delay = bucket.reserve()
+            with lock:
+                delays.append(delay)
+
+    threads = [threading.Thread(target=reserve) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 100 slots 10ms apart: the last caller waits for all the others
+    assert len(delays) == 100
+    assert max(delays) == pytest.approx(0.99, abs=0.05)
+
+
+def test_rate_limit_rejects_non_positive_rates():
+    with pytest.raises(ValueError):
+        RateLimit(rate=0)
+
+
+def test_limiter_budgets_are_per_api_key_and_bucket():
+    limiter = RateLimiter(worker_action=RateLimit(rate=1), chat=RateLimit(rate=1))
+    assert limiter.reserve("key-a", "get_worker_action") == 0.0
+    assert limiter.reserve("key-a", "get_worker_action") > 0.5
+    assert limiter.reserve("key-b", "get_worker_action") == 0.0
+    # chat endpoints share one budget; unlisted and unconfigured budgets are unlimited
+    assert limiter.reserve("key-a", "create_chat") == 0.0
+    assert limiter.reserve("key-a", "update_chat") > 0.5
+    assert limiter.reserve("key-a", "get_agent_action") == 0.0
+    assert limiter.reserve("key-a", "create_agent") == 0.0
+
+    stats = limiter.stats()
+    assert stats["worker_action"]["requests"] == 3 and stats["worker_action"]["delayed"] == 1
+    assert stats["chat"]["delayed"] == 1 and "agent_action" not in stats
+
+
+def test_unlimited_limiter_is_disabled():
+    assert not RateLimiter().enabled
+    assert RateLimiter(chat=RateLimit(rate=1)).enabled
+
+
+def test_file_buckets_share_the_budget(tmp_path):
+    pytest.importorskip("fcntl")
+    first = RateLimiter(worker_action=RateLimit(rate=1, burst=2), path=str(tmp_path))
+    second = RateLimiter(worker_action=RateLimit(rate=1, burst=2), path=str(tmp_path))
+
+    assert first.reserve("key", "get_worker_action") == 0.0
+    assert second.reserve("key", "get_worker_action") == 0.0
+    assert first.reserve("key", "get_worker_action") > 0.5
+    assert second.reserve("other-key", "get_worker_action") == 0.0
+    # file names hold a digest of the key, never the key itself
+    assert all("key" not in path.name for path in tmp_path.iterdir())
+
+
+def test_file_bucket_is_shared_with_other_processes(tmp_path):
+    pytest.importorskip("fcntl")
+    path = str(tmp_path / "worker_action.bucket")
+    assert FileTokenBucket(RateLimit(rate=1), path).reserve() == 0.0
+
+    script = (
+        "import sys\n"
+        "from game_sdk.game.rate_limit import FileTokenBucket, RateLimit\n"
+        "print(FileTokenBucket(RateLimit(rate=1), sys.argv[1]).reserve())\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script, path],
+        capture_output=True, text=True, check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    ).stdout
+    assert float(output) > 0.5
@@ -0,0 +1,42 @@
+import multiprocessing
+
+import pytest
+
+from game_sdk.game import registry as registry_module
+from game_sdk.game.registry import AgentRegistry
+
+
+@pytest.mark.parametrize("contents", [
+    "",
+    "[]",
+    '{"version": 1, "entries": {"a": {"id": "x"}',
+    '{"version": 1, "entries": []}',
+    '{"version": 1, "entries": {"a": "x", "b": {"kind": "agent"}}}',
+])
+def test_malformed_file_is_treated_as_empty(tmp_path, contents):
+    path = tmp_path / "registry.json"
+    path.write_text(contents)
+
+    registry = AgentRegistry(str(path))
+    assert registry.get("a") is None
+    registry.put("a", "agent-1", "agent")
+    assert AgentRegistry(str(path)).get("a") == "agent-1"
+
+
+def register(path, worker, count):
+    registry = AgentRegistry(path)
+    for i in range(count):
+        registry.put(f"{worker}-{i}", f"id-{worker}-{i}", "agent")
+
+
+@pytest.mark.skipif(registry_module.fcntl is None, reason="needs fcntl")
+def test_concurrent_processes_do_not_lose_entries(tmp_path):
+    path = str(tmp_path / "registry.json")
+    processes = [multiprocessing.Process(target=register, args=(path, worker, 25)) for worker in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    registry = AgentRegistry(path)
+    assert all(registry.get(f"{worker}-{i}") == f"id-{worker}-{i}" for worker in range(4) for i in range(25))
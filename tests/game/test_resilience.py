@@ -0,0 +1,42 @@
+from types import SimpleNamespace
+
+import pytest
+
+from game_sdk.game.resilience import CircuitBreaker, CircuitOpenError, Resilience, RetryPolicy
+
+
+def respond(*statuses):
+    responses = iter(SimpleNamespace(status_code=status, headers={}) for status in statuses)
+    return lambda: next(responses)
+
+
+@pytest.fixture
+def resilience():
+    return Resilience(retry=RetryPolicy(max_attempts=1), failure_threshold=3, reset_timeout=0)
+
+
+def test_client_errors_do_not_reset_the_failure_count(resilience):
+    for status in (500, 500, 404, 401, 422):
+        resilience.call("endpoint", respond(status))
+    resilience.call("endpoint", respond(503))
+    assert resilience.breaker("endpoint").state != CircuitBreaker.CLOSED
+
+
+def test_success_resets_the_failure_count(resilience):
+    for status in (500, 500, 200, 500, 500):
+        resilience.call("endpoint", respond(status))
+    assert resilience.breaker("endpoint").state == CircuitBreaker.CLOSED
+
+
+def test_client_error_on_trial_call_lets_the_next_call_through():
+    resilience = Resilience(retry=RetryPolicy(max_attempts=1), failure_threshold=1, reset_timeout=60)
+    resilience.call("endpoint", respond(500))
+    with pytest.raises(CircuitOpenError):
+        resilience.call("endpoint", respond(200))
+
+    breaker = resilience.breaker("endpoint")
+    breaker._opened_at -= 60
+    resilience.call("endpoint", respond(404))
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert resilience.call("endpoint", respond(200)).status_code == 200
+    assert breaker.state == CircuitBreaker.CLOSED
@@ -0,0 +1,85 @@
+import json
+import logging
+
+from game_sdk.game.incremental_state import IncrementalState
+from game_sdk.game.output import Output
+from game_sdk.game.state_budget import DropKey, KeepNewest, StateBudget, TruncateString
+
+
+def size(state):
+    return len(json.dumps(state))
+
+
+def test_nothing_trimmed_returns_no_report():
+    state = {"jobs": [1]}
+    assert StateBudget(policies={"jobs": KeepNewest(5)}).apply(state) == (state, None)
+    assert StateBudget(max_chars=100, policies={"jobs": KeepNewest(0)}).apply(state) == (state, None)
+
+
+def test_policies_without_max_chars_always_apply():
+    state = {"jobs": [1, 2, 3, 4], "debug": "x"}
+    trimmed, report = StateBudget(policies={"jobs": KeepNewest(2), "debug": DropKey()}).apply(state)
+    assert trimmed == {"jobs": [3, 4]}
+    assert report.trimmed == {"jobs": "kept newest 2 of 4 items", "debug": "dropped"}
+    assert not report.over_budget
+    assert state == {"jobs": [1, 2, 3, 4], "debug": "x"}
+
+
+def test_policies_stop_once_within_budget():
+    state = {"jobs": list(range(50)), "notes": "n" * 100}
+    budget = StateBudget(max_chars=150, policies={"jobs": KeepNewest(5), "notes": TruncateString(10)})
+    trimmed, report = budget.apply(state)
+    assert trimmed["jobs"] == [45, 46, 47, 48, 49]
+    assert trimmed["notes"] == state["notes"]
+    assert report.final_chars == size(trimmed) <= 150
+    assert list(report.trimmed) == ["jobs"]
+
+
+def test_still_over_budget_is_reported():
+    state = {"blob": "x" * 500}
+    trimmed, report = StateBudget(max_chars=100, policies={"other": DropKey()}).apply(state)
+    assert trimmed is state
+    assert report.over_budget and report.trimmed == {}
+
+
+def test_wildcards_reach_nested_lists_and_dicts():
+    state = {
+        "tweets": [{"text": "a" * 20, "id": 1}, {"text": "short", "id": 2}],
+        "acp": {"buyer": {"jobs": [1, 2, 3]}, "seller": {"jobs": [4, 5, 6]}},
+    }
+    budget = StateBudget(policies={
+        "tweets.*.text": TruncateString(5),
+        "acp.*.jobs": KeepNewest(1, newest_first=True),
+    })
+    trimmed, report = budget.apply(state)
+    assert [t["text"] for t in trimmed["tweets"]] == ["aaaaa...", "short"]
+    assert trimmed["acp"] == {"buyer": {"jobs": [1]}, "seller": {"jobs": [4]}}
+    assert set(report.trimmed) == {"tweets.*.text", "acp.buyer.jobs", "acp.seller.jobs"}
+    assert state["tweets"][0]["text"] == "a" * 20
+
+
+def test_unchanged_snapshot_result_is_reused_until_settings_change():
+    state = IncrementalState({"jobs": list(range(10))})
+    budget = StateBudget(policies={"jobs": KeepNewest(3)})
+    snapshot = state.refresh()
+    first = budget.apply(snapshot)
+    assert budget.apply(state.refresh()) is not None
+    assert budget.apply(state.refresh())[0] is first[0]
+
+    budget.policies["jobs"] = KeepNewest(1)
+    assert budget.apply(state.refresh())[0] == {"jobs": [9]}
+    budget.max_chars = 10_000
+    assert budget.apply(state.refresh()) == (snapshot, None)
+
+
+def test_worker_reports_only_actual_trims(server, make_worker, caplog):
+    caplog.set_level(logging.DEBUG, logger="game_sdk")
+    worker = make_worker(
+        get_state_fn=lambda function_result, current_state: {"jobs": [1]},
+        state_budget=StateBudget(policies={"jobs": KeepNewest(5)}),
+        output=Output("log"),
+    )
+    worker.set_task("task")
+    worker.step()
+    assert worker.state_budget_report is None
+    assert "state.trimmed" not in caplog.text
@@ -0,0 +1,55 @@
+import threading
+import time
+
+import pytest
+
+from game_sdk.game import executor
+from game_sdk.game.custom_types import Function, FunctionResultStatus
+from game_sdk.game.state_refresh import StateProvider, refresh_states
+
+
+@pytest.fixture
+def small_function_pool():
+    executor.configure_function_executors(max_threads=2)
+    yield
+    executor.configure_function_executors(max_threads=32)
+
+
+def test_hung_functions_do_not_delay_state_providers(small_function_pool):
+    release = threading.Event()
+    hung = Function(
+        fn_name="hang",
+        fn_description="Never returns on its own",
+        args=[],
+        executable=lambda **_: (release.wait(), (FunctionResultStatus.DONE, "ok", {}))[1],
+        timeout=0.1,
+    )
+    try:
+        # both threads of the function pool stay busy after the calls time out
+        for _ in range(2):
+            result = hung.execute(fn_id="1", args={})
+            assert result.action_status == FunctionResultStatus.FAILED
+
+        started = time.monotonic()
+        refresh = refresh_states(
+            {"wallet": StateProvider(lambda function_result, state: "0xabc", timeout=2)},
+            None,
+            {},
+        )
+        assert refresh.state == {"wallet": "0xabc"}
+        assert refresh.timed_out == []
+        assert time.monotonic() - started < 1
+    finally:
+        release.set()
+
+
+def test_dependent_provider_sees_fresh_value():
+    refresh = refresh_states(
+        {
+            "jobs": StateProvider(lambda function_result, state: [1, 2, 3]),
+            "count": StateProvider(lambda function_result, state: len(state["jobs"]), depends_on=["jobs"]),
+        },
+        None,
+        {"jobs": [], "count": 0},
+    )
+    assert refresh.state == {"jobs": [1, 2, 3], "count": 3}
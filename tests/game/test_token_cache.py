@@ -0,0 +1,155 @@
+import base64
+import json
+import threading
+import time
+
+import pytest
+
+from game_sdk.game.token_cache import AccessTokenCache
+
+
+def jwt(exp: float) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+def counting_fetch(make_token=lambda n: f"token-{n}"):
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return make_token(len(calls))
+    return fetch, calls
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def test_tokens_are_reused_per_api_key():
+    cache = AccessTokenCache()
+    fetch, calls = counting_fetch()
+    assert cache.get("key-a", fetch) == "token-1"
+    assert cache.get("key-a", fetch) == "token-1"
+    assert cache.get("key-b", fetch) == "token-2"
+    assert len(calls) == 2
+
+
+def test_concurrent_misses_fetch_once():
+    cache = AccessTokenCache()
+    release = threading.Event()
+    calls = []
+
+    def slow_fetch():
+        calls.append(1)
+        release.wait(5)
+        return "token"
+
+    tokens = []
+    threads = [threading.Thread(target=lambda: tokens.append(cache.get("key", slow_fetch))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    wait_for(lambda: calls)
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert tokens == ["token"] * 8
+    assert len(calls) == 1
+
+
+def test_failed_fetch_is_not_cached():
+    cache = AccessTokenCache()
+
+    def failing():
+        raise ValueError("down")
+
+    with pytest.raises(ValueError):
+        cache.get("key", failing)
+    assert cache.get("key", lambda: "token") == "token"
+
+
+def enter_refresh_window(cache, api_key):
+    cache._entries[api_key].refresh_at = time.time()
+
+
+def test_token_in_refresh_window_is_served_while_refreshing():
+    cache = AccessTokenCache()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        if len(calls) > 1:
+            release.wait(5)
+        return f"token-{len(calls)}"
+
+    assert cache.get("key", fetch) == "token-1"
+    enter_refresh_window(cache, "key")
+    assert cache.get("key", fetch) == "token-1"
+    wait_for(lambda: len(calls) == 2)
+    assert cache.get("key", fetch) == "token-1"
+    release.set()
+    wait_for(lambda: cache.get("key", fetch) == "token-2")
+    assert len(calls) == 2
+
+
+def test_failed_background_refresh_keeps_the_token():
+    cache = AccessTokenCache()
+    refreshed = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        if len(calls) > 1:
+            refreshed.set()
+            raise ValueError("down")
+        return "token"
+
+    cache.get("key", fetch)
+    enter_refresh_window(cache, "key")
+    assert cache.get("key", fetch) == "token"
+    wait_for(refreshed.is_set)
+    wait_for(lambda: not cache._entries["key"].refreshing)
+    # retried a few seconds later rather than on every call
+    assert cache.get("key", fetch) == "token"
+    assert len(calls) == 2
+
+
+def test_expired_token_is_fetched_again():
+    cache = AccessTokenCache()
+    fetch, calls = counting_fetch(lambda n: jwt(time.time() - 1) if n == 1 else "fresh")
+    cache.get("key", fetch)
+    assert cache.get("key", fetch) == "fresh"
+    assert len(calls) == 2
+
+
+def test_invalidate_keeps_a_newer_token():
+    cache = AccessTokenCache()
+    fetch, _ = counting_fetch()
+    cache.get("key", fetch)
+    cache.invalidate("key", "token-1")
+    assert cache.get("key", fetch) == "token-2"
+    cache.invalidate("key", "token-1")
+    assert cache.get("key", fetch) == "token-2"
+
+
+def test_tokens_without_exp_use_the_default_ttl():
+    cache = AccessTokenCache(default_ttl=0.05, refresh_margin=0)
+    fetch, calls = counting_fetch()
+    assert cache.get("key", fetch) == "token-1"
+    time.sleep(0.06)
+    assert cache.get("key", fetch) == "token-2"
+
+
+def test_refresh_starts_before_the_exp_claim():
+    cache = AccessTokenCache(refresh_margin=60)
+    token = jwt(time.time() + 3600)
+    cache.get("key", lambda: token)
+    entry = cache._entries["key"]
+    assert entry.expires_at == pytest.approx(time.time() + 3600, abs=5)
+    assert entry.refresh_at == pytest.approx(entry.expires_at - 60)
@@ -0,0 +1,137 @@
+import asyncio
+import threading
+import time
+
+from game_sdk.game.custom_types import FunctionResultStatus
+from game_sdk.game.worker_pool import WorkerPool, WorkerTaskStatus
+
+
+def test_cancel_before_run_stops_that_run_only(server, make_worker):
+    pool = WorkerPool(make_worker(), max_concurrency=2)
+    pool.cancel()
+    assert list(pool.run(["a", "b"])) == []
+    assert not pool.cancelled
+
+    results = list(pool.run(["a", "b"]))
+    assert [result.status for _, result in results] == [WorkerTaskStatus.DONE] * 2
+
+
+def test_arun_does_not_block_the_event_loop(server, make_worker):
+    worker = make_worker(defer_registration=True)
+    create_agent = worker.client.create_agent
+    loop_threads = []
+
+    def slow_create_agent(*args, **kwargs):
+        loop_threads.append(threading.current_thread())
+        time.sleep(0.2)
+        return create_agent(*args, **kwargs)
+
+    worker.client.create_agent = slow_create_agent
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticking = asyncio.ensure_future(ticker())
+        results = [result async for _, result in WorkerPool(worker, max_concurrency=3).arun(["a", "b", "c"])]
+        ticking.cancel()
+        return results, ticks, threading.current_thread()
+
+    results, ticks, loop_thread = asyncio.run(main())
+    assert [result.status for result in results] == [WorkerTaskStatus.DONE] * 3
+    assert len(loop_threads) == 1 and loop_threads[0] is not loop_thread
+    assert ticks >= 10
+
+
+def test_leaving_arun_waits_for_cancelled_tasks(server, make_worker, make_function):
+    server.wait_probability = 0.0
+    started, unwound = [], []
+
+    async def hang(**_):
+        started.append(1)
+        try:
+            await asyncio.sleep(30)
+        finally:
+            await asyncio.sleep(0.01)
+            unwound.append(1)
+
+    worker = make_worker(action_space=[make_function("hang", hang)])
+
+    async def main():
+        results = WorkerPool(worker, max_concurrency=2).arun(["a", "b"])
+        first = asyncio.ensure_future(results.__anext__())
+        while len(started) < 2:
+            await asyncio.sleep(0.01)
+        first.cancel()
+        try:
+            await first
+        except asyncio.CancelledError:
+            pass
+        return len(unwound)
+
+    assert asyncio.run(main()) == 2
+
+
+def test_arun_times_out_a_task_inside_a_step(server, make_worker, make_function):
+    server.wait_probability = 0.0
+
+    async def hang(**_):
+        await asyncio.sleep(30)
+
+    worker = make_worker(action_space=[make_function("hang", hang)])
+
+    async def main():
+        return [result async for _, result in WorkerPool(worker, task_timeout=0.2).arun(["a"])]
+
+    started = time.monotonic()
+    [result] = asyncio.run(main())
+    assert result.status == WorkerTaskStatus.TIMED_OUT
+    assert time.monotonic() - started < 5
+
+
+def test_run_times_out_between_steps(server, make_worker, make_function):
+    server.wait_probability = 0.0
+
+    def slow(**_):
+        time.sleep(0.05)
+        return FunctionResultStatus.DONE, "ok", {}
+
+    worker = make_worker(action_space=[make_function("slow", slow)])
+
+    [(_, result)] = list(WorkerPool(worker, task_timeout=0.2).run(["a"]))
+    assert result.status == WorkerTaskStatus.TIMED_OUT
+    assert 0.2 <= result.duration < 2
+    assert result.function_results
+
+
+def test_cancel_during_run_ends_running_tasks(server, make_worker, make_function):
+    server.wait_probability = 0.0
+    started = threading.Event()
+
+    def slow(**_):
+        started.set()
+        time.sleep(0.05)
+        return FunctionResultStatus.DONE, "ok", {}
+
+    pool = WorkerPool(make_worker(action_space=[make_function("slow", slow)]), max_concurrency=2)
+    threading.Thread(target=lambda: (started.wait(5), pool.cancel())).start()
+
+    results = list(pool.run(["a", "b", "c", "d"]))
+    assert len(results) == 2
+    assert all(result.status == WorkerTaskStatus.CANCELLED for _, result in results)
+    assert not pool.cancelled
+
+
+def test_failed_step_fails_only_its_task(server, make_worker):
+    server.wait_probability = 0.0
+    # the initial state (built without a function call) succeeds
+    worker = make_worker(get_state_fn=lambda function_result, current_state: 1 / 0 if function_result.action_id else {})
+
+    results = dict(WorkerPool(worker).run(["a", "b"]))
+    assert {result.status for result in results.values()} == {WorkerTaskStatus.FAILED}
+    assert all(isinstance(result.error, ZeroDivisionError) for result in results.values())